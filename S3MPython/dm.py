@@ -31,7 +31,7 @@ from cuid import cuid
 
 from .settings import DM_LIB, get_acs, ACSFILE
 from .utils import fetch_acs, reg_ns
-from .xdt import XdStringType, XdLinkType
+from .xdt import XdStringType, XdLinkType, _INDENTS
 from .struct import ClusterType
 from .meta import ParticipationType, PartyType, AuditType, AttestationType
 from .errors import ValidationError, PublicationError, ModelingError
@@ -526,7 +526,7 @@ class DMType(object):
         msg = ''
         msg += "Published\n" if self._published else "Not Published\n"
         valid = False if self.label is None else valid
-        valid = False if self._published and self.data == None else valid    
+        valid = False if self._published and self.data is None else valid    
         
         # TODO: improve validation
         return((valid, msg))
@@ -538,67 +538,66 @@ class DMType(object):
         if self._published:
             raise PublicationError(f"{self.label} -  {self.metadata['identifier']} -- This Data Model has already been published.")
         indent = 0
-        padding = ('').rjust(indent)
         xdstr = ''
         xdstr += self._header()
         xdstr += self._metaxsd()
 
-        xdstr += padding.rjust(indent) + '<xs:element name="dm-' + self.mcuid + '" substitutionGroup="s3m:DM" type="s3m:mc-' + self.mcuid + '"/>\n'
-        xdstr += padding.rjust(indent) + '<xs:complexType name="mc-' + self.mcuid + '">\n'
-        xdstr += padding.rjust(indent + 2) + '<xs:annotation>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:documentation>\n'
-        xdstr += padding.rjust(indent + 6) + escape(self.metadata['description'].strip()) + '\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:documentation>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:appinfo>\n'
+        xdstr += _INDENTS[indent] + '<xs:element name="dm-' + self.mcuid + '" substitutionGroup="s3m:DM" type="s3m:mc-' + self.mcuid + '"/>\n'
+        xdstr += _INDENTS[indent] + '<xs:complexType name="mc-' + self.mcuid + '">\n'
+        xdstr += _INDENTS[indent + 2] + '<xs:annotation>\n'
+        xdstr += _INDENTS[indent + 4] + '<xs:documentation>\n'
+        xdstr += _INDENTS[indent + 6] + escape(self.metadata['description'].strip()) + '\n'
+        xdstr += _INDENTS[indent + 4] + '</xs:documentation>\n'
+        xdstr += _INDENTS[indent + 4] + '<xs:appinfo>\n'
 
         # add RDF
-        xdstr += padding.rjust(indent + 6) + '<rdfs:Class rdf:about="mc-' + self.mcuid + '">\n'
-        xdstr += padding.rjust(indent + 8) + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#DMType"/>\n'
-        xdstr += padding.rjust(indent + 8) + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model/RMC"/>\n'
+        xdstr += _INDENTS[indent + 6] + '<rdfs:Class rdf:about="mc-' + self.mcuid + '">\n'
+        xdstr += _INDENTS[indent + 8] + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#DMType"/>\n'
+        xdstr += _INDENTS[indent + 8] + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model/RMC"/>\n'
         if len(self.pred_obj_list) != 0:
             for po in self.pred_obj_list:
-                xdstr += padding.rjust(indent + 2) + ("<" + po.predicate.ns_abbrev.__str__() + ":" + po.predicate.class_name.strip() + " rdf:resource='" + quote(po.object_uri) + "'/>\n")
-        xdstr += padding.rjust(indent + 6) + '</rdfs:Class>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:appinfo>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:annotation>\n'
-        xdstr += padding.rjust(indent + 2) + '<xs:complexContent>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:restriction base="s3m:DMType">\n'
-        xdstr += padding.rjust(indent + 6) + '<xs:sequence>\n'
-        xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" name="label" type="xs:string" fixed="' + self.label.strip() + '"/>\n'
-        xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" name="dm-language" type="xs:language" default="en-US"/>\n'
-        xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" name="dm-encoding" type="xs:string" default="utf-8"/>\n'
-        xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="0" name="current-state" type="xs:string" default=""/>\n'
+                xdstr += _INDENTS[indent + 2] + ("<" + po.predicate.ns_abbrev.__str__() + ":" + po.predicate.class_name.strip() + " rdf:resource='" + quote(po.object_uri) + "'/>\n")
+        xdstr += _INDENTS[indent + 6] + '</rdfs:Class>\n'
+        xdstr += _INDENTS[indent + 4] + '</xs:appinfo>\n'
+        xdstr += _INDENTS[indent + 2] + '</xs:annotation>\n'
+        xdstr += _INDENTS[indent + 2] + '<xs:complexContent>\n'
+        xdstr += _INDENTS[indent + 4] + '<xs:restriction base="s3m:DMType">\n'
+        xdstr += _INDENTS[indent + 6] + '<xs:sequence>\n'
+        xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" name="label" type="xs:string" fixed="' + self.label.strip() + '"/>\n'
+        xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" name="dm-language" type="xs:language" default="en-US"/>\n'
+        xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" name="dm-encoding" type="xs:string" default="utf-8"/>\n'
+        xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="0" name="current-state" type="xs:string" default=""/>\n'
         if self.data is None:
             raise ModelingError("You must have a data cluster assigned.")
         else:
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + self.data.mcuid + '"/>\n'
+            xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + self.data.mcuid + '"/>\n'
         if self.subject is not None:
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="0" name="subject" type="s3m:mc-"' + self.subject.mcuid + '/>\n'
+            xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="0" name="subject" type="s3m:mc-"' + self.subject.mcuid + '/>\n'
         if self.provider is not None:
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="0" name="provider" type="s3m:mc-"' + self.provider.mcuid + '/>\n'
+            xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="0" name="provider" type="s3m:mc-"' + self.provider.mcuid + '/>\n'
         if len(self.participations) > 0:
             for part in self.participations:
-                xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + part.mcuid + '"/>\n'
+                xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + part.mcuid + '"/>\n'
         if self.protocol is not None:
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="0" name="protocol" type="s3m:mc-"' + self.protocol.mcuid + '/>\n'
+            xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="0" name="protocol" type="s3m:mc-"' + self.protocol.mcuid + '/>\n'
         if self.workflow is not None:
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="0" name="workflow" type="s3m:mc-"' + self.workflow.mcuid + '/>\n'
+            xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="0" name="workflow" type="s3m:mc-"' + self.workflow.mcuid + '/>\n'
         if self.acs is not None:
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="0" name="acs" type="s3m:mc-"' + self.acs.mcuid + '/>\n'
+            xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="0" name="acs" type="s3m:mc-"' + self.acs.mcuid + '/>\n'
         if len(self.audits) > 0:
             for audit in self.audits:
-                xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + audit.mcuid + '"/>\n'
+                xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + audit.mcuid + '"/>\n'
         if self.attestation is not None:
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="0" name="attestation" type="s3m:mc-"' + self.attestation.mcuid + '/>\n'
+            xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="0" name="attestation" type="s3m:mc-"' + self.attestation.mcuid + '/>\n'
         if len(self.links) > 0:
             for link in self.links:
-                xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + link.mcuid + '"/>\n'
+                xdstr += _INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" ref="s3m:ms-' + link.mcuid + '"/>\n'
 
 
-        xdstr += padding.rjust(indent + 6) + '</xs:sequence>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:restriction>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:complexContent>\n'
-        xdstr += padding.rjust(indent) + '</xs:complexType>\n\n'
+        xdstr += _INDENTS[indent + 6] + '</xs:sequence>\n'
+        xdstr += _INDENTS[indent + 4] + '</xs:restriction>\n'
+        xdstr += _INDENTS[indent + 2] + '</xs:complexContent>\n'
+        xdstr += _INDENTS[indent] + '</xs:complexType>\n\n'
         # get the available models
         xdstr += self.data.getModel()
         if self.subject is not None:
@@ -696,7 +695,6 @@ class DMType(object):
             pass
 
         indent = 2
-        padding = ('').rjust(indent)
 
         xmlstr = ''
         xmlstr += f"""<?xml version="1.0" encoding="UTF-8"?>
@@ -713,13 +711,13 @@ class DMType(object):
  xsi:schemaLocation='https://www.s3model.com/dmlib file: {DM_LIB}{os.sep}dm-{self.mcuid}.xsd'>
 
         """
-        xmlstr += padding + f"<s3m:dm-{self.mcuid}>\n"
-        xmlstr += padding + f"  <label>{escape(self.label)}</label>\n"
-        xmlstr += padding + f"  <dm-language>{escape(self.language)}</dm-language>\n"
-        xmlstr += padding + f"  <dm-encoding>{escape(self.encoding)}</dm-encoding>\n"
-        xmlstr += padding + f"  <current-state>{escape(self.state)}</current-state>\n"
+        xmlstr += _INDENTS[indent] + f"<s3m:dm-{self.mcuid}>\n"
+        xmlstr += _INDENTS[indent] + f"  <label>{escape(self.label)}</label>\n"
+        xmlstr += _INDENTS[indent] + f"  <dm-language>{escape(self.language)}</dm-language>\n"
+        xmlstr += _INDENTS[indent] + f"  <dm-encoding>{escape(self.encoding)}</dm-encoding>\n"
+        xmlstr += _INDENTS[indent] + f"  <current-state>{escape(self.state)}</current-state>\n"
         # TODO: get the XML for all the other components
-        xmlstr += padding + f"</s3m:dm-{self.mcuid}>\n"
+        xmlstr += _INDENTS[indent] + f"</s3m:dm-{self.mcuid}>\n"
         return(xmlstr)
 
     def exportJSON(self, example):
@@ -28,7 +28,7 @@ import xmltodict
 from cuid import cuid
 from validator_collection import checkers
 
-from .xdt import XdStringType, XdLinkType, XdFileType
+from .xdt import XdStringType, XdLinkType, XdFileType, _INDENTS, _memo_model
 from .struct import ClusterType
 from .errors import ValidationError
 from .utils import valid_cardinality
@@ -52,6 +52,7 @@ class MetaCommon(ABC):
         self._pred_obj_list = []
         self._definition_url = ''
         self._cardinality = {}
+        self._model_str = None  # own getModel() text, cached once published
 
         if checkers.is_string(label, 2):
             if len(label) > 1:
@@ -149,6 +150,7 @@ class MetaCommon(ABC):
         if self.published:
             if isinstance(v, str):
                 self._language = v
+                self._model_str = None  # the language is part of the schema
             else:
                 raise TypeError("the value must be a string.")
         else:
@@ -331,6 +333,7 @@ class PartyType(MetaCommon):
         else:
             return(True)
 
+    @_memo_model
     def getModel(self):
         """
         """
@@ -341,51 +344,48 @@ class PartyType(MetaCommon):
             raise ValidationError(self.__class__.__name__ + ' : ' + self.label + ', ID: ' + self.mcuid + " is not valid.")
 
         indent = 2
-        padding = ('').rjust(indent)
         party_str = ''
         # Create the datatype
-        party_str += '\n\n' + padding.rjust(indent) + (f"<xs:complexType name='mc-{self.mcuid}'> \n")
-        party_str += padding.rjust(indent + 2) + ("<xs:annotation>\n")
-        party_str += padding.rjust(indent + 2) + ("<xs:documentation>\n")
-        party_str += padding.rjust(indent + 4) + (escape(self.docs) + "\n")
-        party_str += padding.rjust(indent + 2) + ("</xs:documentation>\n")
+        party_str += '\n\n' + _INDENTS[indent] + (f"<xs:complexType name='mc-{self.mcuid}'> \n")
+        party_str += _INDENTS[indent + 2] + ("<xs:annotation>\n")
+        party_str += _INDENTS[indent + 2] + ("<xs:documentation>\n")
+        party_str += _INDENTS[indent + 4] + (escape(self.docs) + "\n")
+        party_str += _INDENTS[indent + 2] + ("</xs:documentation>\n")
         # Write the semantic links. There must be the same number of attributes
         # and links or none will be written.
-        party_str += padding.rjust(indent + 2) + ('<xs:appinfo>\n')
-        party_str += padding.rjust(indent + 2) + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
-        party_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#PartyType'/>\n")
-        party_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
-        party_str += padding.rjust(indent + 2) + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
+        party_str += _INDENTS[indent + 2] + ('<xs:appinfo>\n')
+        party_str += _INDENTS[indent + 2] + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
+        party_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#PartyType'/>\n")
+        party_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
+        party_str += _INDENTS[indent + 2] + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
         if len(self.pred_obj_list) != 0:
             for po in self.pred_obj_list:
-                party_str += padding.rjust(indent + 2) + (f"<{po.predicate.ns_abbrev.__str__()} : {po.predicate.class_name.strip()} rdf:resource='{quote(po.object_uri)}'/>\n")
-        party_str += padding.rjust(indent + 2) + ("</rdfs:Class>\n")
-        party_str += padding.rjust(indent + 2) + ('</xs:appinfo>\n')
-        party_str += padding.rjust(indent + 2) + ("</xs:annotation>\n")
-        party_str += padding.rjust(indent + 2) + ("<xs:complexContent>\n")
-        party_str += padding.rjust(indent + 4) + ("<xs:restriction base='s3m:PartyType'>\n")
-        party_str += padding.rjust(indent + 6) + ("<xs:sequence>\n")
-        party_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
+                party_str += _INDENTS[indent + 2] + (f"<{po.predicate.ns_abbrev.__str__()} : {po.predicate.class_name.strip()} rdf:resource='{quote(po.object_uri)}'/>\n")
+        party_str += _INDENTS[indent + 2] + ("</rdfs:Class>\n")
+        party_str += _INDENTS[indent + 2] + ('</xs:appinfo>\n')
+        party_str += _INDENTS[indent + 2] + ("</xs:annotation>\n")
+        party_str += _INDENTS[indent + 2] + ("<xs:complexContent>\n")
+        party_str += _INDENTS[indent + 4] + ("<xs:restriction base='s3m:PartyType'>\n")
+        party_str += _INDENTS[indent + 6] + ("<xs:sequence>\n")
+        party_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
 
-        party_str += padding.rjust(indent + 8) + ("<xs:element maxOccurs='1' minOccurs='0' name='party-name' type='xs:string'/>\n")
+        party_str += _INDENTS[indent + 8] + ("<xs:element maxOccurs='1' minOccurs='0' name='party-name' type='xs:string'/>\n")
 
         if self.party_ref:
-            party_str += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='0' name='party-ref' type='s3m:mc-{self.party_ref.mcuid}'/>\n"
+            party_str += _INDENTS[indent + 8] + f"<xs:element maxOccurs='1' minOccurs='0' name='party-ref' type='s3m:mc-{self.party_ref.mcuid}'/>\n"
 
         if self.party_details:
-            party_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='0' name='party-details' type='s3m:mc-{self.party_details.mcuid}'/>\n")
-
-        party_str += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        party_str += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        party_str += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        party_str += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        if self.party_ref:
-            party_str += self.party_ref.getModel()
-        if self.party_details:
-            party_str += self.party_details.getModel()
+            party_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='0' name='party-details' type='s3m:mc-{self.party_details.mcuid}'/>\n")
 
+        party_str += _INDENTS[indent + 8] + ("</xs:sequence>\n")
+        party_str += _INDENTS[indent + 6] + ("</xs:restriction>\n")
+        party_str += _INDENTS[indent + 4] + ("</xs:complexContent>\n")
+        party_str += _INDENTS[indent + 2] + ("</xs:complexType>\n\n")
         return(party_str)
 
+    def _nested_models(self):
+        return(tuple(m for m in (self.party_ref, self.party_details) if m))
+
     def getXMLInstance(self, example):
         """
         Return a XML instance for the Party.
@@ -396,30 +396,29 @@ class PartyType(MetaCommon):
             self.party_name = "A. Sample Name"
 
         indent = 2
-        padding = ('').rjust(indent)
 
         xmlstr = ''
-        xmlstr += padding + f"<s3m:ms-{self.mcuid}>\n"
-        xmlstr += padding + f"  <label>{escape(self.label)}</label>\n"
+        xmlstr += _INDENTS[indent] + f"<s3m:ms-{self.mcuid}>\n"
+        xmlstr += _INDENTS[indent] + f"  <label>{escape(self.label)}</label>\n"
         if self.party_name is not None:
-            xmlstr += padding + f"  <party-name>{escape(self.party_name)}</party-name>\n"
+            xmlstr += _INDENTS[indent] + f"  <party-name>{escape(self.party_name)}</party-name>\n"
         if self.party_ref is not None:
-            xmlstr += padding + "  <party-ref>\n"
-            xmlstr += padding + f'    <label>{self.party_ref.label}</label>\n'
-            xmlstr += padding + f'    <link>{self.party_ref.link}</link>\n'
-            xmlstr += padding + f'    <relation>{self.party_ref.relation}</relation>\n'
-            xmlstr += padding + f'    <relation-uri>{self.party_ref.relation_uri}</relation-uri>\n'
-            xmlstr += padding + "  </party-ref>\n"
+            xmlstr += _INDENTS[indent] + "  <party-ref>\n"
+            xmlstr += _INDENTS[indent] + f'    <label>{self.party_ref.label}</label>\n'
+            xmlstr += _INDENTS[indent] + f'    <link>{self.party_ref.link}</link>\n'
+            xmlstr += _INDENTS[indent] + f'    <relation>{self.party_ref.relation}</relation>\n'
+            xmlstr += _INDENTS[indent] + f'    <relation-uri>{self.party_ref.relation_uri}</relation-uri>\n'
+            xmlstr += _INDENTS[indent] + "  </party-ref>\n"
     
         if self.party_details is not None:
-            xmlstr += padding + "  <party-details>\n"
-            xmlstr += padding + f"    <label>{escape(self.party_details.label.strip())}</label>\n"
+            xmlstr += _INDENTS[indent] + "  <party-details>\n"
+            xmlstr += _INDENTS[indent] + f"    <label>{escape(self.party_details.label.strip())}</label>\n"
             for adapter in self.party_details.items:
                 xmlstr += adapter.value.getXMLInstance(example)
 
-            xmlstr += padding + "  </party-details>\n"
+            xmlstr += _INDENTS[indent] + "  </party-details>\n"
         
-        xmlstr += padding + f"</s3m:ms-{self.mcuid}>\n"
+        xmlstr += _INDENTS[indent] + f"</s3m:ms-{self.mcuid}>\n"
         return(xmlstr)
 
     def getJSONInstance(self, example):
@@ -528,6 +527,7 @@ class AuditType(MetaCommon):
         else:
             return(True)
 
+    @_memo_model
     def getModel(self):
         """
         Return a XML Schema stub for the Audit.
@@ -539,61 +539,60 @@ class AuditType(MetaCommon):
             raise ValidationError(self.__class__.__name__ + ' : ' + self.label + ', ID: ' + self.mcuid + " is not valid.")
 
         indent = 2
-        padding = ('').rjust(indent)
         aud_str = ''
 
         # Create the datatype
-        aud_str += '\n\n' + padding.rjust(indent) + (f"<xs:complexType name='mc-{self.mcuid}' xml:lang='{self.language}'>\n")
-        aud_str += padding.rjust(indent + 2) + ("<xs:annotation>\n")
-        aud_str += padding.rjust(indent + 2) + ("<xs:documentation>\n")
-        aud_str += padding.rjust(indent + 4) + (escape(self.docs) + "\n")
-        aud_str += padding.rjust(indent + 2) + ("</xs:documentation>\n")
+        aud_str += '\n\n' + _INDENTS[indent] + (f"<xs:complexType name='mc-{self.mcuid}' xml:lang='{self.language}'>\n")
+        aud_str += _INDENTS[indent + 2] + ("<xs:annotation>\n")
+        aud_str += _INDENTS[indent + 2] + ("<xs:documentation>\n")
+        aud_str += _INDENTS[indent + 4] + (escape(self.docs) + "\n")
+        aud_str += _INDENTS[indent + 2] + ("</xs:documentation>\n")
         # Write the semantic links. There must be the same number of attributes
         # and links or none will be written.
-        aud_str += padding.rjust(indent + 2) + ('<xs:appinfo>\n')
-        aud_str += padding.rjust(indent + 2) + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
-        aud_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd##AuditType'/>\n")
-        aud_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
-        aud_str += padding.rjust(indent + 2) + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
+        aud_str += _INDENTS[indent + 2] + ('<xs:appinfo>\n')
+        aud_str += _INDENTS[indent + 2] + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
+        aud_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd##AuditType'/>\n")
+        aud_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
+        aud_str += _INDENTS[indent + 2] + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
         if len(self.pred_obj_list) != 0:
             for po in self.pred_obj_list:
                 pred = po[0]
                 obj = po[1]
-                xdstr += padding.rjust(indent + 8) + f'<{pred.strip()} rdf:resource="{quote(obj.strip())}"/>\n'
-        aud_str += padding.rjust(indent + 2) + ("</rdfs:Class>\n")
-        aud_str += padding.rjust(indent + 2) + ('</xs:appinfo>\n')
-        aud_str += padding.rjust(indent + 2) + ("</xs:annotation>\n")
-        aud_str += padding.rjust(indent + 2) + ("<xs:complexContent>\n")
-        aud_str += padding.rjust(indent + 4) + ("<xs:restriction base='s3m:AuditType'>\n")
-        aud_str += padding.rjust(indent + 6) + ("<xs:sequence>\n")
-        aud_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
+                xdstr += _INDENTS[indent + 8] + f'<{pred.strip()} rdf:resource="{quote(obj.strip())}"/>\n'
+        aud_str += _INDENTS[indent + 2] + ("</rdfs:Class>\n")
+        aud_str += _INDENTS[indent + 2] + ('</xs:appinfo>\n')
+        aud_str += _INDENTS[indent + 2] + ("</xs:annotation>\n")
+        aud_str += _INDENTS[indent + 2] + ("<xs:complexContent>\n")
+        aud_str += _INDENTS[indent + 4] + ("<xs:restriction base='s3m:AuditType'>\n")
+        aud_str += _INDENTS[indent + 6] + ("<xs:sequence>\n")
+        aud_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
 
         if self.system_id is None:
             raise ValueError("System ID: (XdString) is missing.")
         else:
-            aud_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='system-id' type='s3m:mc-{str(self.system_id.mcuid)}'/>\n")
+            aud_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='1' name='system-id' type='s3m:mc-{str(self.system_id.mcuid)}'/>\n")
 
         if self.system_user is None:
             raise ValueError(f"System User: (Party) {self.system_user.__str__().strip()} is missing.")
         else:
-            aud_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='0' name='system-user' type='s3m:mc-{str(self.system_user.mcuid)}'/>\n")
+            aud_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='0' name='system-user' type='s3m:mc-{str(self.system_user.mcuid)}'/>\n")
 
         if self.location is None:
             raise ValueError("Location: (Cluster) " + self.location.__str__().strip() + " is missing.")
         else:
-            aud_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='0' name='location' type='s3m:mc-{str(self.location.mcuid)}'/>\n")
+            aud_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='0' name='location' type='s3m:mc-{str(self.location.mcuid)}'/>\n")
 
-        aud_str += padding.rjust(indent + 8) + ("<xs:element maxOccurs='1' minOccurs='1' name='timestamp' type='xs:dateTime'/>\n")
+        aud_str += _INDENTS[indent + 8] + ("<xs:element maxOccurs='1' minOccurs='1' name='timestamp' type='xs:dateTime'/>\n")
 
-        aud_str += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        aud_str += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        aud_str += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        aud_str += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        aud_str += self.system_id.getModel()
-        aud_str += self.system_user.getModel()
-        aud_str += self.location.getModel()
+        aud_str += _INDENTS[indent + 8] + ("</xs:sequence>\n")
+        aud_str += _INDENTS[indent + 6] + ("</xs:restriction>\n")
+        aud_str += _INDENTS[indent + 4] + ("</xs:complexContent>\n")
+        aud_str += _INDENTS[indent + 2] + ("</xs:complexType>\n\n")
         return(aud_str)
 
+    def _nested_models(self):
+        return((self.system_id, self.system_user, self.location))
+
     def getXMLInstance(self, example):
         """
         Return a XML instance for the Audit.
@@ -604,28 +603,27 @@ class AuditType(MetaCommon):
             self.timestamp = datetime.now()
 
         indent = 2
-        padding = ('').rjust(indent)
  
         xmlstr = ''
-        xmlstr = padding + f"<s3m:ms-{str(self.mcuid)}>\n"
-        xmlstr += padding + f"  <label>{escape(self.label.strip())}</label>\n"
+        xmlstr = _INDENTS[indent] + f"<s3m:ms-{str(self.mcuid)}>\n"
+        xmlstr += _INDENTS[indent] + f"  <label>{escape(self.label.strip())}</label>\n"
         if self.system_id is not None:
-            xmlstr += padding + "  <system-id>\n"
-            xmlstr += padding + self.system_id.getXMLInstance(example)
-            xmlstr += padding + "  </system-id>\n"
+            xmlstr += _INDENTS[indent] + "  <system-id>\n"
+            xmlstr += _INDENTS[indent] + self.system_id.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "  </system-id>\n"
     
         if self.system_user is not None:
-            xmlstr += padding + "  <system-user>\n"
-            xmlstr += padding + self.system_user.getXMLInstance(example)
-            xmlstr += padding + "  </system-user>\n"
+            xmlstr += _INDENTS[indent] + "  <system-user>\n"
+            xmlstr += _INDENTS[indent] + self.system_user.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "  </system-user>\n"
     
         if self.location is not None:
-            xmlstr += padding + "  <location>\n"
-            xmlstr += padding + self.location.getXMLInstance(example)
-            xmlstr += padding + "  </location>\n"
+            xmlstr += _INDENTS[indent] + "  <location>\n"
+            xmlstr += _INDENTS[indent] + self.location.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "  </location>\n"
         if self.timestamp is not None:
-            xmlstr += padding + f"  <timestamp>{self.timestamp.isoformat()}</timestamp>\n"
-        xmlstr += padding + f"</s3m:ms-{str(self.mcuid)}>\n"
+            xmlstr += _INDENTS[indent] + f"  <timestamp>{self.timestamp.isoformat()}</timestamp>\n"
+        xmlstr += _INDENTS[indent] + f"</s3m:ms-{str(self.mcuid)}>\n"
         
         return(xmlstr)
 
@@ -779,6 +777,7 @@ class AttestationType(MetaCommon):
         else:
             return(True)
 
+    @_memo_model
     def getModel(self):
         """
         Return a XML Schema stub for the Attestation.
@@ -790,62 +789,55 @@ class AttestationType(MetaCommon):
             raise ValidationError(self.__class__.__name__ + ' : ' + self.label + ', ID: ' + self.mcuid + " is not valid.")
 
         indent = 2
-        padding = ('').rjust(indent)
         att_str = ''
 
         # Create the datatype
-        att_str += '\n\n' + padding.rjust(indent) + (f"<xs:complexType name='mc-{self.mcuid}' xml:lang='{self.language}'>\n")
-        att_str += padding.rjust(indent + 2) + ("<xs:annotation>\n")
-        att_str += padding.rjust(indent + 2) + ("<xs:documentation>\n")
-        att_str += padding.rjust(indent + 4) + (escape(self.docs) + "\n")
-        att_str += padding.rjust(indent + 2) + ("</xs:documentation>\n")
+        att_str += '\n\n' + _INDENTS[indent] + (f"<xs:complexType name='mc-{self.mcuid}' xml:lang='{self.language}'>\n")
+        att_str += _INDENTS[indent + 2] + ("<xs:annotation>\n")
+        att_str += _INDENTS[indent + 2] + ("<xs:documentation>\n")
+        att_str += _INDENTS[indent + 4] + (escape(self.docs) + "\n")
+        att_str += _INDENTS[indent + 2] + ("</xs:documentation>\n")
         # Write the semantic links. There must be the same number of attributes
         # and links or none will be written.
-        att_str += padding.rjust(indent + 2) + ('<xs:appinfo>\n')
-        att_str += padding.rjust(indent + 2) + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
-        att_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#AttestationType'/>\n")
-        att_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
-        att_str += padding.rjust(indent + 2) + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
+        att_str += _INDENTS[indent + 2] + ('<xs:appinfo>\n')
+        att_str += _INDENTS[indent + 2] + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
+        att_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#AttestationType'/>\n")
+        att_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
+        att_str += _INDENTS[indent + 2] + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
         if len(self.pred_obj_list) != 0:
             for po in self.pred_obj_list:
-                att_str += padding.rjust(indent + 2) + (f"<{po.predicate.ns_abbrev.__str__()} : {po.predicate.class_name.strip()} rdf:resource='{quote(po.object_uri)}'/>\n")
-        att_str += padding.rjust(indent + 2) + ("</rdfs:Class>\n")
-        att_str += padding.rjust(indent + 2) + ('</xs:appinfo>\n')
-        att_str += padding.rjust(indent + 2) + ("</xs:annotation>\n")
-        att_str += padding.rjust(indent + 2) + ("<xs:complexContent>\n")
-        att_str += padding.rjust(indent + 4) + ("<xs:restriction base='s3m:AttestationType'>\n")
-        att_str += padding.rjust(indent + 6) + ("<xs:sequence>\n")
-        att_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
+                att_str += _INDENTS[indent + 2] + (f"<{po.predicate.ns_abbrev.__str__()} : {po.predicate.class_name.strip()} rdf:resource='{quote(po.object_uri)}'/>\n")
+        att_str += _INDENTS[indent + 2] + ("</rdfs:Class>\n")
+        att_str += _INDENTS[indent + 2] + ('</xs:appinfo>\n')
+        att_str += _INDENTS[indent + 2] + ("</xs:annotation>\n")
+        att_str += _INDENTS[indent + 2] + ("<xs:complexContent>\n")
+        att_str += _INDENTS[indent + 4] + ("<xs:restriction base='s3m:AttestationType'>\n")
+        att_str += _INDENTS[indent + 6] + ("<xs:sequence>\n")
+        att_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
 
         if self.view is not None:
-            att_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['view'][0])}' name='view' type='s3m:mc-{str(self.view.mcuid)}'/> \n")
+            att_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['view'][0])}' name='view' type='s3m:mc-{str(self.view.mcuid)}'/> \n")
 
         if self.proof is not None:
-            att_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['proof'][0])}' name='proof' type='s3m:mc-{str(self.proof.mcuid)}'/> \n")
+            att_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['proof'][0])}' name='proof' type='s3m:mc-{str(self.proof.mcuid)}'/> \n")
 
         if self.reason is not None:
-            att_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['reason'][0])}' name='reason' type='s3m:mc-{str(self.reason.mcuid)}'/> \n")
+            att_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['reason'][0])}' name='reason' type='s3m:mc-{str(self.reason.mcuid)}'/> \n")
 
         if self.committer is not None:
-            att_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['committer'][0])}' name='committer' type='s3m:mc-{str(self.committer.mcuid)}'/>\n")
-
-        att_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['committed'][0])}' name='committed' type='xs:dateTime'/>\n")
-        att_str += padding.rjust(indent + 8) + ("<xs:element maxOccurs='1' minOccurs='1' default='true' name='pending' type='xs:boolean'/>\n")
-        att_str += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        att_str += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        att_str += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        att_str += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        if self.view is not None:
-            att_str += self.view.getModel()
-        if self.proof is not None:
-            att_str += self.proof.getModel()
-        if self.reason is not None:
-            att_str += self.reason.getModel()
-        if self.committer is not None:
-            att_str += self.committer.getModel()
-
+            att_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['committer'][0])}' name='committer' type='s3m:mc-{str(self.committer.mcuid)}'/>\n")
+
+        att_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['committed'][0])}' name='committed' type='xs:dateTime'/>\n")
+        att_str += _INDENTS[indent + 8] + ("<xs:element maxOccurs='1' minOccurs='1' default='true' name='pending' type='xs:boolean'/>\n")
+        att_str += _INDENTS[indent + 8] + ("</xs:sequence>\n")
+        att_str += _INDENTS[indent + 6] + ("</xs:restriction>\n")
+        att_str += _INDENTS[indent + 4] + ("</xs:complexContent>\n")
+        att_str += _INDENTS[indent + 2] + ("</xs:complexType>\n\n")
         return(att_str)
 
+    def _nested_models(self):
+        return(tuple(m for m in (self.view, self.proof, self.reason, self.committer) if m is not None))
+
     def getXMLInstance(self, example):
         """
         Return a XML instance for the Attestation.
@@ -856,30 +848,29 @@ class AttestationType(MetaCommon):
             self.committed = datetime.now()
             
         indent = 2
-        padding = ('').rjust(indent)
         xmlstr = ''
-        xmlstr += padding + f"<s3m:ms-{self.mcuid}>\n"
+        xmlstr += _INDENTS[indent] + f"<s3m:ms-{self.mcuid}>\n"
         xmlstr += f"<label>{escape(self.label.strip())}</label>\n"
         if self.view is not None:
-            xmlstr += padding + "<view>\n"
-            xmlstr += padding + self.view.getXMLInstance(example)
-            xmlstr += padding + "</view>\n"
+            xmlstr += _INDENTS[indent] + "<view>\n"
+            xmlstr += _INDENTS[indent] + self.view.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "</view>\n"
         if self.proof is not None:
-            xmlstr += padding + "<proof>\n"
-            xmlstr += padding + self.proof.getXMLInstance(example)
-            xmlstr += padding + "</proof>\n"
+            xmlstr += _INDENTS[indent] + "<proof>\n"
+            xmlstr += _INDENTS[indent] + self.proof.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "</proof>\n"
         if self.reason is not None:
-            xmlstr += padding + "<reason>\n"
-            xmlstr += padding + self.reason.getXMLInstance(example)
-            xmlstr += padding + "</reason>\n"
+            xmlstr += _INDENTS[indent] + "<reason>\n"
+            xmlstr += _INDENTS[indent] + self.reason.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "</reason>\n"
         if self.committer is not None:
-            xmlstr += padding + "<committer>\n"
-            xmlstr += padding + self.committer.getXMLInstance(example)
-            xmlstr += padding + "</committer>\n"
+            xmlstr += _INDENTS[indent] + "<committer>\n"
+            xmlstr += _INDENTS[indent] + self.committer.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "</committer>\n"
         if self.committed is not None:
-            xmlstr += padding + f"  <committed>{self.committed.isoformat()}</committed>\n"
-        xmlstr += padding + f"  <pending>{str(self.pending).lower()}</pending>\n"
-        xmlstr += padding + f"</s3m:ms-{self.mcuid}>\n"
+            xmlstr += _INDENTS[indent] + f"  <committed>{self.committed.isoformat()}</committed>\n"
+        xmlstr += _INDENTS[indent] + f"  <pending>{str(self.pending).lower()}</pending>\n"
+        xmlstr += _INDENTS[indent] + f"</s3m:ms-{self.mcuid}>\n"
 
         return(xmlstr)
 
@@ -1021,6 +1012,7 @@ class ParticipationType(MetaCommon):
         else:
             return(True)
 
+    @_memo_model
     def getModel(self):
         """
         Return a XML Schema stub for the Participation.
@@ -1032,62 +1024,56 @@ class ParticipationType(MetaCommon):
             raise ValidationError(self.__class__.__name__ + ' : ' + self.label + ', ID: ' + self.mcuid + " is not valid.")
 
         indent = 2
-        padding = ('').rjust(indent)
         ptn_str = ''
 
         # Create the datatype
-        ptn_str += '\n\n' + padding.rjust(indent) + (f"<xs:complexType name='mc-{self.mcuid}' xml:lang='{self.language}'> \n")
-        ptn_str += padding.rjust(indent + 2) + ("<xs:annotation>\n")
-        ptn_str += padding.rjust(indent + 2) + ("<xs:documentation>\n")
-        ptn_str += padding.rjust(indent + 4) + (escape(self.docs) + "\n")
-        ptn_str += padding.rjust(indent + 2) + ("</xs:documentation>\n")
+        ptn_str += '\n\n' + _INDENTS[indent] + (f"<xs:complexType name='mc-{self.mcuid}' xml:lang='{self.language}'> \n")
+        ptn_str += _INDENTS[indent + 2] + ("<xs:annotation>\n")
+        ptn_str += _INDENTS[indent + 2] + ("<xs:documentation>\n")
+        ptn_str += _INDENTS[indent + 4] + (escape(self.docs) + "\n")
+        ptn_str += _INDENTS[indent + 2] + ("</xs:documentation>\n")
         # Write the semantic links. There must be the same number of attributes
         # and links or none will be written.
-        ptn_str += padding.rjust(indent + 2) + ('<xs:appinfo>\n')
-        ptn_str += padding.rjust(indent + 2) + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
-        ptn_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#ParticipationType'/>\n")
-        ptn_str += padding.rjust(indent + 2) + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
-        ptn_str += padding.rjust(indent + 2) + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
+        ptn_str += _INDENTS[indent + 2] + ('<xs:appinfo>\n')
+        ptn_str += _INDENTS[indent + 2] + (f"<rdfs:Class rdf:about='mc-{self.mcuid}'>\n")
+        ptn_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#ParticipationType'/>\n")
+        ptn_str += _INDENTS[indent + 2] + ("<rdfs:subClassOf rdf:resource='https://www.s3model.com/ns/s3m/s3model/RMC'/>\n")
+        ptn_str += _INDENTS[indent + 2] + (f"<rdfs:label>{escape(self.label.strip())}</rdfs:label>\n")
         if len(self.pred_obj_list) > 0:  # are there additional predicate-object definitions?
             for po in self.pred_obj_list:
                 pred = po[0]
                 obj = po[1]
-                ptn_str += padding.rjust(indent + 8) + f'<{pred.strip()} rdf:resource="{quote(obj.strip())}"/>\n'
-        ptn_str += padding.rjust(indent + 2) + ("</rdfs:Class>\n")
-        ptn_str += padding.rjust(indent + 2) + ('</xs:appinfo>\n')
-        ptn_str += padding.rjust(indent + 2) + ("</xs:annotation>\n")
-        ptn_str += padding.rjust(indent + 2) + ("<xs:complexContent>\n")
-        ptn_str += padding.rjust(indent + 4) + ("<xs:restriction base='s3m:ParticipationType'>\n")
-        ptn_str += padding.rjust(indent + 6) + ("<xs:sequence>\n")
-        ptn_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
+                ptn_str += _INDENTS[indent + 8] + f'<{pred.strip()} rdf:resource="{quote(obj.strip())}"/>\n'
+        ptn_str += _INDENTS[indent + 2] + ("</rdfs:Class>\n")
+        ptn_str += _INDENTS[indent + 2] + ('</xs:appinfo>\n')
+        ptn_str += _INDENTS[indent + 2] + ("</xs:annotation>\n")
+        ptn_str += _INDENTS[indent + 2] + ("<xs:complexContent>\n")
+        ptn_str += _INDENTS[indent + 4] + ("<xs:restriction base='s3m:ParticipationType'>\n")
+        ptn_str += _INDENTS[indent + 6] + ("<xs:sequence>\n")
+        ptn_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='1' name='label' type='xs:string' fixed='{escape(self.label.strip())}'/>\n")
     
         # Participation
         if self.performer is not None:
-            ptn_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['performer'][0])}' name='performer' type='s3m:mc-{str(self.performer.mcuid)}'/>\n")
+            ptn_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['performer'][0])}' name='performer' type='s3m:mc-{str(self.performer.mcuid)}'/>\n")
 
         if self.function is not None:
-            ptn_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['function'][0])}' name='function' type='s3m:mc-{str(self.function.mcuid)}'/>\n")
+            ptn_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['function'][0])}' name='function' type='s3m:mc-{str(self.function.mcuid)}'/>\n")
 
         if self.mode is not None:
-            ptn_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['mode'][0])}' name='mode' type='s3m:mc-{str(self.mode.mcuid)}'/> \n")
+            ptn_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['mode'][0])}' name='mode' type='s3m:mc-{str(self.mode.mcuid)}'/> \n")
 
-        ptn_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['start'][0])}' name='start' type='xs:dateTime'/>\n")
-        ptn_str += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['end'][0])}' name='end' type='xs:dateTime'/>\n")
-
-        ptn_str += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        ptn_str += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        ptn_str += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        ptn_str += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        
-        if self.performer is not None:
-            ptn_str += self.performer.getModel()
-        if self.function is not None:
-            ptn_str += self.function.getModel()
-        if self.mode is not None:
-            ptn_str += self.mode.getModel()
+        ptn_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['start'][0])}' name='start' type='xs:dateTime'/>\n")
+        ptn_str += _INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['end'][0])}' name='end' type='xs:dateTime'/>\n")
 
+        ptn_str += _INDENTS[indent + 8] + ("</xs:sequence>\n")
+        ptn_str += _INDENTS[indent + 6] + ("</xs:restriction>\n")
+        ptn_str += _INDENTS[indent + 4] + ("</xs:complexContent>\n")
+        ptn_str += _INDENTS[indent + 2] + ("</xs:complexType>\n\n")
         return(ptn_str)
 
+    def _nested_models(self):
+        return(tuple(m for m in (self.performer, self.function, self.mode) if m is not None))
+
     def getXMLInstance(self, example):
         """
         Return a XML instance for the Participation.
@@ -1099,51 +1085,50 @@ class ParticipationType(MetaCommon):
         
 
         indent = 2
-        padding = ('').rjust(indent)
 
         xmlstr = ''
         xmlstr += f"<s3m:ms-{self.mcuid}>\n"
-        xmlstr += padding + f"  <label>{escape(self.label.strip())}</label>\n"
+        xmlstr += _INDENTS[indent] + f"  <label>{escape(self.label.strip())}</label>\n"
         
         if self.performer is not None:
-            xmlstr += padding + "<performer>\n"
-            xmlstr += padding + f"  <label>{escape(self.performer.label)}</label>\n"
+            xmlstr += _INDENTS[indent] + "<performer>\n"
+            xmlstr += _INDENTS[indent] + f"  <label>{escape(self.performer.label)}</label>\n"
             if self.performer.party_name is not None:
-                xmlstr += padding + f"  <party-name>{escape(self.performer.party_name)}</party-name>\n"
+                xmlstr += _INDENTS[indent] + f"  <party-name>{escape(self.performer.party_name)}</party-name>\n"
             if self.performer.party_ref is not None:
-                xmlstr += padding + "  <party-ref>\n"
-                xmlstr += padding + f'    <label>{self.performer.party_ref.label}</label>\n'
-                xmlstr += padding + f'    <link>{self.performer.party_ref.link}</link>\n'
-                xmlstr += padding + f'    <relation>{self.performer.party_ref.relation}</relation>\n'
-                xmlstr += padding + f'    <relation-uri>{self.performer.party_ref.relation_uri}</relation-uri>\n'
-                xmlstr += padding + "  </party-ref>\n"
+                xmlstr += _INDENTS[indent] + "  <party-ref>\n"
+                xmlstr += _INDENTS[indent] + f'    <label>{self.performer.party_ref.label}</label>\n'
+                xmlstr += _INDENTS[indent] + f'    <link>{self.performer.party_ref.link}</link>\n'
+                xmlstr += _INDENTS[indent] + f'    <relation>{self.performer.party_ref.relation}</relation>\n'
+                xmlstr += _INDENTS[indent] + f'    <relation-uri>{self.performer.party_ref.relation_uri}</relation-uri>\n'
+                xmlstr += _INDENTS[indent] + "  </party-ref>\n"
         
             if self.performer.party_details is not None:
-                xmlstr += padding + "  <party-details>\n"
-                xmlstr += padding + f"    <label>{escape(self.performer.party_details.label.strip())}</label>\n"
+                xmlstr += _INDENTS[indent] + "  <party-details>\n"
+                xmlstr += _INDENTS[indent] + f"    <label>{escape(self.performer.party_details.label.strip())}</label>\n"
                 for adapter in self.performer.party_details.items:
-                    xmlstr += padding + adapter.value.getXMLInstance(example)
+                    xmlstr += _INDENTS[indent] + adapter.value.getXMLInstance(example)
     
-                xmlstr += padding + "  </party-details>\n"
+                xmlstr += _INDENTS[indent] + "  </party-details>\n"
             
-            xmlstr += padding + "</performer>\n"
+            xmlstr += _INDENTS[indent] + "</performer>\n"
     
         if self.function is not None:
-            xmlstr += padding + "<function>\n"
-            xmlstr += padding + self.function.getXMLInstance(example)
-            xmlstr += padding + "</function>\n"
+            xmlstr += _INDENTS[indent] + "<function>\n"
+            xmlstr += _INDENTS[indent] + self.function.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "</function>\n"
     
         if self.mode is not None:
-            xmlstr += padding + "<mode>\n"
-            xmlstr += padding + self.mode.getXMLInstance(example)
-            xmlstr += padding + "</mode>\n"
+            xmlstr += _INDENTS[indent] + "<mode>\n"
+            xmlstr += _INDENTS[indent] + self.mode.getXMLInstance(example)
+            xmlstr += _INDENTS[indent] + "</mode>\n"
     
         if self.start is not None:
-            xmlstr += padding + f"  <start>{str(self.start)}</start>\n"
+            xmlstr += _INDENTS[indent] + f"  <start>{str(self.start)}</start>\n"
         if self.end is not None:
-            xmlstr += padding + f"  <end>{str(self.end)}</end>\n"
+            xmlstr += _INDENTS[indent] + f"  <end>{str(self.end)}</end>\n"
         
-        xmlstr += padding + f"</s3m:ms-{self.mcuid}>\n"
+        xmlstr += _INDENTS[indent] + f"</s3m:ms-{self.mcuid}>\n"
         return(xmlstr)
 
     def getJSONInstance(self, example):
@@ -19,9 +19,8 @@ import os
 import configparser
 
 config = configparser.ConfigParser()
-if os.path.isfile(os.path.join('./conf', 'S3MPython.conf')):
-    config.read(os.path.join('conf', 'S3MPython.conf'))
-else:
+# read() returns the files it parsed; an empty list means the file is missing or unreadable.
+if not config.read(os.path.join('conf', 'S3MPython.conf')):
     print('\n\nConfiguration file not found at: ' + os.path.join('conf', 'S3MPython.conf'),'\n\n')
     exit()
 
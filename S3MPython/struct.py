@@ -25,7 +25,7 @@ import xmltodict
 from cuid import cuid
 from validator_collection import checkers
 
-from .xdt import XdAnyType
+from .xdt import XdAnyType, _INDENTS, _memo_model
 from .errors import ValidationError, PublicationError
 
 
@@ -79,6 +79,7 @@ class XdAdapterType(ItemType):
         super().__init__()                
         self._value = None
         self._mcuid = None
+        self._model_str = None
         self.label = 'Empty XdAdapter'
 
     @property
@@ -99,7 +100,7 @@ class XdAdapterType(ItemType):
     def value(self, v):
         if not self.published:
             if v.published:
-                if isinstance(v, XdAnyType) and self._value == None:
+                if isinstance(v, XdAnyType) and self._value is None:
                     self._value = v
                     self._value.adapter = True
                     self._mcuid = self._value.acuid 
@@ -122,9 +123,14 @@ class XdAdapterType(ItemType):
             return(True)
 
  
+    @_memo_model
     def getModel(self):
         """
-        Return a XML Schema stub for the adapter.
+        Return a XML Schema stub for the adapter, followed by the schema of
+        its value.
+
+        The adapter cannot change once published, so its own text is built
+        once and reused.
         """
         if not self.published:
             raise ValueError("The model must first be published.")
@@ -133,21 +139,22 @@ class XdAdapterType(ItemType):
             raise ValidationError(self.__class__.__name__ + ' : ' + self.label + ', ID: ' + self.mcuid + " is not valid.")
 
         indent = 2
-        padding = ('').rjust(indent)
         xdstr = ''
-        xdstr += padding.rjust(indent) + f'\n<xs:element name="ms-{self.mcuid}" substitutionGroup="s3m:Items" type="s3m:mc-{self.mcuid}"/>\n'
-        xdstr += padding.rjust(indent) + f'<xs:complexType name="mc-{self.mcuid}">\n'
-        xdstr += padding.rjust(indent + 2) + '<xs:complexContent>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:restriction base="s3m:XdAdapterType">\n'
-        xdstr += padding.rjust(indent + 6) + '<xs:sequence>\n'
-        xdstr += padding.rjust(indent + 8) + f'<xs:element maxOccurs="unbounded" minOccurs="0" ref="s3m:ms-{self.value.mcuid}"/>\n'
-        xdstr += padding.rjust(indent + 6) + '</xs:sequence>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:restriction>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:complexContent>\n'
-        xdstr += padding.rjust(indent) + '</xs:complexType>\n\n'
-        xdstr += self.value.getModel()
+        xdstr += _INDENTS[indent] + f'\n<xs:element name="ms-{self.mcuid}" substitutionGroup="s3m:Items" type="s3m:mc-{self.mcuid}"/>\n'
+        xdstr += _INDENTS[indent] + f'<xs:complexType name="mc-{self.mcuid}">\n'
+        xdstr += _INDENTS[indent + 2] + '<xs:complexContent>\n'
+        xdstr += _INDENTS[indent + 4] + '<xs:restriction base="s3m:XdAdapterType">\n'
+        xdstr += _INDENTS[indent + 6] + '<xs:sequence>\n'
+        xdstr += _INDENTS[indent + 8] + f'<xs:element maxOccurs="unbounded" minOccurs="0" ref="s3m:ms-{self.value.mcuid}"/>\n'
+        xdstr += _INDENTS[indent + 6] + '</xs:sequence>\n'
+        xdstr += _INDENTS[indent + 4] + '</xs:restriction>\n'
+        xdstr += _INDENTS[indent + 2] + '</xs:complexContent>\n'
+        xdstr += _INDENTS[indent] + '</xs:complexType>\n\n'
         return(xdstr)
 
+    def _nested_models(self):
+        return((self.value,))
+
 
 class ClusterType(ItemType):
     """
@@ -169,6 +176,7 @@ class ClusterType(ItemType):
         self._docs = ''
         self._definition_url = ''
         self._pred_obj_list = []
+        self._model_str = None
 
         if checkers.is_string(label, 2):
             self._label = label
@@ -291,53 +299,57 @@ class ClusterType(ItemType):
             return(True)
 
 
+    @_memo_model
     def getModel(self):
         """
-        Return a XML Schema stub for the Cluster.
+        Return a XML Schema stub for the Cluster, followed by the schemas of
+        its items.
+
+        The cluster cannot change once published, so its own text is built
+        once and reused.
         """
         if not self.published:
             raise ValueError("The model must first be published.")
 
         self.validate()
         indent = 2
-        padding = ('').rjust(indent)
         xdstr = ''
-        xdstr += padding.rjust(indent) + f'\n<xs:element name="ms-{self.mcuid}" substitutionGroup="s3m:Item" type="s3m:mc-{self.mcuid}"/>\n'
-        xdstr += padding.rjust(indent) + f'<xs:complexType name="mc-{self.mcuid}">\n'
-        xdstr += padding.rjust(indent + 2) + '<xs:annotation>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:documentation>\n'
-        xdstr += padding.rjust(indent + 6) + escape(self.docs.strip()) + '\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:documentation>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:appinfo>\n'
+        xdstr += _INDENTS[indent] + f'\n<xs:element name="ms-{self.mcuid}" substitutionGroup="s3m:Item" type="s3m:mc-{self.mcuid}"/>\n'
+        xdstr += _INDENTS[indent] + f'<xs:complexType name="mc-{self.mcuid}">\n'
+        xdstr += _INDENTS[indent + 2] + '<xs:annotation>\n'
+        xdstr += _INDENTS[indent + 4] + '<xs:documentation>\n'
+        xdstr += _INDENTS[indent + 6] + escape(self.docs.strip()) + '\n'
+        xdstr += _INDENTS[indent + 4] + '</xs:documentation>\n'
+        xdstr += _INDENTS[indent + 4] + '<xs:appinfo>\n'
 
         # add RDF
-        xdstr += padding.rjust(indent + 6) + f'<rdfs:Class rdf:about="mc-{self.mcuid}">\n'
-        xdstr += padding.rjust(indent + 8) + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#ClusterType"/>\n'
-        xdstr += padding.rjust(indent + 8) + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model/RMC"/>\n'
-        xdstr += padding.rjust(indent + 8) + f'<rdfs:isDefinedBy rdf:resource="{quote(self.definition_url.strip())}"/>\n'
+        xdstr += _INDENTS[indent + 6] + f'<rdfs:Class rdf:about="mc-{self.mcuid}">\n'
+        xdstr += _INDENTS[indent + 8] + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#ClusterType"/>\n'
+        xdstr += _INDENTS[indent + 8] + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model/RMC"/>\n'
+        xdstr += _INDENTS[indent + 8] + f'<rdfs:isDefinedBy rdf:resource="{quote(self.definition_url.strip())}"/>\n'
         if len(self.pred_obj_list) > 0:  # are there additional predicate-object definitions?
             for po in self.pred_obj_list:
                 pred = po[0]
                 obj = po[1]
-                xdstr += padding.rjust(indent + 8) + f'<{pred.strip()} rdf:resource="{quote(obj.strip())}"/>\n'
-        xdstr += padding.rjust(indent + 6) + '</rdfs:Class>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:appinfo>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:annotation>\n'
-        xdstr += padding.rjust(indent + 2) + '<xs:complexContent>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:restriction base="s3m:ClusterType">\n'
-        xdstr += padding.rjust(indent + 6) + '<xs:sequence>\n'
-        xdstr += padding.rjust(indent + 8) + f'<xs:element maxOccurs="1" minOccurs="1" name="label" type="xs:string" fixed="{self.label.strip()}"/>\n'
+                xdstr += _INDENTS[indent + 8] + f'<{pred.strip()} rdf:resource="{quote(obj.strip())}"/>\n'
+        xdstr += _INDENTS[indent + 6] + '</rdfs:Class>\n'
+        xdstr += _INDENTS[indent + 4] + '</xs:appinfo>\n'
+        xdstr += _INDENTS[indent + 2] + '</xs:annotation>\n'
+        xdstr += _INDENTS[indent + 2] + '<xs:complexContent>\n'
+        xdstr += _INDENTS[indent + 4] + '<xs:restriction base="s3m:ClusterType">\n'
+        xdstr += _INDENTS[indent + 6] + '<xs:sequence>\n'
+        xdstr += _INDENTS[indent + 8] + f'<xs:element maxOccurs="1" minOccurs="1" name="label" type="xs:string" fixed="{self.label.strip()}"/>\n'
         for item in self.items:
-            xdstr += padding.rjust(indent + 8) + f'<xs:element maxOccurs="1" minOccurs="0" ref="s3m:ms-{item.value.acuid}"/>\n'
-        xdstr += padding.rjust(indent + 6) + '</xs:sequence>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:restriction>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:complexContent>\n'
-        xdstr += padding.rjust(indent) + '</xs:complexType>\n\n'
-        for item in self.items:
-            xdstr += item.getModel()
-
+            xdstr += _INDENTS[indent + 8] + f'<xs:element maxOccurs="1" minOccurs="0" ref="s3m:ms-{item.value.acuid}"/>\n'
+        xdstr += _INDENTS[indent + 6] + '</xs:sequence>\n'
+        xdstr += _INDENTS[indent + 4] + '</xs:restriction>\n'
+        xdstr += _INDENTS[indent + 2] + '</xs:complexContent>\n'
+        xdstr += _INDENTS[indent] + '</xs:complexType>\n\n'
         return(xdstr)
 
+    def _nested_models(self):
+        return(tuple(self.items))
+
 
     def getXMLInstance(self, example):
         """
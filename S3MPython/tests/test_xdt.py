@@ -0,0 +1,301 @@
+"""
+Test the XdType models in xdt.py.
+"""
+import io
+from decimal import Decimal
+
+import pytest
+from lxml import etree as ET
+
+from S3MPython import struct, xdt
+
+
+def test_string_length_tuple():
+    s = xdt.XdStringType('String Length Test')
+    s.length = (2, None)
+    assert s.length == (2, None)
+    s.length = (None, 10)
+    assert s.length == (None, 10)
+    s.length = (2, 10)
+    assert s.length == (2, 10)
+
+
+def test_string_length_tuple_invalid():
+    s = xdt.XdStringType('String Length Test')
+    with pytest.raises(ValueError):
+        s.length = (10, 2)
+    with pytest.raises(TypeError):
+        s.length = ('2', 10)
+
+
+def test_to_etree_matches_instance():
+    b = xdt.XdBooleanType('Boolean Test', {'trues': ['yes'], 'falses': ['no']})
+    b.published = True
+    b.true_value = 'yes'
+    el = b.to_etree()
+    assert el.tag == '{https://www.s3model.com/ns/s3m/}ms-' + b.mcuid
+    assert el.findtext('label') == 'Boolean Test'
+    assert el.findtext('true-value') == 'yes'
+    root = ET.Element('batch')
+    assert b.to_etree(root).getparent() is root
+
+
+def test_string_default_none_keeps_length():
+    s = xdt.XdStringType('String Default Test')
+    s.length = 5
+    s.default = 'abcde'
+    s.default = None
+    assert s.default is None
+    assert s.length == 5
+
+
+def test_ordinal_choices():
+    o = xdt.XdOrdinalType('Ordinal Test', {})
+    o.choices = {1: ('low', 'http://example.org/low'), 2: ('high', 'http://example.org/high')}
+    assert o.choices[2] == ('high', 'http://example.org/high')
+    with pytest.raises(TypeError):
+        o.choices = {1: ('low', 5)}
+    with pytest.raises(TypeError):
+        o.choices = {1: ('low',)}
+
+
+def test_get_model_to_stream():
+    b = xdt.XdBooleanType('Boolean Stream Test', {'trues': ['yes'], 'falses': ['no']})
+    b.definition_url = 'http://example.org/boolean'
+    b.published = True
+    out = io.StringIO()
+    assert b.getModel(out) is None
+    assert out.getvalue() == b.getModel()
+
+
+def test_file_media_content_base64():
+    f = xdt.XdFileType('File Test')
+    f.published = True
+    f.media_content = b'S3Model'
+    assert f.media_content == 'UzNNb2RlbA=='
+    assert '<media-content>UzNNb2RlbA==</media-content>' in f.getXMLInstance()
+
+
+def test_count_unconstrained_value():
+    u = xdt.XdStringType('Count Units')
+    u.definition_url = 'http://example.org/units'
+    u.published = True
+    c = xdt.XdCountType('Count Test')
+    c.definition_url = 'http://example.org/count'
+    c.units = u
+    c.published = True
+    assert "name='xdcount-value' type='xs:int'/>" in c.getModel()
+
+
+def test_model_follows_nested_adapter():
+    u = xdt.XdStringType('Count Units')
+    u.definition_url = 'http://example.org/units'
+    u.published = True
+    c = xdt.XdCountType('Count Test')
+    c.definition_url = 'http://example.org/count'
+    c.units = u
+    c.published = True
+    assert 'substitutionGroup="s3m:XdStringType"' in c.getModel()
+    struct.XdAdapterType().value = u
+    assert 'substitutionGroup="s3m:XdAdapter-value"' in c.getModel()
+
+
+def test_numeric_examples_respect_digits():
+    for _ in range(20):
+        assert 1 <= xdt._count_example(None, None, None, None, 3) <= 999
+        q = xdt._quantity_example(None, None, 2, 6)
+        assert len(q.as_tuple().digits) <= 6
+        assert -q.as_tuple().exponent <= 2
+        q = xdt._quantity_example(None, None, 2, 3)
+        assert 0 <= q <= 9
+        assert len(q.as_tuple().digits) <= 3
+        assert xdt._quantity_example(Decimal(200000), None, 2, None) >= 200000
+
+
+def test_quantity_value_digits():
+    q = xdt.XdQuantityType('Quantity Test')
+    q.total_digits = 4
+    q.fraction_digits = 1
+    q.published = True
+    q.value = Decimal('-123.4')
+    q.value = Decimal('12')
+    with pytest.raises(ValueError):
+        q.value = Decimal('1234.5')
+    with pytest.raises(ValueError):
+        q.value = Decimal('1.25')
+
+
+def test_quantity_value_coercion():
+    q = xdt.XdQuantityType('Quantity Coercion Test')
+    q.fraction_digits = 1
+    q.published = True
+    q.value = 12
+    assert q.value == Decimal('12')
+    q.value = 2.5
+    assert q.value == Decimal('2.5')
+    with pytest.raises(ValueError):
+        q.value = 0.25
+    with pytest.raises(ValueError):
+        q.value = True
+
+
+def test_magnitude_status():
+    q = xdt.XdQuantityType('Magnitude Status Test')
+    q.published = True
+    q.magnitude_status = 'approximate'
+    assert q.magnitude_status == 'approximate'
+    q.magnitude_status = None
+    assert q.magnitude_status is None
+    with pytest.raises(ValueError):
+        q.magnitude_status = 'about'
+
+
+def test_count_value_digits():
+    c = xdt.XdCountType('Count Digits Test')
+    c.total_digits = 3
+    c.published = True
+    c.value = -999
+    with pytest.raises(ValueError):
+        c.value = 1000
+
+
+def test_count_value_bounds():
+    c = xdt.XdCountType('Count Bounds Test')
+    c.min_inclusive = 1
+    c.max_exclusive = 10
+    c.published = True
+    c.value = 9
+    c.value = None
+    with pytest.raises(ValueError):
+        c.value = 0
+    with pytest.raises(ValueError):
+        c.value = 10
+
+
+def test_ratio_bounds():
+    r = xdt.XdRatioType('Ratio Bound Test')
+    r.definition_url = 'https://example.com/ratio'
+    r.num_min_inclusive = Decimal('0')
+    r.published = True
+    assert "<xs:minInclusive value='0'/>" in r.getModel()
+    with pytest.raises(xdt.PublicationError):
+        r.den_max_inclusive = 10
+    assert "name='denominator' type='xs:float'/>" in r.getModel()
+
+
+def test_ratio_shared_units():
+    units = xdt.XdStringType('Ratio Units')
+    units.definition_url = 'https://example.com/units'
+    units.published = True
+    r = xdt.XdRatioType('Ratio Units Test')
+    r.definition_url = 'https://example.com/ratio'
+    r.numerator_units = units
+    r.denominator_units = units
+    r.published = True
+    assert r.getModel().count(f'<xs:complexType name="mc-{units.mcuid}">') == 1
+
+
+def test_ratio_ambiguous_bounds():
+    r = xdt.XdRatioType('Ratio Ambiguity Test')
+    r.definition_url = 'https://example.com/ratio'
+    r.num_min_inclusive = Decimal('0')
+    r.num_min_exclusive = Decimal('1')
+    r.published = True
+    with pytest.raises(ValueError):
+        r.validate()
+
+
+def test_instance_label_escaped():
+    s = xdt.XdStringType('Salt & Pepper')
+    s.definition_url = 'https://example.com/string'
+    s.published = True
+    assert '<label>Salt &amp; Pepper</label>' in s.getXMLInstance()
+
+
+def test_temporal_duration_members():
+    t = xdt.XdTemporalType('Temporal Test')
+    t.definition_url = 'https://example.com/temporal'
+    t.published = True
+    t.duration = (2, 0, 10, 2, 0, Decimal('0'))
+    with pytest.raises(ValueError):
+        t.duration = (2, 0, 10, 2, 0.5, Decimal('0'))
+
+
+def test_temporal_month_day():
+    t = xdt.XdTemporalType('Temporal Month Day Test')
+    t.definition_url = 'https://example.com/temporal'
+    t.published = True
+    t.month_day = (2, 29)
+    assert t.month_day == (2, 29)
+    with pytest.raises(ValueError):
+        t.month_day = (4, 31)
+    with pytest.raises(ValueError):
+        t.month_day = (13, 1)
+    with pytest.raises(ValueError):
+        t.month_day = (1, 0)
+
+
+def test_temporal_instance_iso_text():
+    from datetime import date, datetime, time
+    t = xdt.XdTemporalType('Temporal ISO Test')
+    t.definition_url = 'https://example.com/temporal'
+    t.published = True
+    t.date = date(2021, 3, 4)
+    t.time = time(5, 6, 7)
+    t.datetime = datetime(2021, 3, 4, 5, 6, 7)
+    x = t.getXMLInstance()
+    assert '<xdtemporal-date>2021-03-04</xdtemporal-date>' in x
+    assert '<xdtemporal-time>05:06:07</xdtemporal-time>' in x
+    assert '<xdtemporal-datetime>2021-03-04T05:06:07</xdtemporal-datetime>' in x
+
+
+def test_temporal_year_month():
+    t = xdt.XdTemporalType('Temporal Year Month Test')
+    t.definition_url = 'https://example.com/temporal'
+    t.published = True
+    t.year_month = (2020, 12)
+    assert t.year_month == (2020, 12)
+    with pytest.raises(ValueError):
+        t.year_month = (2020, 13)
+    with pytest.raises(ValueError):
+        t.year_month = ('2020', 1)
+
+
+def test_temporal_duration_text():
+    t = xdt.XdTemporalType('Temporal Duration Text Test')
+    t.definition_url = 'https://example.com/temporal'
+    t.published = True
+    t.duration = (2, 0, 10, 2, 0, Decimal('1.5'))
+    assert '<xdtemporal-duration>P2Y0M10DT2H0M1.5S</xdtemporal-duration>' in t.getXMLInstance()
+
+
+def test_string_enums_filled_in_place():
+    s = xdt.XdStringType('String Enums Test')
+    s.definition_url = 'https://example.com/string'
+    s.enums.append(('a', 'https://example.com/a'))
+    s.published = True
+    assert "<xs:enumeration value='a'>" in s.getModel()
+
+
+def test_count_example_empty_range():
+    with pytest.raises(ValueError, match='min_inclusive is above the limit set by total_digits'):
+        xdt._count_example(1000, None, None, None, 3)
+    with pytest.raises(ValueError, match='min_inclusive is above the limit set by total_digits'):
+        xdt._quantity_example(Decimal(100), None, 2, 3)
+
+
+def test_temporal_partial_date_text():
+    t = xdt.XdTemporalType('Temporal Partial Date Test')
+    t.definition_url = 'https://example.com/temporal'
+    t.published = True
+    t.day = 7
+    t.month = 3
+    t.year = 987
+    t.year_month = (2001, 2)
+    t.month_day = (2, 29)
+    x = t.getXMLInstance()
+    assert '<xdtemporal-day>---07</xdtemporal-day>' in x
+    assert '<xdtemporal-month>--03</xdtemporal-month>' in x
+    assert '<xdtemporal-year>0987</xdtemporal-year>' in x
+    assert '<xdtemporal-year-month>2001-02</xdtemporal-year-month>' in x
+    assert '<xdtemporal-month-day>--02-29</xdtemporal-month-day>' in x
@@ -96,22 +96,44 @@ def get_latlon():
     return(latlon)
 
 
+# default range for random_dtstr
+_RANDOM_DT_START = datetime(1970, 1, 1)
+_RANDOM_DT_END = datetime(2015, 12, 31)
+
+
 def random_dtstr(start=None, end=None):
     """
     Return a random datetime string between start and end.
     """
     if not start:
-        start = datetime.strptime('1970-01-01', '%Y-%m-%d')
+        start = _RANDOM_DT_START
     else:
         start = datetime.strptime(start, '%Y-%m-%dT%H:%M:%S')
 
     if not end:
-        end = datetime.strptime('2015-12-31', '%Y-%m-%d')
+        end = _RANDOM_DT_END
     rand_dts = datetime.strftime(
         start + timedelta(seconds=randint(0, int((end - start).total_seconds()))), '%Y-%m-%dT%H:%M:%S')
     return rand_dts
 
 
+# (minOccurs range, maxOccurs range) for each cardinality setting
+_CARDINALITY_RANGES = {'act': ((0, 1), (0, 1)), 'ev': ((0, 1), (0, 1)), 'vtb': ((0, 1), (0, 1)), 'vte': ((0, 1), (0, 1)), 'tr': ((0, 1), (0, 1)),
+    'modified': ((0, 1), (0, 1)), 'location': ((0, 1), (0, 1)), 'relation_uri': ((0, 1), (0, 1)), 'value': ((0, 1), (0, 1)),
+    'units': ((0, 1), (0, 1)), 'size': ((0, 1), (0, 1)), 'encoding': ((0, 1), (0, 1)), 'language': ((0, 1), (0, 1)),
+    'formalism': ((0, 1), (0, 1)), 'media_type': ((0, 1), (0, 1)), 'compression_type': ((0, 1), (0, 1)), 'link': ((0, 1), (0, 1)),
+    'hash_result': ((0, 1), (0, 1)), 'hash_function': ((0, 1), (0, 1)), 'alt_txt': ((0, 1), (0, 1)), 'referencerange': ((0, 1), (0, Decimal('Infinity'))),
+    'normal_status': ((0, 1), (0, 1)), 'magnitude_status': ((0, 1), (0, 1)), 'error': ((0, 1), (0, 1)), 'accuracy': ((0, 1), (0, 1)),
+    'numerator': ((0, 1), (0, 1)), 'denominator': ((0, 1), (0, 1)), 'numerator_units': ((0, 1), (0, 1)),
+    'denominator_units': ((0, 1), (0, 1)), 'ratio_units': ((0, 1), (0, 1)), 'date': ((0, 1), (0, 1)), 'time': ((0, 1), (0, 1)),
+    'datetime': ((0, 1), (0, 1)), 'day': ((0, 1), (0, 1)), 'month': ((0, 1), (0, 1)), 'year': ((0, 1), (0, 1)), 'year_month': ((0, 1), (0, 1)),
+    'month_day': ((0, 1), (0, 1)), 'duration': ((0, 1), (0, 1)), 'view': ((0, 1), (0, 1)), 'proof': ((0, 1), (0, 1)),
+    'reason': ((0, 1), (0, 1)), 'committer': ((0, 1), (0, 1)), 'committed': ((0, 1), (0, 1)), 'system_user': ((0, 1), (0, 1)),
+    'location': ((0, 1), (0, 1)), 'performer': ((0, 1), (0, 1)), 'function': ((0, 1), (0, 1)), 'mode': ((0, 1), (0, 1)),
+    'start': ((0, 1), (0, 1)), 'end': ((0, 1), (0, 1)), 'party_name': ((0, 1), (0, 1)), 'party_ref': ((0, 1), (0, 1)),
+    'party_details': ((0, 1), (0, 1))}
+
+
 def valid_cardinality(self, v):
     """
     A dictionary of valid cardinality values and the lower and upper values of the minimum and maximum
@@ -125,30 +147,15 @@ def valid_cardinality(self, v):
 
     A Python value of 'None' equates to 'unbounded' or 'unlimited'.
     """
-    c = {'act': ((0, 1), (0, 1)), 'ev': ((0, 1), (0, 1)), 'vtb': ((0, 1), (0, 1)), 'vte': ((0, 1), (0, 1)), 'tr': ((0, 1), (0, 1)),
-         'modified': ((0, 1), (0, 1)), 'location': ((0, 1), (0, 1)), 'relation_uri': ((0, 1), (0, 1)), 'value': ((0, 1), (0, 1)),
-         'units': ((0, 1), (0, 1)), 'size': ((0, 1), (0, 1)), 'encoding': ((0, 1), (0, 1)), 'language': ((0, 1), (0, 1)),
-         'formalism': ((0, 1), (0, 1)), 'media_type': ((0, 1), (0, 1)), 'compression_type': ((0, 1), (0, 1)), 'link': ((0, 1), (0, 1)),
-         'hash_result': ((0, 1), (0, 1)), 'hash_function': ((0, 1), (0, 1)), 'alt_txt': ((0, 1), (0, 1)), 'referencerange': ((0, 1), (0, Decimal('Infinity'))),
-         'normal_status': ((0, 1), (0, 1)), 'magnitude_status': ((0, 1), (0, 1)), 'error': ((0, 1), (0, 1)), 'accuracy': ((0, 1), (0, 1)),
-         'numerator': ((0, 1), (0, 1)), 'denominator': ((0, 1), (0, 1)), 'numerator_units': ((0, 1), (0, 1)),
-         'denominator_units': ((0, 1), (0, 1)), 'ratio_units': ((0, 1), (0, 1)), 'date': ((0, 1), (0, 1)), 'time': ((0, 1), (0, 1)),
-         'datetime': ((0, 1), (0, 1)), 'day': ((0, 1), (0, 1)), 'month': ((0, 1), (0, 1)), 'year': ((0, 1), (0, 1)), 'year_month': ((0, 1), (0, 1)),
-         'month_day': ((0, 1), (0, 1)), 'duration': ((0, 1), (0, 1)), 'view': ((0, 1), (0, 1)), 'proof': ((0, 1), (0, 1)),
-         'reason': ((0, 1), (0, 1)), 'committer': ((0, 1), (0, 1)), 'committed': ((0, 1), (0, 1)), 'system_user': ((0, 1), (0, 1)),
-         'location': ((0, 1), (0, 1)), 'performer': ((0, 1), (0, 1)), 'function': ((0, 1), (0, 1)), 'mode': ((0, 1), (0, 1)),
-         'start': ((0, 1), (0, 1)), 'end': ((0, 1), (0, 1)), 'party_name': ((0, 1), (0, 1)), 'party_ref': ((0, 1), (0, 1)),
-         'party_details': ((0, 1), (0, 1))}
-
-    key = c.get(v[0])
+    key = _CARDINALITY_RANGES.get(v[0])
 
     if key is None:
         raise ValueError("The requested setting; " + str(v[0]) + " is not a valid cardinality setting value.")
     else:
-        if v[1][0] < c[v[0]][0][0] or v[1][0] > c[v[0]][0][1]:
-            raise ValueError("The minimum occurences value for " + str(v) + "is out of range. The allowed values are " + str(c[v[0]][0]))
-        if v[1][1] < c[v[0]][1][0] or v[1][1] > c[v[0]][1][1]:
-            raise ValueError("The maximum occurences value for " + str(v) + "is out of range. The allowed values are " + str(c[v[0]][1]))
+        if v[1][0] < key[0][0] or v[1][0] > key[0][1]:
+            raise ValueError("The minimum occurences value for " + str(v) + "is out of range. The allowed values are " + str(key[0]))
+        if v[1][1] < key[1][0] or v[1][1] > key[1][1]:
+            raise ValueError("The maximum occurences value for " + str(v) + "is out of range. The allowed values are " + str(key[1]))
         return(True)
 
 def xsdstub(model):
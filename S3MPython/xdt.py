@@ -26,6 +26,8 @@ from random import randint, choice, uniform, randrange, random
 from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 from collections import OrderedDict
+from functools import lru_cache, wraps
+from types import MappingProxyType
 from abc import ABC, abstractmethod
 from xml.sax.saxutils import escape
 from urllib.parse import quote
@@ -44,12 +46,398 @@ from .errors import ValidationError, PublicationError
 from .utils import get_latlon, random_dtstr, valid_cardinality, reg_ns, fetch_acs
 from .settings import get_acs, ACSFILE
 
-ACS = get_acs(ACSFILE)
+# globally register namespaces; the flag on the lxml module survives reloads of this one
+if not getattr(ET, '_s3m_ns_registered', False):
+    ns_dict = reg_ns()
+    for abbrev in ns_dict.keys():
+        ET.register_namespace(abbrev, ns_dict[abbrev])
+    ET._s3m_ns_registered = True
+
+# XML Schema type names for interval types and boolean literals indexed by a bool
+_TYPE_TRANSPOSE = {int: 'int', Decimal: 'decimal', float: 'float'}
+_BOOL_XSD = ('false', 'true')
+# unbounded cardinality
+_INF = Decimal('Infinity')
+# allowed XdQuantifiedType magnitude_status values
+_MAG_STATUS = frozenset((None, 'equal', 'less_than', 'greater_than', 'less_than_or_equal',
+                         'greater_than_or_equal', 'approximate'))
+# shared default (minOccurs, maxOccurs) pairs
+_CARD_0_1 = (0, 1)
+_CARD_1_1 = (1, 1)
+_CARD_0_INF = (0, _INF)
+# indentation strings indexed by width
+_INDENTS = tuple(' ' * i for i in range(32))
+# closing tags of the complexType emitted by the XdOrderedType subclasses
+_ORDERED_MODEL_CLOSE = (f"{_INDENTS[10]}</xs:sequence>\n"
+                        f"{_INDENTS[8]}</xs:restriction>\n"
+                        f"{_INDENTS[6]}</xs:complexContent>\n"
+                        f"{_INDENTS[4]}</xs:complexType>\n\n")
+# opening and closing lines of a facet-restricted value element, keyed by restriction base
+_FACETS_OPEN = {base: f"{_INDENTS[12]}<xs:simpleType>\n{_INDENTS[12]}<xs:restriction base='xs:{base}'>\n"
+                for base in ('int', 'decimal', 'float')}
+_FACETS_CLOSE = f"{_INDENTS[12]}</xs:restriction>\n{_INDENTS[12]}</xs:simpleType>\n{_INDENTS[10]}</xs:element>\n"
+# most days in each month, indexed by month number; 29 allows for leap years
+_MAX_DAYS = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+# range that random XdTemporalType example datetimes are drawn from
+_EXAMPLE_DT_START = datetime(1970, 1, 1)
+_EXAMPLE_DT_SECONDS = int((datetime(2030, 12, 31) - _EXAMPLE_DT_START).total_seconds())
+# XdTemporalType elements: (attribute and cardinality key, element name, XML Schema type)
+_TEMPORAL_FIELDS = (('date', 'xdtemporal-date', 'xs:date'),
+                    ('time', 'xdtemporal-time', 'xs:time'),
+                    ('datetime', 'xdtemporal-datetime', 'xs:dateTime'),
+                    ('day', 'xdtemporal-day', 'xs:gDay'),
+                    ('month', 'xdtemporal-month', 'xs:gMonth'),
+                    ('year', 'xdtemporal-year', 'xs:gYear'),
+                    ('year_month', 'xdtemporal-year-month', 'xs:gYearMonth'),
+                    ('month_day', 'xdtemporal-month-day', 'xs:gMonthDay'),
+                    ('duration', 'xdtemporal-duration', 'xs:duration'))
+# XdFileType metadata elements: (attribute and cardinality key, element name, XML Schema type)
+_FILE_FIELDS = (('size', 'size', 'xs:int'),
+                ('encoding', 'encoding', 'xs:string'),
+                ('language', 'xdfile-language', 'xs:language'),
+                ('formalism', 'formalism', 'xs:string'),
+                ('media_type', 'media-type', 'xs:string'),
+                ('compression_type', 'compression-type', 'xs:string'),
+                ('hash_result', 'hash-result', 'xs:string'),
+                ('hash_function', 'hash-function', 'xs:string'),
+                ('alt_txt', 'alt-txt', 'xs:string'))
+
+
+@lru_cache(maxsize=None)
+def _acs_terms():
+    """
+    The Access Control System terms in file order, read on first use.
+    """
+    return(tuple(get_acs(ACSFILE)))
+
+
+@lru_cache(maxsize=None)
+def _acs():
+    """
+    The Access Control System terms as a frozenset for membership tests.
+    """
+    return(frozenset(_acs_terms()))
+
+
+def __getattr__(name):
+    # ACS used to be read at import time; keep it available as a module attribute.
+    if name == 'ACS':
+        return(list(_acs_terms()))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def _schema_open():
+    """
+    An xs:schema start tag declaring the registered namespaces, used to parse
+    model fragments.
+    """
+    decls = ' '.join(f'xmlns:{abbrev}="{uri}"' for abbrev, uri in reg_ns().items())
+    return(f'<xs:schema {decls}>\n')
+
+
+@lru_cache(maxsize=None)
+def _nsmap():
+    """
+    The registered namespaces keyed by prefix. Callers must not modify it.
+    """
+    return(reg_ns())
+
+
+def _etree_build(name, v, parent=None):
+    """
+    Build the element for one _asdict() entry, as a SubElement of parent when
+    given. Prefixed names are resolved against the registered namespaces.
+    """
+    ns = _nsmap()
+    prefix, sep, local = name.rpartition(':')
+    tag = f'{{{ns[prefix]}}}{local}' if sep else name
+    if parent is None:
+        el = ET.Element(tag, nsmap={prefix: ns[prefix]} if sep else None)
+    else:
+        el = ET.SubElement(parent, tag)
+    if isinstance(v, dict):
+        for k, c in v.items():
+            _etree_build(k, c, el)
+    elif v is not None:
+        el.text = v
+    return(el)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_url(url: str) -> bool:
+    """
+    Cached URL check. Models commonly share the same definition URLs.
+    """
+    return(checkers.is_url(url))
+
+
+def _text(v):
+    """
+    Element text as it reads in a parsed XML instance; surrounding whitespace
+    is dropped and empty content becomes None.
+    """
+    v = str(v).strip()
+    return(v if v else None)
+
+
+def _int_in_range(v, lo, hi, name):
+    """
+    v if it is None or an int from lo to hi inclusive; anything else is
+    rejected.
+    """
+    if v is None or isinstance(v, int) and lo <= v <= hi:
+        return(v)
+    raise ValueError(f"The {name} value must be an integer type {lo} - {hi}.")
+
+
+def _xs_date(d):
+    """
+    A date (or datetime) as xs:date text, YYYY-MM-DD.
+    """
+    return(f"{d.year:04d}-{d.month:02d}-{d.day:02d}")
+
+
+def _xs_time(t):
+    """
+    A time (or datetime) as xs:time text, hh:mm:ss.
+    """
+    return(f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}")
+
+
+def _xs_duration(v):
+    """
+    A (years, months, days, hours, minutes, seconds) tuple as xs:duration
+    text, PnYnMnDTnHnMnS.
+    """
+    years, months, days, hours, minutes, seconds = v
+    return(f"P{years}Y{months}M{days}DT{hours}H{minutes}M{seconds}S")
+
+
+# instance text for each XdTemporalType value, keyed as in _TEMPORAL_FIELDS
+_TEMPORAL_TEXT = {'date': _xs_date,
+                  'time': _xs_time,
+                  'datetime': lambda v: f"{_xs_date(v)}T{_xs_time(v)}",
+                  'day': lambda v: f"---{v:02d}",
+                  'month': lambda v: f"--{v:02d}",
+                  'year': lambda v: f"{v:04d}",
+                  'year_month': lambda v: f"{v[0]:04d}-{v[1]:02d}",
+                  'month_day': lambda v: f"--{v[0]:02d}-{v[1]:02d}",
+                  'duration': _xs_duration}
+
+
+def _decimal_bound(v, name):
+    """
+    A facet bound as a Decimal, or None. Ints are converted; anything else is
+    rejected.
+    """
+    if v is None or isinstance(v, Decimal):
+        return(v)
+    if isinstance(v, int):
+        return(Decimal(v))
+    raise ValueError(f"The {name} value must be a Decimal.")
+
+
+def _facet(name, value):
+    """
+    A value restriction facet line, or an empty string when the facet is not
+    set.
+    """
+    return('' if value is None else f"{_INDENTS[14]}<xs:{name} value='{str(value).strip()}'/>\n")
+
+
+def _emit_exact_length(parts, indent, card, length):
+    """
+    Append an XdStringType value element restricted to an exact length.
+    """
+    parts.append(f"{_INDENTS[indent + 8]}<xs:element maxOccurs='1' minOccurs='{card}' name='xdstring-value'>\n"
+                 f"{_INDENTS[indent + 10]}<xs:simpleType>\n"
+                 f"{_INDENTS[indent + 12]}<xs:restriction base='xs:string'>\n"
+                 f"{_INDENTS[indent + 14]}<xs:length value='{length}'/>\n"
+                 f"{_INDENTS[indent + 12]}</xs:restriction>\n"
+                 f"{_INDENTS[indent + 10]}</xs:simpleType>\n"
+                 f"{_INDENTS[indent + 8]}</xs:element>\n")
+
+
+def _emit_length_range(parts, indent, card, length):
+    """
+    Append an XdStringType value element restricted to a (min, max) length
+    pair, either of which may be None.
+    """
+    parts.append(f"{_INDENTS[indent + 8]}<xs:element maxOccurs='1' minOccurs='{card}' name='xdstring-value'>\n"
+                 f"{_INDENTS[indent + 12]}<xs:simpleType>\n"
+                 f"{_INDENTS[indent + 14]}<xs:restriction base='xs:string'>\n")
+    if length[0] is not None:
+        parts.append(f"{_INDENTS[indent + 16]}<xs:minLength value='{length[0]}'/>\n")
+    if length[1] is not None:
+        parts.append(f"{_INDENTS[indent + 16]}<xs:maxLength value='{length[1]}'/>\n")
+    parts.append(f"{_INDENTS[indent + 14]}</xs:restriction>\n"
+                 f"{_INDENTS[indent + 12]}</xs:simpleType>\n"
+                 f"{_INDENTS[indent + 10]}</xs:element>\n")
+
+
+# XdStringType length emitters keyed by the type of the length value
+_LENGTH_EMITTERS = {int: _emit_exact_length, tuple: _emit_length_range}
+
+
+def _count_example(min_inc, max_inc, min_exc, max_exc, total_digits):
+    """
+    Return a random XdCountType example value that satisfies the facets.
+    """
+    if max_exc is not None:
+        high = max_exc - 1
+    elif max_inc is not None:
+        high = max_inc
+    else:
+        high = 1000000000
+
+    if total_digits is not None and total_digits > 0:
+        high = min(high, 10 ** total_digits - 1)
+
+    if min_exc is not None:
+        low = min_exc + 1
+    elif min_inc is not None:
+        low = min_inc
+    else:
+        low = min(1, high)
+
+    if low > high:
+        lower = 'min_exclusive' if min_exc is not None else 'min_inclusive'
+        upper = [name for name, v in (('max_exclusive', max_exc), ('max_inclusive', max_inc), ('total_digits', total_digits))
+                 if v is not None]
+        raise ValueError(f"No example value is possible: {lower} is above the limit set by {' and '.join(upper)}.")
+    return randint(low, high)
+
+
+def _quantity_example(min_inc, max_inc, fraction_digits, total_digits):
+    """
+    Return a random XdQuantityType example value as a Decimal, with the
+    fraction cut to fraction_digits and to what total_digits leaves after the
+    integer part. The integer part is kept to the digits total_digits leaves
+    after fraction_digits.
+    """
+    if max_inc is not None:
+        end = max_inc
+    else:
+        end = 100000 if min_inc is None else min_inc + 100000
+    if isinstance(total_digits, int) and total_digits > 0:
+        int_digits = total_digits - (fraction_digits if isinstance(fraction_digits, int) else 0)
+        end = min(end, 10 ** max(int_digits, 0) - 1)
+
+    start = min(1, end) if min_inc is None else min_inc
+    if start > end:
+        upper = [name for name, v in (('max_inclusive', max_inc), ('total_digits', total_digits)) if v is not None]
+        raise ValueError(f"No example value is possible: min_inclusive is above the limit set by {' and '.join(upper)}.")
+    ipart, _, fpart = str(uniform(float(start), float(end))).partition('.')
+    if isinstance(fraction_digits, int):
+        fpart = fpart[:fraction_digits]
+    if isinstance(total_digits, int):
+        fpart = fpart[:max(total_digits - len(ipart.lstrip('-')), 0)]
+    return Decimal(ipart + '.' + fpart if fpart else ipart)
+
+
+def _float_example(min_inc, max_inc, end):
+    """
+    Return a random float example between the inclusive bounds; an unset
+    lower bound is taken as 1 and an unset upper bound as end.
+    """
+    start = 1 if min_inc is None else min_inc
+    if max_inc is not None:
+        end = max_inc
+    return uniform(float(start), float(end))
+
+
+def _example_units(units, fallback="Example Units"):
+    """
+    Give an XdStringType used as units an example value when it has none.
+    """
+    if units.value is None:
+        if units.default is not None:
+            units.value = units.default
+        elif len(units.enums) > 0:
+            units.value = choice(units.enums)[0]
+        else:
+            units.value = fallback
+
+
+def _emit_units(parts, pad, tag, units):
+    """
+    Append the instance element, named tag, for an XdStringType used as units.
+    Units are normally published with their model, so the label escaped then
+    is used when there is one.
+    """
+    label = units._label_escaped
+    if label is None:
+        label = escape(units._label)
+    parts.append(f"{pad}<{tag}>\n"
+                 f"{pad}  <label>{label}</label>\n"
+                 f"{pad}  <xdstring-value>{escape(str(units.value))}</xdstring-value>\n"
+                 f"{pad}</{tag}>\n")
+
+
+@lru_cache(maxsize=512)
+def _temporal_elements(card):
+    """
+    The XdTemporalType schema elements for card, a tuple of (minOccurs,
+    maxOccurs) pairs in _TEMPORAL_FIELDS order. They depend on nothing else,
+    so models sharing a cardinality share the text.
+    """
+    pad = _INDENTS[10]
+    return(''.join(f"{pad}<xs:element maxOccurs='{mx}' minOccurs='{mn}' name='{name}' type='{xstype}'/>\n"
+                   for (_, name, xstype), (mn, mx) in zip(_TEMPORAL_FIELDS, card)))
+
+
+def _pre_pub(setter):
+    """
+    Restrict a property setter to models that have not been published.
+    """
+    @wraps(setter)
+    def wrapper(self, v):
+        if self._published:
+            raise PublicationError("The model has been published and cannot be edited.")
+        self._validated = False
+        return setter(self, v)
+    return wrapper
+
+
+def _post_pub(setter):
+    """
+    Restrict a property setter (instance data) to published models.
+    """
+    @wraps(setter)
+    def wrapper(self, v):
+        if not self._published:
+            raise PublicationError("The model has not been published.")
+        return setter(self, v)
+    return wrapper
+
+
+def _memo_model(getmodel):
+    """
+    Cache the schema text returned by getModel, which is the model's own
+    definition only. getModel requires a published model, so that text cannot
+    go stale except through the adapter flag, whose setter clears it.
+
+    The schemas of the models returned by _nested_models() follow it and are
+    fetched on every call: a nested model can still change after its container
+    is published, e.g. by being wrapped in an XdAdapterType.
+
+    When a writable file-like object is passed as out, the text is written to
+    it and None is returned, so callers writing a schema file do not need to
+    hold their own copy.
+    """
+    @wraps(getmodel)
+    def wrapper(self, out=None):
+        if type(self).getModel is not wrapper:
+            return getmodel(self)
+        if self._model_str is None:
+            self._model_str = getmodel(self)
+        text = self._model_str + ''.join(m.getModel() for m in self._nested_models())
+        if out is None:
+            return text
+        out.write(text)
+    return wrapper
 
-# globally register namespaces
-ns_dict = reg_ns()
-for abbrev in ns_dict.keys():
-    ET.register_namespace(abbrev, ns_dict[abbrev])
 
 class XdAnyType(ABC):
     """
@@ -57,6 +445,17 @@ class XdAnyType(ABC):
     in S3Model.
     """
 
+    __slots__ = ('_mcuid', '_acuid', '_label', '_published', '_xdtype', '_adapter', '_docs',
+                 '_definition_url', '_definition_url_valid', '_pred_obj_list', '_act', '_ev',
+                 '_vtb', '_vte', '_tr', '_modified', '_latitude', '_longitude', '_cardinality',
+                 '_card_str', '_label_escaped', '_docs_escaped', '_def_url_quoted', '_pred_obj_quoted', '_validated',
+                 '_model_str', '_open_tag', '_close_tag', '_adapter_open_tag', '_adapter_close_tag')
+
+    # shared, read-only default cardinality; copied on the first cardinality change.
+    # Subclasses extend it with the defaults for their own elements.
+    _DEFAULT_CARDINALITY = MappingProxyType({'act': _CARD_0_1, 'ev': (0, None), 'vtb': _CARD_0_1, 'vte': _CARD_0_1,
+                                             'tr': _CARD_0_1, 'modified': _CARD_0_1, 'location': _CARD_0_1})
+
     # TODO: Implement complete constraint checking.
 
     @abstractmethod
@@ -67,14 +466,21 @@ class XdAnyType(ABC):
         The semantic label (name of the model) is required.
         """
         self._mcuid = cuid()  # model cuid
-        self._acuid = cuid()  # adapter cuid
+        self._acuid = None  # adapter cuid, generated on first use
         self._label = ''
 
         self._published = False
+        self._validated = False  # set by a successful validate(), cleared by model edits
+        self._model_str = None  # getModel() output, cached once published
+        self._open_tag = None  # instance start and end tags, built with the cuids they name
+        self._close_tag = None
+        self._adapter_open_tag = None
+        self._adapter_close_tag = None
         self._xdtype = None
         self._adapter = False  # flag is set True by a XdAdapter for use in a Cluster, otherwise it is false
         self._docs = ''
         self._definition_url = ''
+        self._definition_url_valid = False
         self._pred_obj_list = []
         self._act = None
         self._ev = []
@@ -84,8 +490,12 @@ class XdAnyType(ABC):
         self._modified = None
         self._latitude = None
         self._longitude = None
-        self._cardinality = {'act': [0, 1], 'ev': [0, None], 'vtb': [0, 1], 'vte': [0, 1],
-                             'tr': [0, 1], 'modified': [0, 1], 'location': [0, 1]}
+        self._cardinality = None  # uses _DEFAULT_CARDINALITY until changed
+        self._card_str = None  # minOccurs strings, set on publication
+        self._label_escaped = None  # escaped/quoted label and annotation values, set on publication
+        self._docs_escaped = None
+        self._def_url_quoted = None
+        self._pred_obj_quoted = None
 
         if checkers.is_string(label, minimum_length=2) and not self._published:
             self._label = label
@@ -126,26 +536,28 @@ class XdAnyType(ABC):
         The 'unbounded' value is allowed on only a few attributes.
 
         """
+        if self._cardinality is None:
+            return self._DEFAULT_CARDINALITY
         return self._cardinality
 
     @cardinality.setter
+    @_pre_pub
     def cardinality(self, v):
-        if not self.published:
-            if isinstance(v, tuple) and len(v) == 2 and isinstance(v[0], str) and isinstance(v[1], list):
-                v[1][0] = Decimal('INF') if v[1][0] is None else v[1][0]
-                v[1][1] = Decimal('INF') if v[1][1] is None else v[1][1]
-
-                if isinstance(v[1][0], (int, Decimal)) and isinstance(v[1][1], (int, Decimal)):
-                    if isinstance(v[1][0], int) and isinstance(v[1][1], int) and v[1][0] > v[1][1]:
-                        raise ValueError("The minimum value must be less than or equal to the maximum value.")
-                    if valid_cardinality(self, v):
-                        self._cardinality[v[0]] = v[1]
-                else:
-                    raise TypeError("The cardinality values must be integers or None.")
+        if isinstance(v, tuple) and len(v) == 2 and isinstance(v[0], str) and isinstance(v[1], list):
+            v[1][0] = _INF if v[1][0] is None else v[1][0]
+            v[1][1] = _INF if v[1][1] is None else v[1][1]
+
+            if isinstance(v[1][0], (int, Decimal)) and isinstance(v[1][1], (int, Decimal)):
+                if isinstance(v[1][0], int) and isinstance(v[1][1], int) and v[1][0] > v[1][1]:
+                    raise ValueError("The minimum value must be less than or equal to the maximum value.")
+                if valid_cardinality(self, v):
+                    if self._cardinality is None:
+                        self._cardinality = {k: list(c) for k, c in self._DEFAULT_CARDINALITY.items()}
+                    self._cardinality[v[0]] = v[1]
             else:
-                raise ValueError("The cardinality value is malformed. It must be a tuple of a string and a list of two integers.")
+                raise TypeError("The cardinality values must be integers or None.")
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The cardinality value is malformed. It must be a tuple of a string and a list of two integers.")
 
     @property
     def mcuid(self):
@@ -158,9 +570,21 @@ class XdAnyType(ABC):
     def acuid(self):
         """
         The unique identifier of the wrapping XdAdapter of the component.
+
+        Only adapted components need one so it is generated on first access.
         """
+        self._ensure_acuid()
         return self._acuid
 
+    def _ensure_acuid(self):
+        """
+        Generate the adapter id and its instance tags if they do not exist yet.
+        """
+        if self._acuid is None:
+            self._acuid = cuid()
+            self._adapter_open_tag = f'  <s3m:ms-{self._acuid}>\n'
+            self._adapter_close_tag = f'</s3m:ms-{self._acuid}>\n'
+
     @property
     def label(self):
         """
@@ -180,13 +604,28 @@ class XdAnyType(ABC):
     @published.setter
     def published(self, v: bool):
         if isinstance(v, bool):
-            if self._published == False:
+            if not self._published:
+                if v:
+                    self._freeze()
                 self._published = v
             else:
                 raise ValueError("the published value cannot be changed once published.")
         else:
             raise TypeError("the published value must be a boolean.")
 
+    def _freeze(self):
+        """
+        Cache values derived from the model definition. Called once when the
+        model is published, after which the definition cannot change.
+        """
+        self._card_str = {k: str(v[0]) for k, v in self.cardinality.items()}
+        self._label_escaped = escape(self._label)
+        self._open_tag = f'  <s3m:ms-{self._mcuid}>\n    <label>{self._label_escaped}</label>\n'
+        self._close_tag = f'</s3m:ms-{self._mcuid}>\n'
+        self._docs_escaped = escape(self._docs.strip())
+        self._def_url_quoted = quote(self._definition_url.strip())
+        self._pred_obj_quoted = tuple((p.strip(), quote(o.strip())) for p, o in self._pred_obj_list)
+
     @property
     def adapter(self):
         """
@@ -198,6 +637,9 @@ class XdAnyType(ABC):
     def adapter(self, v: bool):
         if isinstance(v, bool):
             self._adapter = v
+            self._model_str = None
+            if v:
+                self._ensure_acuid()
         else:
             raise ValueError("the adapter value must be a boolean.")
 
@@ -210,14 +652,12 @@ class XdAnyType(ABC):
         return self._docs
 
     @docs.setter
+    @_pre_pub
     def docs(self, v: str):
-        if not self.published:
-            if checkers.is_string(v):
-                self._docs = v
-            else:
-                raise ValueError("the Documentation value must be a string.")
+        if isinstance(v, str):
+            self._docs = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the Documentation value must be a string.")
 
     @property
     def pred_obj_list(self):
@@ -234,16 +674,14 @@ class XdAnyType(ABC):
         return self._pred_obj_list
 
     @pred_obj_list.setter
+    @_pre_pub
     def pred_obj_list(self, v: Iterable):
-        if not self.published:
-            if isinstance(v, list) and len(v) == 0:
-                self._pred_obj_list = []
-            elif isinstance(v, tuple) and len(v) == 2 and isinstance(v[0], str) and isinstance(v[1], str):
-                self._pred_obj_list.append(v)
-            else:
-                raise ValueError("the Predicate Object List value must be a tuple of two strings or an empty list.")
+        if isinstance(v, list) and len(v) == 0:
+            self._pred_obj_list = []
+        elif isinstance(v, tuple) and len(v) == 2 and isinstance(v[0], str) and isinstance(v[1], str):
+            self._pred_obj_list.append(v)
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the Predicate Object List value must be a tuple of two strings or an empty list.")
 
     @property
     def definition_url(self):
@@ -256,14 +694,13 @@ class XdAnyType(ABC):
         return self._definition_url
 
     @definition_url.setter
+    @_pre_pub
     def definition_url(self, v: str):
-        if not self.published:
-            if checkers.is_url(v):
-                self._definition_url = v
-            else:
-                raise ValueError("the Definition URL value must be a valid URL.")
+        if isinstance(v, str) and _is_valid_url(v):
+            self._definition_url = v
+            self._definition_url_valid = True
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the Definition URL value must be a valid URL.")
 
     @property
     def act(self):
@@ -277,17 +714,15 @@ class XdAnyType(ABC):
         return self._act
 
     @act.setter
+    @_post_pub
     def act(self, v: str):
-        if self.published:
-            if checkers.is_string(v):
-                if v in ACS:
-                    self._act = v
-                else:
-                    raise ValueError("The act value must be in the Access Control System list.")
+        if isinstance(v, str):
+            if v in _acs():
+                self._act = v
             else:
-                raise ValueError("the Access Control Tag value must be a string.")
+                raise ValueError("The act value must be in the Access Control System list.")
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the Access Control Tag value must be a string.")
 
     @property
     def ev(self):
@@ -301,14 +736,12 @@ class XdAnyType(ABC):
         return self._ev
 
     @ev.setter
+    @_post_pub
     def ev(self, v):
-        if self.published:
-            if checkers.is_type(v, 'ExceptionalValue'):
-                self._ev.append(v)
-            else:
-                raise ValueError("the ev value must be an ExceptionalValue.")
+        if isinstance(v, ExceptionalValue):
+            self._ev.append(v)
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the ev value must be an ExceptionalValue.")
 
     @property
     def vtb(self):
@@ -319,14 +752,12 @@ class XdAnyType(ABC):
         return self._vtb
 
     @vtb.setter
+    @_post_pub
     def vtb(self, v):
-        if self.published:
-            if checkers.is_datetime(v):
-                self._vtb = v
-            else:
-                raise ValueError("the Valid Time Begin value must be a datetime.")
+        if isinstance(v, datetime) or checkers.is_datetime(v):
+            self._vtb = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the Valid Time Begin value must be a datetime.")
 
     @property
     def vte(self):
@@ -338,14 +769,12 @@ class XdAnyType(ABC):
         return self._vte
 
     @vte.setter
+    @_post_pub
     def vte(self, v):
-        if self.published:
-            if checkers.is_datetime(v):
-                self._vte = v
-            else:
-                raise ValueError("the Valid Time End value must be a datetime.")
+        if isinstance(v, datetime) or checkers.is_datetime(v):
+            self._vte = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the Valid Time End value must be a datetime.")
 
     @property
     def tr(self):
@@ -356,14 +785,12 @@ class XdAnyType(ABC):
         return self._tr
 
     @tr.setter
+    @_post_pub
     def tr(self, v):
-        if self.published:
-            if checkers.is_datetime(v):
-                self._tr = v
-            else:
-                raise ValueError("the Time Recorded value must be a datetime.")
+        if isinstance(v, datetime) or checkers.is_datetime(v):
+            self._tr = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the Time Recorded value must be a datetime.")
 
     @property
     def modified(self):
@@ -374,14 +801,12 @@ class XdAnyType(ABC):
         return self._modified
 
     @modified.setter
+    @_post_pub
     def modified(self, v):
-        if self.published:
-            if checkers.is_datetime(v):
-                self._modified = v
-            else:
-                raise ValueError("the Modified value must be a datetime.")
+        if isinstance(v, datetime) or checkers.is_datetime(v):
+            self._modified = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the Modified value must be a datetime.")
 
     @property
     def latitude(self):
@@ -391,14 +816,12 @@ class XdAnyType(ABC):
         return self._latitude
 
     @latitude.setter
+    @_post_pub
     def latitude(self, v):
-        if self.published:
-            if checkers.is_decimal(v, minimum=-90.00, maximum=90.00):
-                self._latitude = v
-            else:
-                raise ValueError("the Latitude value must be a decimal between -90.00 and 90.00.")
+        if (isinstance(v, Decimal) and -90 <= v <= 90) or checkers.is_decimal(v, minimum=-90.00, maximum=90.00):
+            self._latitude = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the Latitude value must be a decimal between -90.00 and 90.00.")
 
     @property
     def longitude(self):
@@ -408,14 +831,12 @@ class XdAnyType(ABC):
         return self._longitude
 
     @longitude.setter
+    @_post_pub
     def longitude(self, v):
-        if self.published:
-            if checkers.is_decimal(v, minimum=-180.00, maximum=180.00):
-                self._longitude = v
-            else:
-                raise ValueError("the Longitude value must be a decimal between -180.00 and 180.00.")
+        if (isinstance(v, Decimal) and -180 <= v <= 180) or checkers.is_decimal(v, minimum=-180.00, maximum=180.00):
+            self._longitude = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the Longitude value must be a decimal between -180.00 and 180.00.")
 
     def __str__(self):
         if self.validate():
@@ -427,78 +848,114 @@ class XdAnyType(ABC):
         """
         Every XdType must implement this method.
         """
-        if not checkers.is_url(self.definition_url):
+        if self._validated:
+            return(True)
+        if not self._definition_url_valid:
             raise ValidationError(self.__class__.__name__ + ' : ' + self.label + " - failed validation: definition_url is invalid\n" + str(self.definition_url))
         elif not isinstance(self.label, str) or len(self.label) < 2:
             raise ValidationError(self.__class__.__name__ + ' : ' + self.label + " - failed validation: label is too short or missing\n" + str(self.label))
         else:
+            self._validated = True
             return(True)
 
+    @_memo_model
     def getModel(self):
         """
-        Return a XML Schema stub for Xd Types.
+        Return a XML Schema complexType definition.
+
+        Subclasses add their elements by extending _model_parts().
         """
-        if not self.published:
+        parts = []
+        self._model_parts(parts)
+        return(''.join(parts))
+
+    def _nested_models(self):
+        """
+        The models whose schemas follow this one in getModel(), in order.
+        """
+        return(())
+
+    def _model_parts(self, parts):
+        """
+        Append the XML Schema stub for Xd Types to parts. The model is
+        validated here, before anything is appended, so overrides that call
+        this first need not validate again.
+        """
+        if not self._published:
             raise PublicationError("The model must first be published.")
 
         self.validate()
 
         indent = 2
-        padding = ('').rjust(indent)
-        xdstr = ''
-        if self.adapter:
-            xdstr += padding.rjust(indent) + f'<xs:element name="ms-{self.mcuid}" substitutionGroup="s3m:XdAdapter-value" type="s3m:mc-{self.mcuid}"/>\n'
-        else:
-            sg = str(type(self)).replace("<class 'S3MPython.xdt.", "")
-            sg = sg.replace("'>", '')
-            xdstr += padding.rjust(indent) + f'<xs:element name="ms-{self.mcuid}" substitutionGroup="s3m:{sg}" type="s3m:mc-{self.mcuid}"/>\n'
-
-        xdstr += padding.rjust(indent) + f'<xs:complexType name="mc-{self.mcuid}">\n'
-        xdstr += padding.rjust(indent + 2) + '<xs:annotation>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:documentation>\n'
-        xdstr += padding.rjust(indent + 6) + escape(self.docs.strip()) + '\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:documentation>\n'
-        xdstr += padding.rjust(indent + 4) + '<xs:appinfo>\n'
-
-        # add RDF
-        xdstr += padding.rjust(indent + 6) + f'<rdfs:Class rdf:about="mc-{self.mcuid}">\n'
-        xdstr += padding.rjust(indent + 8) + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#' + self._xdtype + '"/>\n'
-        xdstr += padding.rjust(indent + 8) + '<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model/RMC"/>\n'
-        xdstr += padding.rjust(indent + 8) + f'<rdfs:isDefinedBy rdf:resource="{quote(self.definition_url.strip())}"/>\n'
-        if len(self.pred_obj_list) > 0:  # are there additional predicate-object definitions?
-            for po in self.pred_obj_list:
-                pred = po[0]
-                obj = po[1]
-                xdstr += padding.rjust(indent + 8) + f'<{pred.strip()} rdf:resource="{quote(obj.strip())}"/>\n'
-        xdstr += padding.rjust(indent + 6) + '</rdfs:Class>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:appinfo>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:annotation>\n'
-        xdstr += padding.rjust(indent + 2) + '<xs:complexContent>\n'
-        xdstr += padding.rjust(indent + 4) + f'<xs:restriction base="s3m:{self._xdtype}">\n'
-        xdstr += padding.rjust(indent + 6) + '<xs:sequence>\n'
-        # XdAny
-        xdstr += padding.rjust(indent + 8) + f'<xs:element maxOccurs="1" minOccurs="1" name="label" type="xs:string" fixed="{self.label.strip()}"/>\n'
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['act'][0])}' name='act' type='xs:string'/>\n"
-        xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="unbounded" minOccurs="0" ref="s3m:ExceptionalValue"/>\n'
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['vtb'][0])}' name='vtb' type='xs:dateTime'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['vte'][0])}' name='vte' type='xs:dateTime'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['tr'][0])}' name='tr' type='xs:dateTime'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['modified'][0])}' name='modified' type='xs:dateTime'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['location'][0])}' name='latitude' type='s3m:lattype'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['location'][0])}' name='longitude' type='s3m:lontype'/>\n"
-
-        return(xdstr)
+        pad = _INDENTS[indent]
+        pad2 = _INDENTS[indent + 2]
+        pad4 = _INDENTS[indent + 4]
+        pad6 = _INDENTS[indent + 6]
+        pad8 = _INDENTS[indent + 8]
+        mcuid = self._mcuid
+        sg = 'XdAdapter-value' if self.adapter else type(self).__name__
+        parts.append(f'{pad}<xs:element name="ms-{mcuid}" substitutionGroup="s3m:{sg}" type="s3m:mc-{mcuid}"/>\n'
+                     f'{pad}<xs:complexType name="mc-{mcuid}">\n'
+                     f'{pad2}<xs:annotation>\n'
+                     f'{pad4}<xs:documentation>\n'
+                     f'{pad6}{self._docs_escaped}\n'
+                     f'{pad4}</xs:documentation>\n'
+                     f'{pad4}<xs:appinfo>\n'
+                     # add RDF
+                     f'{pad6}<rdfs:Class rdf:about="mc-{mcuid}">\n'
+                     f'{pad8}<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd#{self._xdtype}"/>\n'
+                     f'{pad8}<rdfs:subClassOf rdf:resource="https://www.s3model.com/ns/s3m/s3model/RMC"/>\n'
+                     f'{pad8}<rdfs:isDefinedBy rdf:resource="{self._def_url_quoted}"/>\n')
+        for pred, obj in self._pred_obj_quoted:  # additional predicate-object definitions
+            parts.append(f'{pad8}<{pred} rdf:resource="{obj}"/>\n')
+        parts.append(f'{pad6}</rdfs:Class>\n'
+                     f'{pad4}</xs:appinfo>\n'
+                     f'{pad2}</xs:annotation>\n')
+        card = self._card_str
+        parts.append(f'{pad2}<xs:complexContent>\n'
+                     f'{pad4}<xs:restriction base="s3m:{self._xdtype}">\n'
+                     f'{pad6}<xs:sequence>\n'
+                     # XdAny
+                     f'{pad8}<xs:element maxOccurs="1" minOccurs="1" name="label" type="xs:string" fixed="{self.label.strip()}"/>\n'
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['act']}' name='act' type='xs:string'/>\n"
+                     f'{pad8}<xs:element maxOccurs="unbounded" minOccurs="0" ref="s3m:ExceptionalValue"/>\n'
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['vtb']}' name='vtb' type='xs:dateTime'/>\n"
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['vte']}' name='vte' type='xs:dateTime'/>\n"
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['tr']}' name='tr' type='xs:dateTime'/>\n"
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['modified']}' name='modified' type='xs:dateTime'/>\n"
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['location']}' name='latitude' type='s3m:lattype'/>\n"
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['location']}' name='longitude' type='s3m:lontype'/>\n")
+
+    def getModelElement(self):
+        """
+        Return the XML Schema stub for this model as an lxml Element.
+
+        The definitions from getModel() are children of an xs:schema element
+        that declares the registered namespaces, so callers working with lxml
+        do not have to wrap and parse the string themselves.
+        """
+        return(ET.fromstring(_schema_open() + self.getModel() + '</xs:schema>'))
 
     def getXMLInstance(self, example=False):
         """
         Return an XML fragment for this model.
+
+        Subclasses add their elements by extending _instance_parts().
+        """
+        parts = []
+        self._instance_parts(parts, example)
+        return(''.join(parts))
+
+    def _instance_parts(self, parts, example):
+        """
+        Append the XML instance fragments common to Xd Types to parts.
         """
-        if not self.published:
+        if not self._published:
             raise PublicationError("The model must first be published.")
 
         # set some values for use in examples when actual data hasn't been assigned
-        if example == True:
-            self.act = choice(ACS)
+        if example:
+            self.act = choice(_acs_terms())
             self.vtb = random_dtstr()
             self.vte = random_dtstr()
             self.tr = random_dtstr()
@@ -507,35 +964,82 @@ class XdAnyType(ABC):
             self.latitude = str(loc[0])
             self.longitude = str(loc[1])
 
-        indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = ''
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'<s3m:ms-{self.acuid}>\n'
-        xmlstr += padding.rjust(indent) + f'<s3m:ms-{self.mcuid}>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<label>{self.label}</label>\n'
+            parts.append(self._adapter_open_tag)
+        parts.append(self._open_tag)
+        if self.cardinality['act'][0] > 0 or self.act is not None:
+            parts.append(f'    <act>{self.act}</act>\n')
+        if self.cardinality['vtb'][0] > 0 or self.vtb is not None:
+            parts.append(f'    <vtb>{self.vtb}</vtb>\n')
+        if self.cardinality['vte'][0] > 0 or self.vte is not None:
+            parts.append(f'    <vte>{self.vte}</vte>\n')
+        if self.cardinality['tr'][0] > 0 or self.tr is not None:
+            parts.append(f'    <tr>{self.tr}</tr>\n')
+        if self.cardinality['modified'][0] > 0 or self.modified is not None:
+            parts.append(f'    <modified>{self.modified}</modified>\n')
+        if self.cardinality['location'][0] > 0 or self.latitude is not None or self.longitude is not None:
+            parts.append(f'    <latitude>{self.latitude}</latitude>\n')
+            parts.append(f'    <longitude>{self.longitude}</longitude>\n')
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict of the elements written by
+        getXMLInstance().
+        """
+        d = OrderedDict()
+        d['label'] = _text(self.label)
         if self.cardinality['act'][0] > 0 or self.act is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<act>{self.act}</act>\n'
+            d['act'] = _text(self.act)
         if self.cardinality['vtb'][0] > 0 or self.vtb is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<vtb>{self.vtb}</vtb>\n'
+            d['vtb'] = _text(self.vtb)
         if self.cardinality['vte'][0] > 0 or self.vte is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<vte>{self.vte}</vte>\n'
+            d['vte'] = _text(self.vte)
         if self.cardinality['tr'][0] > 0 or self.tr is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<tr>{self.tr}</tr>\n'
+            d['tr'] = _text(self.tr)
         if self.cardinality['modified'][0] > 0 or self.modified is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<modified>{self.modified}</modified>\n'
+            d['modified'] = _text(self.modified)
         if self.cardinality['location'][0] > 0 or self.latitude is not None or self.longitude is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<latitude>{self.latitude}</latitude>\n'
-            xmlstr += padding.rjust(indent + 2) + f'<longitude>{self.longitude}</longitude>\n'
+            d['latitude'] = _text(self.latitude)
+            d['longitude'] = _text(self.longitude)
 
-        return(xmlstr)
+        return(d)
+
+    def _element_dict(self):
+        """
+        Return _asdict() keyed by the element name(s) used in the XML instance.
+        """
+        d = OrderedDict([(f's3m:ms-{self.mcuid}', self._asdict())])
+        if self.adapter:
+            d = OrderedDict([(f's3m:ms-{self.acuid}', d)])
+        return(d)
+
+    def to_etree(self, parent=None):
+        """
+        Return the instance data as an lxml Element, appended to parent when
+        one is given, for callers that work with lxml trees. The elements are
+        the same as those of getXMLInstance(), which remains the faster way to
+        get the instance as text.
+        """
+        if not self._published:
+            raise PublicationError("The model must first be published.")
+        (name, v), = self._element_dict().items()
+        return(_etree_build(name, v, parent))
 
     def getJSONInstance(self, example=False):
         """
         Return an example JSON fragment for this model.
+
+        Example values are generated by getXMLInstance() so that path converts
+        the XML. Otherwise the JSON is built directly from the instance data.
         """
-        xml = self.getXMLInstance(example)
-        parsed = xmltodict.parse(xml, encoding='UTF-8', process_namespaces=False)
+        if example:
+            xml = self.getXMLInstance(example)
+            # xmltodict already turns on expat's buffer_text; it is not a parse() option.
+            parsed = xmltodict.parse(xml, encoding='UTF-8', process_namespaces=False)
+        else:
+            if not self._published:
+                raise PublicationError("The model must first be published.")
+            parsed = self._element_dict()
         return(json.dumps(parsed, indent=2, sort_keys=False))
 
 
@@ -552,7 +1056,10 @@ class XdIntervalType(XdAnyType):
     attribute.
     """
 
-    invlTypes = (int, Decimal, date, time, datetime, float)  # TODO: Add duration
+    __slots__ = ('_lower', '_upper', '_lower_included', '_upper_included', '_lower_bounded',
+                 '_upper_bounded', '_interval_units', '_units_id', '_interval_type', '_bool_strs')
+
+    invlTypes = frozenset({int, Decimal, date, time, datetime, float})  # TODO: Add duration
 
     def __init__(self, label: str, invltype: str):
         super().__init__(label)
@@ -566,6 +1073,7 @@ class XdIntervalType(XdAnyType):
         self._upper_bounded = True
         self._interval_units = None
         self._units_id = None
+        self._bool_strs = None
 
         if invltype in XdIntervalType.invlTypes:
             self._interval_type = invltype
@@ -580,15 +1088,13 @@ class XdIntervalType(XdAnyType):
         return self._lower
 
     @lower.setter
+    @_pre_pub
     def lower(self, v):
-        if not self.published:
-            v = self._interval_type(v)
-            if isinstance(v, self._interval_type):
-                self._lower = v
-            else:
-                raise ValueError("The value couldn't be coerced to the Interval type. v = " + str(type(v)) + " interval_type = " + str(self._interval_type))
+        v = self._interval_type(v)
+        if isinstance(v, self._interval_type):
+            self._lower = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The value couldn't be coerced to the Interval type. v = " + str(type(v)) + " interval_type = " + str(self._interval_type))
 
     @property
     def upper(self):
@@ -598,15 +1104,13 @@ class XdIntervalType(XdAnyType):
         return self._upper
 
     @upper.setter
+    @_pre_pub
     def upper(self, v):
-        if not self.published:
-            v = self._interval_type(v)
-            if isinstance(v, self._interval_type):
-                self._upper = v
-            else:
-                raise ValueError("The value couldn't be coerced to the Interval type. v = " + str(type(v)) + " interval_type = " + str(self._interval_type))
+        v = self._interval_type(v)
+        if isinstance(v, self._interval_type):
+            self._upper = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The value couldn't be coerced to the Interval type. v = " + str(type(v)) + " interval_type = " + str(self._interval_type))
 
     @property
     def lower_included(self):
@@ -617,14 +1121,12 @@ class XdIntervalType(XdAnyType):
         return self._lower_included
 
     @lower_included.setter
+    @_pre_pub
     def lower_included(self, v):
-        if not self.published:
-            if isinstance(v, bool):
-                self._lower_included = v
-            else:
-                raise ValueError("the lower_included value must be a Boolean.")
+        if isinstance(v, bool):
+            self._lower_included = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the lower_included value must be a Boolean.")
 
     @property
     def upper_included(self):
@@ -635,14 +1137,12 @@ class XdIntervalType(XdAnyType):
         return self._upper_included
 
     @upper_included.setter
+    @_pre_pub
     def upper_included(self, v):
-        if not self.published:
-            if isinstance(v, bool):
-                self._upper_included = v
-            else:
-                raise ValueError("the upper_included value must be a Boolean.")
+        if isinstance(v, bool):
+            self._upper_included = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the upper_included value must be a Boolean.")
 
     @property
     def lower_bounded(self):
@@ -653,14 +1153,12 @@ class XdIntervalType(XdAnyType):
         return self._lower_bounded
 
     @lower_bounded.setter
+    @_pre_pub
     def lower_bounded(self, v):
-        if not self.published:
-            if isinstance(v, bool):
-                self._lower_bounded = v
-            else:
-                raise ValueError("the lower_bounded value must be a Boolean.")
+        if isinstance(v, bool):
+            self._lower_bounded = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the lower_bounded value must be a Boolean.")
 
     @property
     def upper_bounded(self):
@@ -671,14 +1169,12 @@ class XdIntervalType(XdAnyType):
         return self._upper_bounded
 
     @upper_bounded.setter
+    @_pre_pub
     def upper_bounded(self, v):
-        if not self.published:
-            if isinstance(v, bool):
-                self._upper_bounded = v
-            else:
-                raise ValueError("the upper_bounded value must be a Boolean.")
+        if isinstance(v, bool):
+            self._upper_bounded = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the upper_bounded value must be a Boolean.")
 
     @property
     def interval_units(self):
@@ -693,14 +1189,26 @@ class XdIntervalType(XdAnyType):
         return self._interval_units
 
     @interval_units.setter
+    @_pre_pub
     def interval_units(self, v):
-        if not self.published:
-            if isinstance(v, tuple):
-                self._interval_units = v
-            else:
-                raise ValueError("the interval_units value must be a tuple.")
+        if isinstance(v, tuple):
+            self._interval_units = tuple(u.strip() for u in v)
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the interval_units value must be a tuple.")
+
+    def _freeze(self):
+        super()._freeze()
+        self._bool_strs = self._xsd_bools()
+
+    def _xsd_bools(self):
+        """
+        Return the included and bounded flags as XSD boolean strings, in the
+        order lower-included, upper-included, lower-bounded, upper-bounded.
+        """
+        if self._bool_strs is not None:
+            return self._bool_strs
+        return (_BOOL_XSD[self._lower_included], _BOOL_XSD[self._upper_included],
+                _BOOL_XSD[self._lower_bounded], _BOOL_XSD[self._upper_bounded])
 
     def validate(self):
         """
@@ -711,100 +1219,99 @@ class XdIntervalType(XdAnyType):
         else:
             return(True)
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-
         indent = 6
-        padding = ('').rjust(indent)
+        pad8 = _INDENTS[indent + 2]
+        pad10 = _INDENTS[indent + 4]
+        pad12 = _INDENTS[indent + 6]
+        pad14 = _INDENTS[indent + 8]
         # Convert the bools to XSD strings
-        li, ui, lb, ub = 'false', 'false', 'false', 'false'
-        if self._lower_included:
-            li = 'true'
-        if self._upper_included:
-            ui = 'true'
-        if self._lower_bounded:
-            lb = 'true'
-        if self._upper_bounded:
-            ub = 'true'
-        type_transpose = {int:'int', Decimal:'decimal', float:'float'}
-        xdstr = super().getModel()
+        li = _BOOL_XSD[self._lower_included]
+        ui = _BOOL_XSD[self._upper_included]
+        lb = _BOOL_XSD[self._lower_bounded]
+        ub = _BOOL_XSD[self._upper_bounded]
+        xstype = _TYPE_TRANSPOSE[self._interval_type]
+        super()._model_parts(parts)
 
         # XdInterval
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='0' name='lower' type='xs:{type_transpose[self._interval_type]}'/>\n")
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='0' name='upper' type='xs:{type_transpose[self._interval_type]}'/>\n")
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='lower-included' type='xs:boolean' fixed='{li}'/>\n")
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='upper-included' type='xs:boolean' fixed='{ui}'/>\n")
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='lower-bounded' type='xs:boolean' fixed='{lb}'/>\n")
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='upper-bounded' type='xs:boolean' fixed='{ub}'/>\n")
+        parts.append(f"{pad10}<xs:element maxOccurs='1' minOccurs='0' name='lower' type='xs:{xstype}'/>\n"
+                     f"{pad10}<xs:element maxOccurs='1' minOccurs='0' name='upper' type='xs:{xstype}'/>\n"
+                     f"{pad10}<xs:element maxOccurs='1' minOccurs='1' name='lower-included' type='xs:boolean' fixed='{li}'/>\n"
+                     f"{pad10}<xs:element maxOccurs='1' minOccurs='1' name='upper-included' type='xs:boolean' fixed='{ui}'/>\n"
+                     f"{pad10}<xs:element maxOccurs='1' minOccurs='1' name='lower-bounded' type='xs:boolean' fixed='{lb}'/>\n"
+                     f"{pad10}<xs:element maxOccurs='1' minOccurs='1' name='upper-bounded' type='xs:boolean' fixed='{ub}'/>\n")
 
         if self._interval_units:
             self._units_id = cuid()
-            xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='interval-units'  type='s3m:mc-{self._units_id}'/>\n")
+            parts.append(f"{pad10}<xs:element maxOccurs='1' minOccurs='1' name='interval-units'  type='s3m:mc-{self._units_id}'/>\n")
         else:
             self._units_id = None
 
-        xdstr += padding.rjust(indent + 4) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
+        parts.append(f"{pad10}</xs:sequence>\n"
+                     f"{pad10}</xs:restriction>\n"
+                     f"{pad8}</xs:complexContent>\n"
+                     f"{pad8}</xs:complexType>\n\n")
 
         # interval units
         if self._units_id:
-            xdstr += padding.rjust(indent + 2) + (f"<xs:complexType name='mc-{self._units_id}'>\n")
-            xdstr += padding.rjust(indent + 4) + ("<xs:complexContent>\n")
-            xdstr += padding.rjust(indent + 6) + ("<xs:restriction base='s3m:InvlUnits'>\n")
-            xdstr += padding.rjust(indent + 8) + ("<xs:sequence>\n")
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='units-name' type='xs:string' fixed='{self._interval_units[0].strip()}'/>\n")
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='units-uri' type='xs:anyURI' fixed='{self._interval_units[1].strip()}'/>\n")
-            xdstr += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-            xdstr += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-            xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-            xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        return(xdstr)
-
-    def getXMLInstance(self, example=False):
-        """
-        Return an example XML fragment for this model.
+            units_name, units_uri = self._interval_units
+            parts.append(f"{pad8}<xs:complexType name='mc-{self._units_id}'>\n"
+                         f"{pad10}<xs:complexContent>\n"
+                         f"{pad12}<xs:restriction base='s3m:InvlUnits'>\n"
+                         f"{pad14}<xs:sequence>\n"
+                         f"{pad14}<xs:element maxOccurs='1' minOccurs='1' name='units-name' type='xs:string' fixed='{units_name}'/>\n"
+                         f"{pad14}<xs:element maxOccurs='1' minOccurs='1' name='units-uri' type='xs:anyURI' fixed='{units_uri}'/>\n"
+                         f"{pad14}</xs:sequence>\n"
+                         f"{pad12}</xs:restriction>\n"
+                         f"{pad10}</xs:complexContent>\n"
+                         f"{pad8}</xs:complexType>\n\n")
+
+    def _instance_parts(self, parts, example):
+        """
+        Append the XML instance fragments to parts.
         """
-
-        if not self.published:
-            raise PublicationError("The model must first be published.")
-
         indent = 2
-        padding = ('').rjust(indent)
-
-        # Convert the bools to XSD strings
-        li, ui, lb, ub = 'true', 'true', 'true', 'true'
-        if not self.lower_included:
-            li = 'false'
-        if not self.upper_included:
-            ui = 'false'
-        if not self.lower_bounded:
-            lb = 'false'
-        if not self.upper_bounded:
-            ub = 'false'
-
-        xmlstr = super().getXMLInstance(example)
+        pad = _INDENTS[indent]
+        pad2 = _INDENTS[indent + 2]
+        pad4 = _INDENTS[indent + 4]
+
+        super()._instance_parts(parts, example)
+        li, ui, lb, ub = self._bool_strs
+        if self._lower is not None:
+            parts.append(f'{pad2}<lower>{self._lower}</lower>\n')
+        if self._upper is not None:
+            parts.append(f'{pad2}<upper>{self._upper}</upper>\n')
+        parts.append(f'{pad2}<lower-included>{li}</lower-included>\n'
+                     f'{pad2}<upper-included>{ui}</upper-included>\n'
+                     f'{pad2}<lower-bounded>{lb}</lower-bounded>\n'
+                     f'{pad2}<upper-bounded>{ub}</upper-bounded>\n')
+        if self._interval_units is not None:
+            parts.append(f'{pad2}<interval-units>\n'
+                         f'{pad4}  <units-name>{self._interval_units[0]}</units-name>\n'
+                         f'{pad4}  <units-uri>{self._interval_units[1]}</units-uri>\n'
+                         f'{pad2}</interval-units>\n')
+        parts.append(pad + self._close_tag)
+        if self._adapter:
+            parts.append(pad + self._adapter_close_tag)
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
         if self.lower is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<lower>{str(self.lower).strip()}</lower>\n'
+            d['lower'] = _text(self.lower)
         if self.upper is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<upper>{str(self.upper).strip()}</upper>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<lower-included>{li}</lower-included>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<upper-included>{ui}</upper-included>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<lower-bounded>{lb}</lower-bounded>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<upper-bounded>{ub}</upper-bounded>\n'
+            d['upper'] = _text(self.upper)
+        d['lower-included'], d['upper-included'], d['lower-bounded'], d['upper-bounded'] = self._xsd_bools()
         if self.interval_units is not None:
-            xmlstr += padding.rjust(indent + 2) + '<interval-units>\n'
-            xmlstr += padding.rjust(indent + 4) + f'  <units-name>{self.interval_units[0].strip()}</units-name>\n'
-            xmlstr += padding.rjust(indent + 4) + f'  <units-uri>{self.interval_units[1].strip()}</units-uri>\n'
-            xmlstr += padding.rjust(indent + 2) + '</interval-units>\n'
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
-        if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            d['interval-units'] = OrderedDict([('units-name', _text(self.interval_units[0])),
+                                               ('units-uri', _text(self.interval_units[1]))])
 
-        return(xmlstr)
+        return(d)
 
 
 class ReferenceRangeType(XdAnyType):
@@ -814,6 +1321,8 @@ class ReferenceRangeType(XdAnyType):
     May be used to represent high, low, normal, therapeutic, dangerous, critical, etc. ranges that are constrained by an interval.
     """
 
+    __slots__ = ('_definition', '_interval', '_is_normal', '_normal_str')
+
     def __init__(self, label):
         super().__init__(label)
 
@@ -821,6 +1330,7 @@ class ReferenceRangeType(XdAnyType):
         self._definition = ''
         self._interval = None
         self._is_normal = False
+        self._normal_str = 'false'
 
     @property
     def definition(self):
@@ -830,14 +1340,12 @@ class ReferenceRangeType(XdAnyType):
         return self._definition
 
     @definition.setter
+    @_pre_pub
     def definition(self, v):
-        if not self.published:
-            if checkers.is_string(v):
-                self._definition = v
-            else:
-                raise ValueError("the definition value must be a string.")
+        if isinstance(v, str):
+            self._definition = v.strip()
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the definition value must be a string.")
 
     @property
     def interval(self):
@@ -847,14 +1355,12 @@ class ReferenceRangeType(XdAnyType):
         return self._interval
 
     @interval.setter
+    @_pre_pub
     def interval(self, v):
-        if not self.published:
-            if isinstance(v, XdIntervalType):
-                self._interval = v
-            else:
-                raise ValueError("the interval value must be a XdIntervalType.")
+        if isinstance(v, XdIntervalType):
+            self._interval = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("the interval value must be a XdIntervalType.")
 
     @property
     def is_normal(self):
@@ -864,14 +1370,16 @@ class ReferenceRangeType(XdAnyType):
         return self._is_normal
 
     @is_normal.setter
+    @_pre_pub
     def is_normal(self, v):
-        if not self.published:
-            if isinstance(v, bool):
-                self._is_normal = v
-            else:
-                raise TypeError("the is_normal value must be a Boolean.")
+        if isinstance(v, bool):
+            self._is_normal = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("the is_normal value must be a Boolean.")
+
+    def _freeze(self):
+        super()._freeze()
+        self._normal_str = _BOOL_XSD[self._is_normal]
 
     def validate(self):
         """
@@ -882,79 +1390,88 @@ class ReferenceRangeType(XdAnyType):
         else:
             return(True)
 
-    def getModel(self):
+    def _nested_models(self):
+        return((self._interval,))
+
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
         indent = 6
-        padding = ('').rjust(indent)
-        normal = 'true' if self._is_normal else 'false'
+        pad2 = _INDENTS[indent + 2]
+        pad4 = _INDENTS[indent + 4]
 
-        xdstr = super().getModel()
         # ReferenceRange
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='definition' type='xs:string' fixed='{self.definition.strip()}'/>\n")
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='interval' type='s3m:mc-{self.interval.mcuid}'/> \n")
-        xdstr += padding.rjust(indent + 4) + (f"<xs:element maxOccurs='1' minOccurs='1' name='is-normal' type='xs:boolean' fixed='{str(self.is_normal).lower()}'/>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        xdstr += self.interval.getModel()
-
-        return(xdstr)
+        super()._model_parts(parts)
+        parts.append(f"{pad4}<xs:element maxOccurs='1' minOccurs='1' name='definition' type='xs:string' fixed='{self.definition}'/>\n"
+                     f"{pad4}<xs:element maxOccurs='1' minOccurs='1' name='interval' type='s3m:mc-{self.interval.mcuid}'/> \n"
+                     f"{pad4}<xs:element maxOccurs='1' minOccurs='1' name='is-normal' type='xs:boolean' fixed='{self._normal_str}'/>\n"
+                     f"{pad4}</xs:sequence>\n"
+                     f"{pad4}</xs:restriction>\n"
+                     f"{pad4}</xs:complexContent>\n"
+                     f"{pad2}</xs:complexType>\n\n")
 
-    def getXMLInstance(self, example=False):
+    def _instance_parts(self, parts, example):
         """
-        Return an example XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
         if example:
-            if not self.published:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
             # TODO: Create example
 
-        # Convert the interval bools to XSD strings
-        li, ui, lb, ub = 'true', 'true', 'true', 'true'
-        if not self.interval.lower_included:
-            li = 'false'
-        if not self.interval.upper_included:
-            ui = 'false'
-        if not self.interval.lower_bounded:
-            lb = 'false'
-        if not self.interval.upper_bounded:
-            ub = 'false'
-
-        normal = 'true' if self._is_normal else 'false'
+        iv = self._interval
+        li, ui, lb, ub = iv._xsd_bools()
+        normal = self._normal_str
 
         indent = 6
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-
-        xmlstr += padding.rjust(indent + 2) + f'<definition>{self.definition.strip()}</definition>\n'
-        xmlstr += padding.rjust(indent + 2) + '<interval>\n'
-        xmlstr += padding.rjust(indent + 4) + f'<label>{self.interval.label}</label>\n'
-        if self.interval.lower is not None:
-            xmlstr += padding.rjust(indent + 4) + f'<lower>{str(self.interval.lower).strip()}</lower>\n'
-        if self.interval.upper is not None:
-            xmlstr += padding.rjust(indent + 4) + f'<upper>{str(self.interval.upper).strip()}</upper>\n'
-        xmlstr += padding.rjust(indent + 4) + f'<lower-included>{li}</lower-included>\n'
-        xmlstr += padding.rjust(indent + 4) + f'<upper-included>{ui}</upper-included>\n'
-        xmlstr += padding.rjust(indent + 4) + f'<lower-bounded>{lb}</lower-bounded>\n'
-        xmlstr += padding.rjust(indent + 4) + f'<upper-bounded>{ub}</upper-bounded>\n'
-        if self.interval.interval_units is not None:
-            xmlstr += padding.rjust(indent + 4) + '<interval-units>\n'
-            xmlstr += padding.rjust(indent + 6) + f'<units-name>{self.interval.interval_units[0].strip()}</units-name>\n'
-            xmlstr += padding.rjust(indent + 6) + f'<units-uri>{self.interval.interval_units[1].strip()}</units-uri>\n'
-            xmlstr += padding.rjust(indent + 4) + '</interval-units>\n'
-        xmlstr += padding.rjust(indent + 2) + '</interval>\n'
-
-        xmlstr += padding.rjust(indent + 2) + f'<is-normal>{normal}</is-normal>\n'
-
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
-        if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
-
-
-        return(xmlstr)
+        super()._instance_parts(parts, example)
+
+        parts.append(_INDENTS[indent + 2] + f'<definition>{self._definition}</definition>\n')
+        parts.append(_INDENTS[indent + 2] + '<interval>\n')
+        parts.append(_INDENTS[indent + 4] + f'<label>{iv._label}</label>\n')
+        if iv._lower is not None:
+            parts.append(_INDENTS[indent + 4] + f'<lower>{iv._lower}</lower>\n')
+        if iv._upper is not None:
+            parts.append(_INDENTS[indent + 4] + f'<upper>{iv._upper}</upper>\n')
+        parts.append(_INDENTS[indent + 4] + f'<lower-included>{li}</lower-included>\n')
+        parts.append(_INDENTS[indent + 4] + f'<upper-included>{ui}</upper-included>\n')
+        parts.append(_INDENTS[indent + 4] + f'<lower-bounded>{lb}</lower-bounded>\n')
+        parts.append(_INDENTS[indent + 4] + f'<upper-bounded>{ub}</upper-bounded>\n')
+        if iv._interval_units is not None:
+            parts.append(_INDENTS[indent + 4] + '<interval-units>\n')
+            parts.append(_INDENTS[indent + 6] + f'<units-name>{iv._interval_units[0]}</units-name>\n')
+            parts.append(_INDENTS[indent + 6] + f'<units-uri>{iv._interval_units[1]}</units-uri>\n')
+            parts.append(_INDENTS[indent + 4] + '</interval-units>\n')
+        parts.append(_INDENTS[indent + 2] + '</interval>\n')
+
+        parts.append(_INDENTS[indent + 2] + f'<is-normal>{normal}</is-normal>\n')
+
+        parts.append(_INDENTS[indent] + self._close_tag)
+        if self._adapter:
+            parts.append(_INDENTS[indent] + self._adapter_close_tag)
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        d['definition'] = _text(self.definition)
+        iv = self.interval
+        ivl = OrderedDict()
+        ivl['label'] = _text(iv.label)
+        if iv.lower is not None:
+            ivl['lower'] = _text(iv.lower)
+        if iv.upper is not None:
+            ivl['upper'] = _text(iv.upper)
+        ivl['lower-included'], ivl['upper-included'], ivl['lower-bounded'], ivl['upper-bounded'] = iv._xsd_bools()
+        if iv.interval_units is not None:
+            ivl['interval-units'] = OrderedDict([('units-name', _text(iv.interval_units[0])),
+                                                 ('units-uri', _text(iv.interval_units[1]))])
+        d['interval'] = ivl
+        d['is-normal'] = 'true' if self._is_normal else 'false'
+
+        return(d)
 
 
 class XdBooleanType(XdAnyType):
@@ -979,6 +1496,10 @@ class XdBooleanType(XdAnyType):
     In any case, the choice set often has more than two values.
     """
 
+    __slots__ = ('_true_value', '_false_value', '_options')
+
+    _OPTION_KEYS = ('trues', 'falses')
+
     def __init__(self, label: str, opt: dict):
         """
         Create an instance of a XdBooleanType.
@@ -1015,16 +1536,14 @@ class XdBooleanType(XdAnyType):
         return self._true_value
 
     @true_value.setter
+    @_post_pub
     def true_value(self, v):
-        if self.published:
-            if v == None:
-                self._true_value = None
-            elif v in self._options['trues'] and self._false_value == None:
-                self._true_value = v
-            else:
-                raise ValueError("the true_value value must be in the options['trues'] list and the false_value must be None.")
+        if v is None:
+            self._true_value = None
+        elif v in self._options['trues'] and self._false_value is None:
+            self._true_value = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the true_value value must be in the options['trues'] list and the false_value must be None.")
 
     @property
     def false_value(self):
@@ -1035,16 +1554,14 @@ class XdBooleanType(XdAnyType):
         return self._false_value
 
     @false_value.setter
+    @_post_pub
     def false_value(self, v):
-        if self.published:
-            if v == None:
-                self._false_value = None
-            elif v in self._options['falses'] and self._true_value == None:
-                self._false_value = v
-            else:
-                raise ValueError("the false_value value must be in the options['falses'] list and the true_value must be None.")
+        if v is None:
+            self._false_value = None
+        elif v in self._options['falses'] and self._true_value is None:
+            self._false_value = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("the false_value value must be in the options['falses'] list and the true_value must be None.")
 
     def validate(self):
         """
@@ -1052,7 +1569,7 @@ class XdBooleanType(XdAnyType):
         """
         if not super(XdBooleanType, self).validate():
             return(False)
-        elif self._options == None:
+        elif self._options is None:
             raise ValidationError("Missing options dictionary.")
         elif not isinstance(self._options, dict) or not list(self._options.keys()) == ['trues', 'falses']:
             raise ValidationError("The options dictionary keys are invalid.")
@@ -1063,56 +1580,53 @@ class XdBooleanType(XdAnyType):
         else:
             return(True)
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        if not super(XdBooleanType, self).validate():
-            raise ValidationError(self.__class__.__name__ + ' : ' + self.label + " failed validation.")
-
-        xdstr = super().getModel()
+        super()._model_parts(parts)
 
         trues = self._options['trues']
         falses = self._options['falses']
         indent = 2
-        padding = ('').rjust(indent)
+        pad2 = _INDENTS[indent + 2]
+        pad4 = _INDENTS[indent + 4]
+        pad6 = _INDENTS[indent + 6]
+        pad8 = _INDENTS[indent + 8]
+        pad10 = _INDENTS[indent + 10]
+        pad12 = _INDENTS[indent + 12]
+        pad16 = _INDENTS[indent + 16]
         # XdBooleanType
-        xdstr += padding.rjust(indent + 8) + ("<xs:choice maxOccurs='1' minOccurs='1'>\n")
-        xdstr += padding.rjust(indent + 8) + ("<xs:element name='true-value'>\n")
-        xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 12) + ("<xs:restriction base='xs:string'>\n")
-        for n in range(len(trues)):
-            xdstr += padding.rjust(indent + 16) + (f"<xs:enumeration value='{trues[n].strip()}'/>\n")
-        xdstr += padding.rjust(indent + 12) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-        xdstr += padding.rjust(indent + 8) + ("<xs:element name='false-value'>\n")
-        xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 12) + ("<xs:restriction base='xs:string'>\n")
-        for n in range(len(falses)):
-            xdstr += padding.rjust(indent + 16) + (f"<xs:enumeration value='{falses[n].strip()}'/>\n")
-        xdstr += padding.rjust(indent + 12) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-
-        xdstr += padding.rjust(indent + 8) + ("</xs:choice>\n")
-
-        xdstr += padding.rjust(indent + 6) + '</xs:sequence>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:restriction>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:complexContent>\n'
-        xdstr += padding.rjust(indent) + '</xs:complexType>\n'
-
-        return(xdstr)
-
-    def getXMLInstance(self, example=False):
-        """
-        Return an XML fragment for this model.
+        parts.append(f"{pad8}<xs:choice maxOccurs='1' minOccurs='1'>\n"
+                     f"{pad8}<xs:element name='true-value'>\n"
+                     f"{pad10}<xs:simpleType>\n"
+                     f"{pad12}<xs:restriction base='xs:string'>\n")
+        parts.append(''.join(f"{pad16}<xs:enumeration value='{t.strip()}'/>\n" for t in trues))
+        parts.append(f"{pad12}</xs:restriction>\n"
+                     f"{pad10}</xs:simpleType>\n"
+                     f"{pad8}</xs:element>\n"
+                     f"{pad8}<xs:element name='false-value'>\n"
+                     f"{pad10}<xs:simpleType>\n"
+                     f"{pad12}<xs:restriction base='xs:string'>\n")
+        parts.append(''.join(f"{pad16}<xs:enumeration value='{t.strip()}'/>\n" for t in falses))
+        parts.append(f"{pad12}</xs:restriction>\n"
+                     f"{pad10}</xs:simpleType>\n"
+                     f"{pad8}</xs:element>\n"
+                     f"{pad8}</xs:choice>\n"
+                     f"{pad6}</xs:sequence>\n"
+                     f"{pad4}</xs:restriction>\n"
+                     f"{pad2}</xs:complexContent>\n"
+                     f"{_INDENTS[indent]}</xs:complexType>\n")
+
+    def _instance_parts(self, parts, example):
+        """
+        Append the XML instance fragments to parts.
         """
         if example:
-            if not self.published:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
             # randomly choose an option
-            tf = choice(list(self._options.keys()))
+            tf = choice(self._OPTION_KEYS)
             if tf == 'trues':
                 self.true_value = choice(self._options[tf])
             elif tf == 'falses':
@@ -1121,22 +1635,30 @@ class XdBooleanType(XdAnyType):
                 raise ValueError("Something bad happened selecting an example value.")
 
         indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
+        super()._instance_parts(parts, example)
 
-        if self.true_value is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<true-value>{self.true_value}</true-value>\n'
-        elif self.false_value is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<false-value>{self.false_value}</false-value>\n'
+        if self._true_value is not None:
+            parts.append(_INDENTS[indent + 2] + f'<true-value>{self._true_value}</true-value>\n')
+        elif self._false_value is not None:
+            parts.append(_INDENTS[indent + 2] + f'<false-value>{self._false_value}</false-value>\n')
         else:
-            xmlstr += padding.rjust(indent + 2) + '<!-- ** Missing required instance data. ** -->\n'
+            parts.append(_INDENTS[indent + 2] + '<!-- ** Missing required instance data. ** -->\n')
 
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
-        if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+        parts.append(_INDENTS[indent] + self._close_tag)
+        if self._adapter:
+            parts.append(_INDENTS[indent] + self._adapter_close_tag)
 
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        if self.true_value is not None:
+            d['true-value'] = _text(self.true_value)
+        elif self.false_value is not None:
+            d['false-value'] = _text(self.false_value)
 
-        return(xmlstr)
+        return(d)
 
 
 class XdLinkType(XdAnyType):
@@ -1153,6 +1675,11 @@ class XdLinkType(XdAnyType):
     'link'.
     """
 
+    __slots__ = ('_link', '_relation', '_relation_uri', '_fixed', '_link_escaped', '_relation_escaped',
+                 '_relation_uri_escaped')
+
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdAnyType._DEFAULT_CARDINALITY, 'relation_uri': _CARD_0_1, 'link': _CARD_0_1})
+
     def __init__(self, label: str):
         """
         The semantic label (name of the model) is required.
@@ -1163,8 +1690,10 @@ class XdLinkType(XdAnyType):
         self._link = ''
         self._relation = None
         self._relation_uri = None
-        self.cardinality = ('relation_uri', [0, 1])
-        self.cardinality = ('link', [0, 1])
+        # stripped and XML escaped values for the schema, kept current by the setters
+        self._link_escaped = ''
+        self._relation_escaped = None
+        self._relation_uri_escaped = None
 
     @property
     def fixed(self):
@@ -1177,14 +1706,12 @@ class XdLinkType(XdAnyType):
         return self._fixed
 
     @fixed.setter
+    @_pre_pub
     def fixed(self, v):
-        if not self.published:
-            if isinstance(v, bool):
-                self._fixed = v
-            else:
-                raise TypeError("the fixed value must be a boolean.")
+        if isinstance(v, bool):
+            self._fixed = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("the fixed value must be a boolean.")
 
     @property
     def link(self):
@@ -1195,13 +1722,16 @@ class XdLinkType(XdAnyType):
 
     @link.setter
     def link(self, v):
-        if checkers.is_string(v):
-            if self.published and not self.fixed:
+        if isinstance(v, str):
+            v = v.strip()
+            if self._published and not self.fixed:
                 self._link = v
-            elif not self.published and self.fixed:
+                self._link_escaped = escape(v)
+            elif not self._published and self.fixed:
                 self._link = v
+                self._link_escaped = escape(v)
             else:
-                raise ValueError("Cannot add the link. Published: " + str(self.published) + " Fixed: " + str(self.fixed))
+                raise ValueError("Cannot add the link. Published: " + str(self._published) + " Fixed: " + str(self.fixed))
         else:
             raise TypeError("the link value must be a string.")
 
@@ -1213,14 +1743,13 @@ class XdLinkType(XdAnyType):
         return self._relation
 
     @relation.setter
+    @_pre_pub
     def relation(self, v):
-        if not self.published:
-            if checkers.is_string(v):
-                self._relation = v
-            else:
-                raise TypeError("the relation value must be a string.")
+        if isinstance(v, str):
+            self._relation = v.strip()
+            self._relation_escaped = escape(self._relation)
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("the relation value must be a string.")
 
     @property
     def relation_uri(self):
@@ -1231,14 +1760,13 @@ class XdLinkType(XdAnyType):
         return self._relation_uri
 
     @relation_uri.setter
+    @_pre_pub
     def relation_uri(self, v):
-        if not self.published:
-            if checkers.is_url(v):
-                self._relation_uri = v
-            else:
-                raise TypeError("the relation_uri value must be a URL.")
+        if checkers.is_url(v):
+            self._relation_uri = v.strip()
+            self._relation_uri_escaped = escape(self._relation_uri)
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("the relation_uri value must be a URL.")
 
     def validate(self):
         """
@@ -1251,59 +1779,65 @@ class XdLinkType(XdAnyType):
         else:
             return(True)
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 2
-        padding = ('').rjust(indent)
 
-        xdstr = super().getModel()
-        # XdLinkType
-        if not self.fixed:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['link'][0])}' name='link' type='xs:anyURI'/>\n")
-        else:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='link' type='xs:anyURI' fixed='{escape(self.link.strip())}'/>\n")
         if not self.relation:
             raise ValueError("You must add a relationship.")
-        else:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='relation' type='xs:string' fixed='{escape(self.relation.strip())}'/>\n")
         if not self.relation_uri:
             raise ValueError("You must add a URI for the relationship location.")
+        pad8 = _INDENTS[indent + 8]
+        card = self._card_str
+        if not self.fixed:
+            link = f"<xs:element maxOccurs='1' minOccurs='{card['link']}' name='link' type='xs:anyURI'/>"
         else:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['relation_uri'][0])}' name='relation-uri' type='xs:anyURI' fixed='{escape(self.relation_uri.strip())}'/>\n")
-        xdstr += padding.rjust(indent + 6) + '</xs:sequence>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:restriction>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:complexContent>\n'
-        xdstr += padding.rjust(indent) + '</xs:complexType>\n'
+            link = f"<xs:element maxOccurs='1' minOccurs='1' name='link' type='xs:anyURI' fixed='{self._link_escaped}'/>"
 
-        return(xdstr)
+        # XdLinkType
+        super()._model_parts(parts)
+        parts.append(f"{pad8}{link}\n"
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='1' name='relation' type='xs:string' fixed='{self._relation_escaped}'/>\n"
+                     f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['relation_uri']}' name='relation-uri' type='xs:anyURI' fixed='{self._relation_uri_escaped}'/>\n"
+                     f"{_INDENTS[indent + 6]}</xs:sequence>\n"
+                     f"{_INDENTS[indent + 4]}</xs:restriction>\n"
+                     f"{_INDENTS[indent + 2]}</xs:complexContent>\n"
+                     f"{_INDENTS[indent]}</xs:complexType>\n")
 
-    def getXMLInstance(self, example=False):
+    def _instance_parts(self, parts, example):
         """
-        Return an example XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
-        if example == True:
-            if not self.published:
+        if example:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
             self.link = 'https://s3model.com/dmlib/dm-cjmuxu61q0000z98p91fewlhm'
             self.relation = 'Related Data Model'
             self.relation_uri = 'https://s3model.com/examples/related'
 
         indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
+        super()._instance_parts(parts, example)
 
-        xmlstr += padding.rjust(indent + 2) + f'<link>{self.link}</link>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<relation>{self.relation}</relation>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<relation-uri>{self.relation_uri}</relation-uri>\n'
+        parts.append(_INDENTS[indent + 2] + f'<link>{self._link}</link>\n')
+        parts.append(_INDENTS[indent + 2] + f'<relation>{self._relation}</relation>\n')
+        parts.append(_INDENTS[indent + 2] + f'<relation-uri>{self._relation_uri}</relation-uri>\n')
 
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
-        if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+        parts.append(_INDENTS[indent] + self._close_tag)
+        if self._adapter:
+            parts.append(_INDENTS[indent] + self._adapter_close_tag)
 
-        return(xmlstr)
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        d['link'] = _text(self.link)
+        d['relation'] = _text(self.relation)
+        d['relation-uri'] = _text(self.relation_uri)
+
+        return(d)
 
 
 class XdStringType(XdAnyType):
@@ -1313,6 +1847,11 @@ class XdStringType(XdAnyType):
     Additionally the minimum and maximum lengths may be set and regular expression patterns may be specified.
     """
 
+    __slots__ = ('_value', '_language', '_enums', '_regex', '_regex_compiled', '_default', '_length',
+                 '_default_escaped', '_enums_cache')
+
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdAnyType._DEFAULT_CARDINALITY, 'value': _CARD_0_1, 'language': _CARD_0_1})
+
     def __init__(self, label):
         """
         The semantic label (name of the model) is required.
@@ -1323,11 +1862,12 @@ class XdStringType(XdAnyType):
         self._value = None
         self._language = None
         self._enums = []
+        self._enums_cache = ()
         self._regex = None
+        self._regex_compiled = None
         self._default = None
+        self._default_escaped = None
         self._length = None
-        self.cardinality = ('value', [0, 1])
-        self.cardinality = ('language', [0, 1])
 
     @property
     def value(self):
@@ -1337,14 +1877,12 @@ class XdStringType(XdAnyType):
         return self._value
 
     @value.setter
+    @_post_pub
     def value(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._value = v
-            else:
-                raise TypeError("the value must be a string.")
+        if isinstance(v, str):
+            self._value = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the value must be a string.")
 
     @property
     def language(self):
@@ -1355,14 +1893,12 @@ class XdStringType(XdAnyType):
         return self._language
 
     @language.setter
+    @_post_pub
     def language(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._language = v
-            else:
-                raise TypeError("the language value must be a string.")
+        if isinstance(v, str):
+            self._language = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the language value must be a string.")
 
     @property
     def length(self):
@@ -1374,25 +1910,23 @@ class XdStringType(XdAnyType):
         return self._length
 
     @length.setter
+    @_pre_pub
     def length(self, v):
-        if not self.published:
-            if v == None:
+        if v is None:
+            self._length = v
+        else:
+            if len(self._enums) > 0 or self.regex is not None:
+                raise ValueError("The elements 'length', 'enums' and 'regex' are mutally exclusive.  Set length and regex to 'None' or enums to '[]'.")
+            if isinstance(v, int) and not isinstance(v, bool) and v >= 1:
+                self._length = v
+            elif isinstance(v, tuple) and len(v) == 2:
+                if not (v[0] is None or isinstance(v[0], int)) or not (v[1] is None or isinstance(v[1], int)):
+                    raise TypeError("The tuple must contain two values of either type, None or integers.")
+                elif v[0] is not None and v[1] is not None and v[0] > v[1]:
+                    raise ValueError("Minimum length must be smaller or equal to maximum length.")
                 self._length = v
             else:
-                if len(self._enums) > 0 or self.regex is not None:
-                    raise ValueError("The elements 'length', 'enums' and 'regex' are mutally exclusive.  Set length and regex to 'None' or enums to '[]'.")
-                if checkers.is_integer(v) and v >= 1:
-                    self._length = v
-                elif isinstance(v, tuple) and len(v) == 2:
-                    if not isinstance(v[0], (int, None)) or not isinstance(v[1], (int, None)):
-                        raise TypeError("The tuple must contain two values of either type, None or integers.")
-                    elif isinstance(v[0], int) and isinstance(v[1], int) and v[0] > v[1]:
-                        raise ValueError("Minimum length must be smaller or equal to maximum length.")
-                    self._length = v
-                else:
-                    raise TypeError("The length value must be an integer (exact length) or a tuple (min/max lengths).")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+                raise TypeError("The length value must be an integer (exact length) or a tuple (min/max lengths).")
 
     @property
     def regex(self):
@@ -1403,20 +1937,27 @@ class XdStringType(XdAnyType):
         return self._regex
 
     @regex.setter
+    @_pre_pub
     def regex(self, v):
-        if not self.published:
-            if v == None:
-                self._regex = v
-            elif checkers.is_string(v):
-                if len(self._enums) > 0 or self.length is not None:
-                    raise ValueError("The elements 'length', 'enums' and 'regex' are mutally exclusive.  Set length and regex to 'None' or enums to '[]'.")
-                try:
-                    re.compile(v)
-                    self._regex = v
-                except re.error:
-                    raise ValueError("The value is not a valid regular expression.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        if v is None:
+            self._regex = v
+            self._regex_compiled = None
+        elif isinstance(v, str):
+            if len(self._enums) > 0 or self.length is not None:
+                raise ValueError("The elements 'length', 'enums' and 'regex' are mutally exclusive.  Set length and regex to 'None' or enums to '[]'.")
+            try:
+                compiled = re.compile(v)
+            except re.error:
+                raise ValueError("The value is not a valid regular expression.")
+            self._regex = v
+            self._regex_compiled = compiled
+
+    @property
+    def regex_compiled(self):
+        """
+        The compiled form of regex, or None when no regex is set.
+        """
+        return self._regex_compiled
 
     @property
     def enums(self):
@@ -1430,27 +1971,25 @@ class XdStringType(XdAnyType):
         return self._enums
 
     @enums.setter
+    @_pre_pub
     def enums(self, v):
-        if not self.published:
-            if v == []:
-                self._enums = v
+        if v == []:
+            self._enums = v
 
-            if self.regex is not None or self.length is not None:
-                raise ValueError("The elements 'length', enums' and 'regex' are mutally exclusive. Set length and regex to 'None' or enums to '[]'.")
+        if self.regex is not None or self.length is not None:
+            raise ValueError("The elements 'length', enums' and 'regex' are mutally exclusive. Set length and regex to 'None' or enums to '[]'.")
 
-            if isinstance(v, list):
-                for enum in v:
-                    if not isinstance(enum, tuple):
-                        raise TypeError("The enumerations and definitions must be strings.")
+        if isinstance(v, list):
+            for enum in v:
+                if not isinstance(enum, tuple):
+                    raise TypeError("The enumerations and definitions must be strings.")
 
-                    if not isinstance(enum[0], str) or not isinstance(enum[1], str):
-                        raise TypeError("The enumerations and definitions must be strings.")
+                if not isinstance(enum[0], str) or not isinstance(enum[1], str):
+                    raise TypeError("The enumerations and definitions must be strings.")
 
-                self._enums = v
-            else:
-                raise TypeError("The enumerations must be a list of tuples.")
+            self._enums = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("The enumerations must be a list of tuples.")
 
     @property
     def default(self):
@@ -1460,16 +1999,26 @@ class XdStringType(XdAnyType):
         return self._default
 
     @default.setter
+    @_pre_pub
     def default(self, v):
-        if not self.published:
-            if v == None:
-                self._length = v
-            elif checkers.is_string(v):
-                self._default = v
-            else:
-                raise TypeError("The default value must be a string or None.")
+        if v is None:
+            self._default = v
+            self._default_escaped = None
+        elif isinstance(v, str):
+            self._default = v
+            self._default_escaped = escape(v)
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("The default value must be a string or None.")
+
+    def _freeze(self):
+        """
+        Cache the enumerations as (symbol, escaped symbol, quoted symbol,
+        definition), stripped, for getModel and the example values. Built here
+        rather than in the setter because the enums list can be filled in place.
+        """
+        super()._freeze()
+        self._enums_cache = tuple((sym, escape(sym), quote(sym), desc.strip())
+                                  for sym, desc in ((e[0].strip(), e[1]) for e in self._enums))
 
     def validate(self):
         """
@@ -1481,127 +2030,117 @@ class XdStringType(XdAnyType):
             return(True)
 
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        if not super(XdStringType, self).validate():
-            raise ValidationError(self.__class__.__name__ + ' : ' + self.label + " failed validation.")
-
         indent = 2
-        padding = ('').rjust(indent)
+        regex, length, default, enums, language = self._regex, self._length, self._default, self._enums, self._language
 
-        xdstr = super().getModel()
+        super()._model_parts(parts)
         # XdStringType
-        if isinstance(self.regex, str):
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}' name='xdstring-value'>\n")
-            xdstr += padding.rjust(indent + 12) + ("<xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 14) + ("<xs:restriction base='xs:string'>\n")
-            xdstr += padding.rjust(indent + 16) + (f"<xs:pattern value='{self.regex.strip()}'/>\n")
-            xdstr += padding.rjust(indent + 14) + ("</xs:restriction>\n")
-            xdstr += padding.rjust(indent + 12) + ("</xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:element>\n")
-        if self.length is not None:
-            if isinstance(self.length, int):
-                xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}' name='xdstring-value'>\n")
-                xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-                xdstr += padding.rjust(indent + 12) + ("<xs:restriction base='xs:string'>\n")
-                xdstr += padding.rjust(indent + 14) + (f"<xs:length value='{str(self.length).strip()}'/>\n")
-                xdstr += padding.rjust(indent + 12) + ("</xs:restriction>\n")
-                xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-                xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-            elif (self.length, tuple) and len(self.length) == 2:
-                xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}' name='xdstring-value'>\n")
-                xdstr += padding.rjust(indent + 12) + ("<xs:simpleType>\n")
-                xdstr += padding.rjust(indent + 14) + ("<xs:restriction base='xs:string'>\n")
-                if isinstance(self.length[0], int):
-                    xdstr += padding.rjust(indent + 16) + (f"<xs:minLength value='{str(self.length[0]).strip()}'/>\n")
-                if isinstance(self.length[1], int):
-                    xdstr += padding.rjust(indent + 16) + (f"<xs:maxLength value='{str(self.length[1]).strip()}'/>\n")
-                xdstr += padding.rjust(indent + 14) + ("</xs:restriction>\n")
-                xdstr += padding.rjust(indent + 12) + ("</xs:simpleType>\n")
-                xdstr += padding.rjust(indent + 10) + ("</xs:element>\n")
-        elif self.default is not None and self.regex is None and self.length is None:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}' name='xdstring-value' type='xs:string' default='" + escape(self.default) + "'/>\n")
-        elif self.default is None and self.regex is None and self.length is None and len(self.enums) == 0:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}' name='xdstring-value' type='xs:string'/>\n")
+        if isinstance(regex, str):
+            parts.append(_INDENTS[indent + 8] + f"<xs:element maxOccurs='1' minOccurs='{self._card_str['value']}' name='xdstring-value'>\n")
+            parts.append(_INDENTS[indent + 12] + "<xs:simpleType>\n")
+            parts.append(_INDENTS[indent + 14] + "<xs:restriction base='xs:string'>\n")
+            parts.append(_INDENTS[indent + 16] + f"<xs:pattern value='{regex.strip()}'/>\n")
+            parts.append(_INDENTS[indent + 14] + "</xs:restriction>\n")
+            parts.append(_INDENTS[indent + 12] + "</xs:simpleType>\n")
+            parts.append(_INDENTS[indent + 10] + "</xs:element>\n")
+        if length is not None:
+            _LENGTH_EMITTERS[type(length)](parts, indent, self._card_str['value'], length)
+        elif default is not None and regex is None and length is None:
+            parts.append(_INDENTS[indent + 8] + (f"<xs:element maxOccurs='1' minOccurs='{self._card_str['value']}' name='xdstring-value' type='xs:string' default='" + self._default_escaped + "'/>\n"))
+        elif default is None and regex is None and length is None and len(enums) == 0:
+            parts.append(_INDENTS[indent + 8] + f"<xs:element maxOccurs='1' minOccurs='{self._card_str['value']}' name='xdstring-value' type='xs:string'/>\n")
         else:
             pass
 
         # Process Enumerations
-        if len(self.enums) > 0:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}' name='xdstring-value'>\n")
-            xdstr += padding.rjust(indent + 12) + ("<xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 14) + ("<xs:restriction base='xs:string'>\n")
-            for n in range(len(self.enums)):
-                xdstr += padding.rjust(indent + 16) + (f"<xs:enumeration value='{escape(self.enums[n][0].strip())}'>\n")
-                xdstr += padding.rjust(indent + 16) + ("<xs:annotation>\n")
-                xdstr += padding.rjust(indent + 18) + ("<xs:appinfo>\n")
-                xdstr += padding.rjust(indent + 20) + (f"<rdfs:Class rdf:about='mc-{self.mcuid}/xdstring-value/{quote(self.enums[n][0].strip())}'>\n")
-                xdstr += padding.rjust(indent + 20) + (f"  <rdfs:subPropertyOf rdf:resource='mc-{self.mcuid}'/>\n")
-                xdstr += padding.rjust(indent + 20) + (f"  <rdfs:label>{self.enums[n][0].strip()}</rdfs:label>\n")
-                xdstr += padding.rjust(indent + 20) + (f"  <rdfs:isDefinedBy>{self.enums[n][1].strip()}</rdfs:isDefinedBy>\n")
-                xdstr += padding.rjust(indent + 20) + ("</rdfs:Class>\n")
-                xdstr += padding.rjust(indent + 18) + ("</xs:appinfo>\n")
-                xdstr += padding.rjust(indent + 16) + ("</xs:annotation>\n")
-                xdstr += padding.rjust(indent + 16) + ("</xs:enumeration>\n")
-            xdstr += padding.rjust(indent + 14) + ("</xs:restriction>\n")
-            xdstr += padding.rjust(indent + 12) + ("</xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:element>\n")
-
-        if self.language is not None and isinstance(self.language, str):
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['language'][0])}' name='xdstring-language' type='xs:language' default='{self.language}'/>\n")
-
-        xdstr += padding.rjust(indent + 6) + '</xs:sequence>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:restriction>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:complexContent>\n'
-        xdstr += padding.rjust(indent) + '</xs:complexType>\n'
-
-        return(xdstr)
-
-    def getXMLInstance(self, example=False):
-        """
-        Return an example XML fragment for this model.
-        """
-
-        if self.value == None and example == True:
-            if not self.published:
+        if len(enums) > 0:
+            parts.append(_INDENTS[indent + 8] + f"<xs:element maxOccurs='1' minOccurs='{self._card_str['value']}' name='xdstring-value'>\n")
+            parts.append(_INDENTS[indent + 12] + "<xs:simpleType>\n")
+            parts.append(_INDENTS[indent + 14] + "<xs:restriction base='xs:string'>\n")
+            mcuid = self._mcuid
+            pad16 = _INDENTS[indent + 16]
+            pad18 = _INDENTS[indent + 18]
+            pad20 = _INDENTS[indent + 20]
+            parts.append(''.join(f"{pad16}<xs:enumeration value='{sym_escaped}'>\n"
+                                 f"{pad16}<xs:annotation>\n"
+                                 f"{pad18}<xs:appinfo>\n"
+                                 f"{pad20}<rdfs:Class rdf:about='mc-{mcuid}/xdstring-value/{sym_quoted}'>\n"
+                                 f"{pad20}  <rdfs:subPropertyOf rdf:resource='mc-{mcuid}'/>\n"
+                                 f"{pad20}  <rdfs:label>{sym}</rdfs:label>\n"
+                                 f"{pad20}  <rdfs:isDefinedBy>{desc}</rdfs:isDefinedBy>\n"
+                                 f"{pad20}</rdfs:Class>\n"
+                                 f"{pad18}</xs:appinfo>\n"
+                                 f"{pad16}</xs:annotation>\n"
+                                 f"{pad16}</xs:enumeration>\n"
+                                 for sym, sym_escaped, sym_quoted, desc in self._enums_cache))
+            parts.append(_INDENTS[indent + 14] + "</xs:restriction>\n")
+            parts.append(_INDENTS[indent + 12] + "</xs:simpleType>\n")
+            parts.append(_INDENTS[indent + 10] + "</xs:element>\n")
+
+        if language is not None and isinstance(language, str):
+            parts.append(_INDENTS[indent + 8] + f"<xs:element maxOccurs='1' minOccurs='{self._card_str['language']}' name='xdstring-language' type='xs:language' default='{language}'/>\n")
+
+        parts.append(_INDENTS[indent + 6] + '</xs:sequence>\n')
+        parts.append(_INDENTS[indent + 4] + '</xs:restriction>\n')
+        parts.append(_INDENTS[indent + 2] + '</xs:complexContent>\n')
+        parts.append(_INDENTS[indent] + '</xs:complexType>\n')
+
+    def _instance_parts(self, parts, example):
+        """
+        Append the XML instance fragments to parts.
+        """
+
+        if self._value is None and example:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
-            if len(self.enums) > 0:
-                print("Has enums")
-                if self.default is not None:
-                    self.value = self.default
+            length, default = self._length, self._default
+            if len(self._enums) > 0:
+                if default is not None:
+                    self.value = default
                 else:
-                    self.value = choice(self.enums)[0]
-            elif isinstance(self.length, int):
-                self.value = 'w' * self.length
-            elif isinstance(self.length, tuple):
-                self.value = 'd' * self.length[0]  # insure to meet the minimum
-            elif self.default is not None:
-                self.value = self.default
-            elif self.regex is not None:
+                    self.value = choice(self._enums_cache)[0]
+            elif isinstance(length, int):
+                self.value = 'w' * length
+            elif isinstance(length, tuple):
+                self.value = 'd' * length[0]  # insure to meet the minimum
+            elif default is not None:
+                self.value = default
+            elif self._regex is not None:
                 try:
-                    self.value = exrex.getone(self.regex)
+                    self.value = exrex.getone(self._regex)
                 except:
                     self.value = "Could not generate a valid example for the regex."
             else:
                 self.value = 'Generated Default String'  # just a default when no other option applies
 
         indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-        if self.value == None:
+        super()._instance_parts(parts, example)
+        if self._value is None:
             self.value = 'A Default String'
-        xmlstr += padding.rjust(indent + 2) + f'<xdstring-value>{self.value}</xdstring-value>\n'
-        if self.language is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<xdstring-language>{self.language}</xdstring-language>\n'
+        pad2 = _INDENTS[indent + 2]
+        language = self._language
+        parts.append(f'{pad2}<xdstring-value>{self._value}</xdstring-value>\n')
+        if language is not None:
+            parts.append(f'{pad2}<xdstring-language>{language}</xdstring-language>\n')
 
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
+        parts.append(_INDENTS[indent] + self._close_tag)
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            parts.append(_INDENTS[indent] + self._adapter_close_tag)
 
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        d['xdstring-value'] = _text('A Default String' if self.value is None else self.value)
+        if self.language is not None:
+            d['xdstring-language'] = _text(self.language)
 
-        return(xmlstr)
+        return(d)
 
 
 class XdFileType(XdAnyType):
@@ -1613,6 +2152,11 @@ class XdFileType(XdAnyType):
     a URL to point to the content.
     """
 
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdAnyType._DEFAULT_CARDINALITY, 'size': _CARD_0_1, 'encoding': _CARD_0_1,
+                                             'language': _CARD_0_1, 'formalism': _CARD_0_1, 'media_type': _CARD_0_1,
+                                             'compression_type': _CARD_0_1, 'hash_result': _CARD_0_1,
+                                             'hash_function': _CARD_0_1, 'alt_txt': _CARD_0_1})
+
     def __init__(self, label: str):
         """
         The semantic label (name of the model) is required.
@@ -1634,16 +2178,6 @@ class XdFileType(XdAnyType):
         self._media_content = None
         self._content_type = 'uri'
 
-        self.cardinality = ('size', [0, 1])
-        self.cardinality = ('encoding', [0, 1])
-        self.cardinality = ('language', [0, 1])
-        self.cardinality = ('formalism', [0, 1])
-        self.cardinality = ('media_type', [0, 1])
-        self.cardinality = ('compression_type', [0, 1])
-        self.cardinality = ('hash_result', [0, 1])
-        self.cardinality = ('hash_function', [0, 1])
-        self.cardinality = ('alt_txt', [0, 1])
-
     @property
     def content_type(self):
         """
@@ -1654,14 +2188,12 @@ class XdFileType(XdAnyType):
         return self._content_type
 
     @content_type.setter
+    @_pre_pub
     def content_type(self, v: str):
-        if not self.published:
-            if v.lower() in ('uri', 'embed'):
-                self._content_type = v.lower()
-            else:
-                raise TypeError("The content_type value must be an a string and one of 'uri' or 'embed'.")
+        if v.lower() in ('uri', 'embed'):
+            self._content_type = v.lower()
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("The content_type value must be an a string and one of 'uri' or 'embed'.")
 
     @property
     def size(self):
@@ -1672,14 +2204,12 @@ class XdFileType(XdAnyType):
         return self._size
 
     @size.setter
+    @_post_pub
     def size(self, v):
-        if self.published:
-            if checkers.is_integer(v):
-                self._size = v
-            else:
-                raise TypeError("The size value must be an integer.")
+        if isinstance(v, int) and not isinstance(v, bool):
+            self._size = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("The size value must be an integer.")
 
     @property
     def encoding(self):
@@ -1696,14 +2226,12 @@ class XdFileType(XdAnyType):
         return self._encoding
 
     @encoding.setter
+    @_post_pub
     def encoding(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._encoding = v
-            else:
-                raise TypeError("the encoding value must be a string.")
+        if isinstance(v, str):
+            self._encoding = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the encoding value must be a string.")
 
     @property
     def language(self):
@@ -1716,14 +2244,12 @@ class XdFileType(XdAnyType):
         return self._language
 
     @language.setter
+    @_post_pub
     def language(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._language = v
-            else:
-                raise TypeError("the language value must be a string.")
+        if isinstance(v, str):
+            self._language = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the language value must be a string.")
 
     @property
     def formalism(self):
@@ -1736,14 +2262,12 @@ class XdFileType(XdAnyType):
         return self._formalism
 
     @formalism.setter
+    @_post_pub
     def formalism(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._formalism = v
-            else:
-                raise TypeError("the formalism value must be a string.")
+        if isinstance(v, str):
+            self._formalism = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the formalism value must be a string.")
 
     @property
     def media_type(self):
@@ -1756,14 +2280,12 @@ class XdFileType(XdAnyType):
         return self._media_type
 
     @media_type.setter
+    @_post_pub
     def media_type(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._media_type = v
-            else:
-                raise TypeError("the media_type value must be a string.")
+        if isinstance(v, str):
+            self._media_type = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the media_type value must be a string.")
 
     @property
     def compression_type(self):
@@ -1779,14 +2301,12 @@ class XdFileType(XdAnyType):
         return self._compression_type
 
     @compression_type.setter
+    @_post_pub
     def compression_type(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._compression_type = v
-            else:
-                raise TypeError("the compression_type value must be a string.")
+        if isinstance(v, str):
+            self._compression_type = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the compression_type value must be a string.")
 
     @property
     def hash_result(self):
@@ -1801,14 +2321,12 @@ class XdFileType(XdAnyType):
         return self._hash_result
 
     @hash_result.setter
+    @_post_pub
     def hash_result(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._hash_result = v
-            else:
-                raise TypeError("the hash_result value must be a string.")
+        if isinstance(v, str):
+            self._hash_result = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the hash_result value must be a string.")
 
     @property
     def hash_function(self):
@@ -1820,14 +2338,12 @@ class XdFileType(XdAnyType):
         return self._hash_function
 
     @hash_function.setter
+    @_post_pub
     def hash_function(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._hash_function = v
-            else:
-                raise TypeError("the hash_function value must be a string.")
+        if isinstance(v, str):
+            self._hash_function = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the hash_function value must be a string.")
 
     @property
     def alt_txt(self):
@@ -1837,14 +2353,12 @@ class XdFileType(XdAnyType):
         return self._alt_txt
 
     @alt_txt.setter
+    @_post_pub
     def alt_txt(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._alt_txt = v
-            else:
-                raise TypeError("the alt_txt value must be a string.")
+        if isinstance(v, str):
+            self._alt_txt = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the alt_txt value must be a string.")
 
     @property
     def uri(self):
@@ -1855,16 +2369,14 @@ class XdFileType(XdAnyType):
         return self._uri
 
     @uri.setter
+    @_post_pub
     def uri(self, v):
-        if self.published:
-            if v == None:
-                self._uri = v
-            elif self._media_content == None and isinstance(v, (str)):
-                self._uri = v
-            else:
-                raise TypeError("the uri value must be a URL and media_content must be None.")
+        if v is None:
+            self._uri = v
+        elif self._media_content is None and isinstance(v, (str)):
+            self._uri = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the uri value must be a URL and media_content must be None.")
 
     @property
     def media_content(self):
@@ -1876,21 +2388,25 @@ class XdFileType(XdAnyType):
         base64 encoded.
 
         If it is already bytes then it is just encoded.
+
+        The encoded content is stored and returned as an ASCII string.
         """
         return self._media_content
 
     @media_content.setter
+    @_post_pub
     def media_content(self, v):
-        if self.published:
-            if self._uri == None:
-                if isinstance(v, (bytes, type(None))):
-                    self._media_content = v
-                else:
-                    raise ValueError("the media_content value must be a bytes object that is Base64 encoded.")
+        if self._uri is None:
+            if isinstance(v, str):
+                v = v.encode('utf-8')
+            if isinstance(v, bytes):
+                self._media_content = b64encode(v).decode('ascii')
+            elif v is None:
+                self._media_content = None
             else:
-                raise TypeError("uri must be None to assign media_content.")
+                raise ValueError("the media_content value must be a bytes or string object.")
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("uri must be None to assign media_content.")
 
     def validate(self):
         """
@@ -1901,46 +2417,36 @@ class XdFileType(XdAnyType):
         else:
             return(True)
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 2
-        padding = ('').rjust(indent)
-
-        xdstr = super().getModel()
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['size'][0])}' name='size' type='xs:int'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['encoding'][0])}' name='encoding' type='xs:string'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['language'][0])}' name='xdfile-language' type='xs:language'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['formalism'][0])}' name='formalism' type='xs:string'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['media_type'][0])}' name='media-type' type='xs:string'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['compression_type'][0])}' name='compression-type' type='xs:string'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['hash_result'][0])}' name='hash-result' type='xs:string'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['hash_function'][0])}' name='hash-function' type='xs:string'/>\n"
-        xdstr += padding.rjust(indent + 8) + f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['alt_txt'][0])}' name='alt-txt' type='xs:string'/>\n"
+
+        super()._model_parts(parts)
+        pad8 = _INDENTS[indent + 8]
+        for key, name, xstype in _FILE_FIELDS:
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{self._card_str[key]}' name='{name}' type='{xstype}'/>\n")
 
         if self.content_type == 'uri':
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" name="uri" type="xs:anyURI"/>\n'
+            parts.append(_INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" name="uri" type="xs:anyURI"/>\n')
         elif self.content_type == 'embed':
-            xdstr += padding.rjust(indent + 8) + '<xs:element maxOccurs="1" minOccurs="1" name="media-content" type="xs:base64Binary"/>\n'
+            parts.append(_INDENTS[indent + 8] + '<xs:element maxOccurs="1" minOccurs="1" name="media-content" type="xs:base64Binary"/>\n')
         else:
             raise ValueError("The content_type for the model must be specified as 'uri' or 'embed'.")
 
-        xdstr += padding.rjust(indent + 6) + '</xs:sequence>\n'
-        xdstr += padding.rjust(indent + 4) + '</xs:restriction>\n'
-        xdstr += padding.rjust(indent + 2) + '</xs:complexContent>\n'
-        xdstr += padding.rjust(indent) + '</xs:complexType>\n\n'
+        parts.append(_INDENTS[indent + 6] + '</xs:sequence>\n')
+        parts.append(_INDENTS[indent + 4] + '</xs:restriction>\n')
+        parts.append(_INDENTS[indent + 2] + '</xs:complexContent>\n')
+        parts.append(_INDENTS[indent] + '</xs:complexType>\n\n')
 
-        return(xdstr)
-
-    def getXMLInstance(self, example=False):
+    def _instance_parts(self, parts, example):
         """
-        Return an example XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
 
-        if example == True:
-            if not self.published:
+        if example:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
             self.size = randint(1, 1000000000)
             self.encoding = 'UTF-8'
@@ -1954,50 +2460,54 @@ class XdFileType(XdAnyType):
             self.uri = 'https://www.s3model.com/ns/s3m/s3model_3_1_0.xsd'
 
         indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-        if self.size is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<size>{str(self.size)}</size>\n'
-        if self.encoding is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<encoding>{self.encoding.strip()}</encoding>\n'
-        if self.language is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<xdfile-language>{self.language.strip()}</xdfile-language>\n'
-        if self.formalism is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<formalism>{self.formalism.strip()}</formalism>\n'
-        if self.media_type is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<media-type>{self.media_type.strip()}</media-type>\n'
-        if self.compression_type is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<compression-type>{self.compression_type.strip()}</compression-type>\n'
-        if self.hash_result is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<hash-result>{self.hash_result.strip()}</hash-result>\n'
-        if self.hash_function is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<hash-function>{self.hash_function.strip()}</hash-function>\n'
-        if self.alt_txt is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<alt-txt>{self.alt_txt.strip()}</alt-txt>\n'
+        super()._instance_parts(parts, example)
+        pad2 = _INDENTS[indent + 2]
+        for key, name, _ in _FILE_FIELDS:
+            v = getattr(self, key)
+            if v is not None:
+                parts.append(f'{pad2}<{name}>{str(v).strip()}</{name}>\n')
+        uri, media_content = self._uri, self._media_content
+        if uri is not None:
+            parts.append(f'{pad2}<uri>{uri.strip()}</uri>\n')
+        elif media_content is not None:
+            parts.append(f'{pad2}<media-content>{media_content}</media-content>\n')
+
+        parts.append(_INDENTS[indent] + self._close_tag)
+        if self.adapter:
+            parts.append(_INDENTS[indent] + self._adapter_close_tag)
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        for key, name, _ in _FILE_FIELDS:
+            v = getattr(self, key)
+            if v is not None:
+                d[name] = _text(v)
         if self.uri is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<uri>{self.uri.strip()}</uri>\n'
+            d['uri'] = _text(self.uri)
         elif self.media_content is not None:
-            xmlstr += padding.rjust(indent + 2) + f'<media-content>{str(self.media_content)}</media-content>\n'
+            d['media-content'] = _text(self.media_content)
 
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
-        if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
-
-        return(xmlstr)
+        return(d)
 
 
 class XdOrderedType(XdAnyType):
     """
     Serves as an abstract common ancestor of all ordered types
     """
+
+    __slots__ = ('_referenceranges', '_normal_status')
+
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdAnyType._DEFAULT_CARDINALITY, 'referencerange': _CARD_0_INF, 'normal_status': _CARD_0_1})
+
     @abstractmethod
     def __init__(self, label):
         super().__init__(label)
 
         self._referenceranges = []
         self._normal_status = None
-        self.cardinality = ('referencerange', [0, None])
-        self.cardinality = ('normal_status', [0, 1])
 
     @property
     def referenceranges(self):
@@ -2008,13 +2518,11 @@ class XdOrderedType(XdAnyType):
         return self._referenceranges
 
     @referenceranges.setter
+    @_pre_pub
     def referenceranges(self, v):
-        if not self.published:
-            if not checkers.is_type(v, "ReferenceRangeType"):
-                raise TypeError("The referencerange value must be a ReferenceRangeType.")
-            self.referenceranges.append(v)
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        if not checkers.is_type(v, "ReferenceRangeType"):
+            raise TypeError("The referencerange value must be a ReferenceRangeType.")
+        self.referenceranges.append(v)
 
     @property
     def normal_status(self):
@@ -2028,14 +2536,12 @@ class XdOrderedType(XdAnyType):
         return self._normal_status
 
     @normal_status.setter
+    @_post_pub
     def normal_status(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._normal_status = v
-            else:
-                raise TypeError("the normal_status value must be a string.")
+        if isinstance(v, str):
+            self._normal_status = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the normal_status value must be a string.")
 
     def validate(self):
         """
@@ -2046,44 +2552,51 @@ class XdOrderedType(XdAnyType):
         else:
             return(True)
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 4
-        padding = ('').rjust(indent)
+        pad6 = _INDENTS[indent + 6]
 
-        xdstr = super().getModel()
+        super()._model_parts(parts)
         # XdOrdered
         if len(self.referenceranges) > 0:
             for rr in self.referenceranges:
-                xdstr += padding.rjust(indent + 6) + f"<xs:element maxOccurs='1' minOccurs='1' ref='s3m:ms-{rr.mcuid}'/> \n"
+                parts.append(f"{pad6}<xs:element maxOccurs='1' minOccurs='1' ref='s3m:ms-{rr.mcuid}'/> \n")
         if self.normal_status is not None:
-            xdstr += padding.rjust(indent + 6) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['normal_status'][0])}' name='normal-status' type='xs:string' fixed='{escape(self.normal_status.strip())}'/> \n")
+            parts.append(f"{pad6}<xs:element maxOccurs='1' minOccurs='{self._card_str['normal_status']}' name='normal-status' type='xs:string' fixed='{escape(self.normal_status.strip())}'/> \n")
         else:
-            xdstr += padding.rjust(indent + 6) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['normal_status'][0])}' name='normal-status' type='xs:string'/> \n")
+            parts.append(f"{pad6}<xs:element maxOccurs='1' minOccurs='{self._card_str['normal_status']}' name='normal-status' type='xs:string'/> \n")
 
-        return(xdstr)
-
-    def getXMLInstance(self, example=False):
+    def _instance_parts(self, parts, example):
         """
-        Return an example XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
-        if example == True:
+        if example:
             self._referenceranges = [] # TODO: Build a reference range
             self.normal_status = 'normal'
 
         indent = 4
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
+        pad = _INDENTS[indent]
+        super()._instance_parts(parts, example)
         if len(self.referenceranges) > 0:
             for rr in self.referenceranges:
-                xmlstr += rr.getXMLInstance()
+                parts.append(rr.getXMLInstance())
+        if self.normal_status is not None:
+            parts.append(f'{pad}<normal-status>{self.normal_status}</normal-status>\n')
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        for rr in self.referenceranges:
+            d.update(rr._element_dict())
         if self.normal_status is not None:
-            xmlstr += padding.rjust(indent) + f'<normal-status>{self.normal_status}</normal-status>\n'
+            d['normal-status'] = _text(self.normal_status)
 
-        return(xmlstr)
+        return(d)
 
 
 class XdOrdinalType(XdOrderedType):
@@ -2127,6 +2640,8 @@ class XdOrdinalType(XdOrderedType):
         self._ordinal = None
         self._symbol = None
         self._choices = choices
+        self._ordinal_facets = None
+        self._ordinal_keys = None
 
     @property
     def ordinal(self):
@@ -2139,14 +2654,12 @@ class XdOrdinalType(XdOrderedType):
         return self._ordinal
 
     @ordinal.setter
+    @_post_pub
     def ordinal(self, v):
-        if self.published:
-            if checkers.is_decimal(v):
-                self._ordinal = v
-            else:
-                raise TypeError("the ordinal value must be a decimal.")
+        if checkers.is_decimal(v):
+            self._ordinal = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the ordinal value must be a decimal.")
 
     @property
     def symbol(self):
@@ -2159,14 +2672,12 @@ class XdOrdinalType(XdOrderedType):
         return self._symbol
 
     @symbol.setter
+    @_post_pub
     def symbol(self, v):
-        if self.published:
-            if checkers.is_string(v):
-                self._symbol = v
-            else:
-                raise TypeError("the symbol value must be a string.")
+        if isinstance(v, str):
+            self._symbol = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("the symbol value must be a string.")
 
     @property
     def choices(self):
@@ -2181,24 +2692,23 @@ class XdOrdinalType(XdOrderedType):
         return self._choices
 
     @choices.setter
+    @_pre_pub
     def choices(self, v):
-        if not self.published:
-            if isinstance(v, dict):
-                for k in v.keys():
-                    if not isinstance(v[k], tuple) or len(v[k]) != 2:
-                        raise TypeError("the item must be a 2 member tuple.")
-                    if not isinstance(k, numbers.Number):
-                        raise TypeError("the key must be a number.")
-                    if not isinstance(v[k][1], str):
-                        raise TypeError("the first member must be a string.")
-                    if not isinstance(v[k][2], str):
-                        raise TypeError("the second member must be a string (URI/URL).")
-
-                self._choices = v
-            else:
-                raise TypeError("the choices value must be a dictionary.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        if isinstance(v, dict):
+            for k, item in v.items():
+                if not isinstance(item, tuple) or len(item) != 2:
+                    raise TypeError("the item must be a 2 member tuple.")
+                sym, url = item
+                if not isinstance(k, numbers.Number):
+                    raise TypeError("the key must be a number.")
+                if not isinstance(sym, str):
+                    raise TypeError("the first member must be a string.")
+                if not isinstance(url, str):
+                    raise TypeError("the second member must be a string (URI/URL).")
+
+            self._choices = v
+        else:
+            raise TypeError("the choices value must be a dictionary.")
 
     def validate(self):
         """
@@ -2209,77 +2719,101 @@ class XdOrdinalType(XdOrderedType):
         else:
             return(True)
 
-    def getModel(self):
+    def _freeze(self):
         """
-        Return a XML Schema complexType definition.
+        Build the ordinal and symbol element definitions from the sorted
+        choices and keep the ordinals for examples; the choices cannot change
+        after publication.
         """
-        self.validate()
+        super()._freeze()
         indent = 2
-        padding = ('').rjust(indent)
-        xdstr = super().getModel()
-
-        ords = list(self._choices.keys())
-        ords.sort()
+        choices = self._choices
+        self._ordinal_keys = tuple(choices)
+        mcuid = self._mcuid
+        ords = sorted(choices)
+        facets = []
 
         # XdOrdinal
-        xdstr += padding.rjust(indent + 10) + ("<xs:element maxOccurs='1' minOccurs='1' name='ordinal'>\n")
-        xdstr += padding.rjust(indent + 12) + ("<xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 12) + ("<xs:restriction base='xs:decimal'>\n")
+        facets.append(_INDENTS[indent + 10] + "<xs:element maxOccurs='1' minOccurs='1' name='ordinal'>\n")
+        facets.append(_INDENTS[indent + 12] + "<xs:simpleType>\n")
+        facets.append(_INDENTS[indent + 12] + "<xs:restriction base='xs:decimal'>\n")
+        pad14 = _INDENTS[indent + 14]
+        facets.append(''.join([f"{pad14}<xs:enumeration value='{k}'/>\n" for k in ords]))
+        facets.append(_INDENTS[indent + 12] + "</xs:restriction>\n")
+        facets.append(_INDENTS[indent + 12] + "</xs:simpleType>\n")
+        facets.append(_INDENTS[indent + 10] + "</xs:element>\n")
+
+        facets.append(_INDENTS[indent + 10] + "<xs:element maxOccurs='1' minOccurs='1' name='symbol'>\n")
+        facets.append(_INDENTS[indent + 12] + "<xs:simpleType>\n")
+        facets.append(_INDENTS[indent + 14] + "<xs:restriction base='xs:string'>\n")
+        pad16 = _INDENTS[indent + 16]
+        pad18 = _INDENTS[indent + 18]
+        pad20 = _INDENTS[indent + 20]
+        # (symbol, quoted symbol, quoted definition URI), stripped, in ordinal order
+        symbols = []
         for k in ords:
-            xdstr += padding.rjust(indent + 14) + (f"<xs:enumeration value='{str(k).strip()}'/>\n")
-        xdstr += padding.rjust(indent + 12) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 12) + ("</xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:element>\n")
-
-        xdstr += padding.rjust(indent + 10) + ("<xs:element maxOccurs='1' minOccurs='1' name='symbol'>\n")
-        xdstr += padding.rjust(indent + 12) + ("<xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 14) + ("<xs:restriction base='xs:string'>\n")
-        for k in ords:
-            xdstr += padding.rjust(indent + 16) + (f"<xs:enumeration value='{str(self.choices[k][0]).strip()}'>\n")
-            xdstr += padding.rjust(indent + 16) + ("<xs:annotation>\n")
-            xdstr += padding.rjust(indent + 18) + ("<xs:appinfo>\n")
-            xdstr += padding.rjust(indent + 18) + (f"<rdfs:Class rdf:about='mc-{self.mcuid}/symbol/{quote(str(self.choices[k][0]).strip())}'>\n")
-            xdstr += padding.rjust(indent + 20) + (f"<rdfs:isDefinedBy rdf:resource='{quote(str(self.choices[k][1]).strip())}'/>\n")
-            xdstr += padding.rjust(indent + 18) + ("</rdfs:Class>\n")
-            xdstr += padding.rjust(indent + 18) + ("</xs:appinfo>\n")
-            xdstr += padding.rjust(indent + 16) + ("</xs:annotation>\n")
-            xdstr += padding.rjust(indent + 16) + ("</xs:enumeration>\n")
-        xdstr += padding.rjust(indent + 14) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 12) + ("</xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:element>\n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-
-        return(xdstr)
+            sym, url = choices[k]
+            sym = str(sym).strip()
+            symbols.append((sym, quote(sym), quote(str(url).strip())))
+        facets.append(''.join([f"{pad16}<xs:enumeration value='{sym}'>\n"
+                               f"{pad16}<xs:annotation>\n"
+                               f"{pad18}<xs:appinfo>\n"
+                               f"{pad18}<rdfs:Class rdf:about='mc-{mcuid}/symbol/{qsym}'>\n"
+                               f"{pad20}<rdfs:isDefinedBy rdf:resource='{qurl}'/>\n"
+                               f"{pad18}</rdfs:Class>\n"
+                               f"{pad18}</xs:appinfo>\n"
+                               f"{pad16}</xs:annotation>\n"
+                               f"{pad16}</xs:enumeration>\n"
+                               for sym, qsym, qurl in symbols]))
+        facets.append(_INDENTS[indent + 14] + "</xs:restriction>\n")
+        facets.append(_INDENTS[indent + 12] + "</xs:simpleType>\n")
+        facets.append(_INDENTS[indent + 10] + "</xs:element>\n")
+        self._ordinal_facets = ''.join(facets)
 
-    def getXMLInstance(self, example=False):
+    def _model_parts(self, parts):
+        """
+        Append the XML Schema complexType definition fragments to parts.
+        """
+        super()._model_parts(parts)
+
+        parts.append(self._ordinal_facets)
+        parts.append(_ORDERED_MODEL_CLOSE)
+
+    def _instance_parts(self, parts, example):
         """
-        Return an example XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
-        if example == True:
-            if not self.published:
+        if example:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
-            c = choice(list(self._choices.keys()))
+            c = choice(self._ordinal_keys)
             self.ordinal = str(c)
             self.symbol = self._choices[c][0]
         else:
-            if self.ordinal in list(self._choices.keys()):
+            if self.ordinal in self._choices:
                 self.symbol = self._choices[self.ordinal][0]
             else:
                 raise ValueError(str(self.ordinal) + " is not a valid ordinal.")
 
         indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-        xmlstr += padding.rjust(indent + 2) + f'<ordinal>{str(self.ordinal)}</ordinal>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<symbol>{self.symbol}</symbol>\n'
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
+        super()._instance_parts(parts, example)
+        parts.append(_INDENTS[indent + 2] + f'<ordinal>{self.ordinal}</ordinal>\n')
+        parts.append(_INDENTS[indent + 2] + f'<symbol>{self.symbol}</symbol>\n')
+        parts.append(_INDENTS[indent] + self._close_tag)
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            parts.append(_INDENTS[indent] + self._adapter_close_tag)
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        if self.ordinal not in self._choices:
+            raise ValueError(str(self.ordinal) + " is not a valid ordinal.")
+        d = super()._asdict()
+        d['ordinal'] = _text(self.ordinal)
+        d['symbol'] = _text(self._choices[self.ordinal][0])
 
-        return(xmlstr)
+        return(d)
 
 
 class XdQuantifiedType(XdOrderedType):
@@ -2287,15 +2821,17 @@ class XdQuantifiedType(XdOrderedType):
     Serves as an abstract common ancestor of all quantifiable types
     """
 
+    __slots__ = ('_magnitude_status', '_error', '_accuracy')
+
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdOrderedType._DEFAULT_CARDINALITY, 'magnitude_status': _CARD_0_1,
+                                             'error': _CARD_0_1, 'accuracy': _CARD_0_1})
+
     def __init__(self, label):
         super().__init__(label)
 
         self._magnitude_status = ''
         self._error = None
         self._accuracy = None
-        self.cardinality = ('magnitude_status', [0, 1])
-        self.cardinality = ('error', [0, 1])
-        self.cardinality = ('accuracy', [0, 1])
 
     @property
     def magnitude_status(self):
@@ -2307,14 +2843,12 @@ class XdQuantifiedType(XdOrderedType):
         return self._magnitude_status
 
     @magnitude_status.setter
+    @_post_pub
     def magnitude_status(self, v):
-        if self.published:
-            if isinstance(v, (str, None)) and v in [None, 'equal', 'less_than', 'greater_than', 'less_than_or_equal', 'greater_than_or_equal', 'approximate']:
-                self._magnitude_status = v
-            else:
-                raise ValueError("The magnitude_status value must be one of: None,'equal','less_than', 'greater_than', 'less_than_or_equal', 'greater_than_or_equal', 'approximate'.")
+        if (v is None or isinstance(v, str)) and v in _MAG_STATUS:
+            self._magnitude_status = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The magnitude_status value must be one of: None,'equal','less_than', 'greater_than', 'less_than_or_equal', 'greater_than_or_equal', 'approximate'.")
 
     @property
     def error(self):
@@ -2325,14 +2859,12 @@ class XdQuantifiedType(XdOrderedType):
         return self._error
 
     @error.setter
+    @_post_pub
     def error(self, v):
-        if self.published:
-            if isinstance(v, int) and 0 <= v <= 100:
-                self._error = v
-            else:
-                raise TypeError("The error value must be an integer 0 - 100.")
+        if isinstance(v, int) and 0 <= v <= 100:
+            self._error = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("The error value must be an integer 0 - 100.")
 
     @property
     def accuracy(self):
@@ -2343,14 +2875,12 @@ class XdQuantifiedType(XdOrderedType):
         return self._accuracy
 
     @accuracy.setter
+    @_post_pub
     def accuracy(self, v):
-        if self.published:
-            if isinstance(v, int) and 0 <= v <= 100:
-                self._error = v
-            else:
-                raise TypeError("The accuracy value must be an integer 0 - 100.")
+        if isinstance(v, int) and 0 <= v <= 100:
+            self._error = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise TypeError("The accuracy value must be an integer 0 - 100.")
 
     def validate(self):
         """
@@ -2361,38 +2891,47 @@ class XdQuantifiedType(XdOrderedType):
         else:
             return(True)
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 2
-        padding = ('').rjust(indent)
+        pad8 = _INDENTS[indent + 8]
 
-        xdstr = super().getModel()
+        super()._model_parts(parts)
         # XdQuantified
-        xdstr += padding.rjust(indent + 8) + ("<xs:element maxOccurs='1' minOccurs='0' name='magnitude-status' type='s3m:MagnitudeStatus'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['error'][0])}' name='error'  type='xs:int' default='0'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['accuracy'][0])}' name='accuracy' type='xs:int' default='0'/>\n")
-
-        return(xdstr)
+        parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='0' name='magnitude-status' type='s3m:MagnitudeStatus'/>\n")
+        parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{self._card_str['error']}' name='error'  type='xs:int' default='0'/>\n")
+        parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{self._card_str['accuracy']}' name='accuracy' type='xs:int' default='0'/>\n")
 
-    def getXMLInstance(self, example=False):
+    def _instance_parts(self, parts, example):
         """
-        Return an example XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
 
         indent = 4
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
+        pad = _INDENTS[indent]
+        super()._instance_parts(parts, example)
+        if self.cardinality['magnitude_status'][0] > 0:
+            parts.append(f'{pad}<magnitude-status>=</magnitude-status>\n')
+        if self.error is not None:
+            parts.append(f'{pad}<error>{self.error}</error>\n')
+        if self.accuracy is not None:
+            parts.append(f'{pad}<accuracy>{self.accuracy}</accuracy>\n')
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
         if self.cardinality['magnitude_status'][0] > 0:
-            xmlstr += padding.rjust(indent) + '<magnitude-status>=</magnitude-status>\n'
+            d['magnitude-status'] = '='
         if self.error is not None:
-            xmlstr += padding.rjust(indent) + f'<error>{str(self.error).strip()}</error>\n'
+            d['error'] = _text(self.error)
         if self.accuracy is not None:
-            xmlstr += padding.rjust(indent) + f'<accuracy>{str(self.accuracy).strip()}</accuracy>\n'
+            d['accuracy'] = _text(self.accuracy)
 
-        return(xmlstr)
+        return(d)
 
 
 class XdCountType(XdQuantifiedType):
@@ -2408,6 +2947,8 @@ class XdCountType(XdQuantifiedType):
     standardized units as opposed to physical things counted.
     """
 
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdQuantifiedType._DEFAULT_CARDINALITY, 'value': _CARD_0_1, 'units': _CARD_1_1})
+
     def __init__(self, label: str):
         """
         The semantic label (name of the model) is required.
@@ -2417,15 +2958,15 @@ class XdCountType(XdQuantifiedType):
 
         self._value = None
         self._units = None
-        self.cardinality = ('value', [0, 1])
-        self.cardinality = ('units', [1, 1])
         self._min_inclusive = None
         self._max_inclusive = None
         self._min_exclusive = None
         self._max_exclusive = None
         self._total_digits = None
 
-        self._mag_constrained = not all([self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive, self._total_digits])
+        self._mag_constrained = False
+        self._digits_limit = None
+        self._bounds = None
 
     @property
     def value(self):
@@ -2435,25 +2976,26 @@ class XdCountType(XdQuantifiedType):
         return self._value
 
     @value.setter
+    @_post_pub
     def value(self, v):
-        if self.published:
-            if isinstance(v, (int, type(None))):
-                if self.min_inclusive is not None and v < self.min_inclusive:
-                    raise ValueError("The value cannot be less than " + str(self.min_inclusive))
-                if self.max_inclusive is not None and v > self.max_inclusive:
-                    raise ValueError("The value cannot exceed " + str(self.max_inclusive))
-                if self.min_exclusive is not None and v <= self.min_exclusive:
-                    raise ValueError("The value cannot be equal to or less than " + str(self.min_exclusive))
-                if self.max_exclusive is not None and v >= self.max_exclusive:
-                    raise ValueError("The value cannot be equal to or exceed " + str(self.max_exclusive))
-                if self.total_digits is not None and len(str(v)) > self.total_digits:
-                    raise ValueError("The value length cannot exceed " + str(self.total_digits) + " total digits.")
-
-                self._value = v
-            else:
-                raise TypeError("The value value must be an integer.")
-        else:
-            raise PublicationError("The model has not been published.")
+        if v is None:
+            self._value = v
+        elif isinstance(v, int):
+            min_inc, max_inc, min_exc, max_exc, digits_limit = self._bounds
+            if min_inc is not None and v < min_inc:
+                raise ValueError("The value cannot be less than " + str(min_inc))
+            if max_inc is not None and v > max_inc:
+                raise ValueError("The value cannot exceed " + str(max_inc))
+            if min_exc is not None and v <= min_exc:
+                raise ValueError("The value cannot be equal to or less than " + str(min_exc))
+            if max_exc is not None and v >= max_exc:
+                raise ValueError("The value cannot be equal to or exceed " + str(max_exc))
+            if digits_limit is not None and abs(v) >= digits_limit:
+                raise ValueError("The value length cannot exceed " + str(self._total_digits) + " total digits.")
+
+            self._value = v
+        else:
+            raise TypeError("The value value must be an integer.")
 
     @property
     def units(self):
@@ -2464,15 +3006,13 @@ class XdCountType(XdQuantifiedType):
         return self._units
 
     @units.setter
+    @_pre_pub
     def units(self, v):
-        if not self.published:
-            if isinstance(v, XdStringType):
-                self._units = v
-            else:
-                self._units = None
-                raise TypeError("The units value must be a XdStringType identifying the things to be counted.")
+        if isinstance(v, XdStringType):
+            self._units = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            self._units = None
+            raise TypeError("The units value must be a XdStringType identifying the things to be counted.")
 
     @property
     def min_inclusive(self):
@@ -2482,14 +3022,12 @@ class XdCountType(XdQuantifiedType):
         return self._min_inclusive
 
     @min_inclusive.setter
+    @_pre_pub
     def min_inclusive(self, v):
-        if not self.published:
-            if isinstance(v, (int, type(None))):
-                self._min_inclusive = v
-            else:
-                raise TypeError("The min_inclusive value must be an integer.")
+        if v is None or isinstance(v, int):
+            self._min_inclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("The min_inclusive value must be an integer.")
 
     @property
     def max_inclusive(self):
@@ -2499,14 +3037,12 @@ class XdCountType(XdQuantifiedType):
         return self._max_inclusive
 
     @max_inclusive.setter
+    @_pre_pub
     def max_inclusive(self, v):
-        if not self.published:
-            if isinstance(v, (int, type(None))):
-                self._max_inclusive = v
-            else:
-                raise TypeError("The max_inclusive value must be an integer.")
+        if v is None or isinstance(v, int):
+            self._max_inclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("The max_inclusive value must be an integer.")
 
     @property
     def min_exclusive(self):
@@ -2516,14 +3052,12 @@ class XdCountType(XdQuantifiedType):
         return self._min_exclusive
 
     @min_exclusive.setter
+    @_pre_pub
     def min_exclusive(self, v):
-        if not self.published:
-            if isinstance(v, (int, type(None))):
-                self._min_exclusive = v
-            else:
-                raise TypeError("The min_exclusive value must be an integer.")
+        if v is None or isinstance(v, int):
+            self._min_exclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("The min_exclusive value must be an integer.")
 
     @property
     def max_exclusive(self):
@@ -2533,14 +3067,12 @@ class XdCountType(XdQuantifiedType):
         return self._max_exclusive
 
     @max_exclusive.setter
+    @_pre_pub
     def max_exclusive(self, v):
-        if not self.published:
-            if isinstance(v, (int, type(None))):
-                self._max_exclusive = v
-            else:
-                raise TypeError("The max_exclusive value must be an integer.")
+        if v is None or isinstance(v, int):
+            self._max_exclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise TypeError("The max_exclusive value must be an integer.")
 
     @property
     def total_digits(self):
@@ -2550,14 +3082,23 @@ class XdCountType(XdQuantifiedType):
         return self._total_digits
 
     @total_digits.setter
+    @_pre_pub
     def total_digits(self, v):
-        if not self.published:
-            if isinstance(v, (int, type(None))):
-                self._total_digits = v
-            else:
-                raise TypeError("The total_digits value must be an integer.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        if v is None or isinstance(v, int):
+            self._total_digits = v
+        else:
+            raise TypeError("The total_digits value must be an integer.")
+
+    def _freeze(self):
+        super()._freeze()
+        # restrict the value only when at least one facet has been set
+        facets = (self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive,
+                  self._total_digits)
+        self._mag_constrained = any(f is not None for f in facets)
+        # smallest magnitude with more than total_digits digits
+        self._digits_limit = None if self._total_digits is None else 10 ** self._total_digits
+        self._bounds = (self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive,
+                        self._digits_limit)
 
     def validate(self):
         """
@@ -2571,94 +3112,80 @@ class XdCountType(XdQuantifiedType):
 
             return(True)
 
-    def getModel(self):
+    def _nested_models(self):
+        return((self._units,))
+
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 2
-        padding = ('').rjust(indent)
+        pad8 = _INDENTS[indent + 8]
+        pad12 = _INDENTS[indent + 12]
 
-        xdstr = super().getModel()
+        super()._model_parts(parts)
+        value_card = self._card_str['value']
         # XdCount
         if not self._mag_constrained:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}'  name='xdcount-value' type='xs:int'/>\n")
-        else:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}'  name='xdcount-value'>\n")
-            xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 10) + ("<xs:restriction base='xs:int'>\n")
-            if self.min_inclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:minInclusive value='{str(self.min_inclusive).strip()}'/>\n")
-            if self.max_inclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:maxInclusive value='{str(self.max_inclusive).strip()}'/>\n")
-            if self.min_exclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:minExclusive value='{str(self.min_exclusive).strip()}'/>\n")
-            if self.max_exclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:maxExclusive value='{str(self.max_exclusive).strip()}'/>\n")
-            if (self.total_digits is not None and self.total_digits > 0):
-                xdstr += padding.rjust(indent + 12) + (f"<xs:totalDigits value='{str(self.total_digits).strip()}'/>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:restriction>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='xdcount-units' type='s3m:mc-{str(self.units.mcuid)}'/> \n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        xdstr += self.units.getModel()
-
-        return(xdstr)
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{value_card}'  name='xdcount-value' type='xs:int'/>\n")
+        else:
+            min_inc, max_inc, min_exc, max_exc = self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive
+            total_digits = self._total_digits
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{value_card}'  name='xdcount-value'>\n")
+            parts.append(_FACETS_OPEN['int'])
+            if min_inc is not None:
+                parts.append(f"{pad12}<xs:minInclusive value='{min_inc}'/>\n")
+            if max_inc is not None:
+                parts.append(f"{pad12}<xs:maxInclusive value='{max_inc}'/>\n")
+            if min_exc is not None:
+                parts.append(f"{pad12}<xs:minExclusive value='{min_exc}'/>\n")
+            if max_exc is not None:
+                parts.append(f"{pad12}<xs:maxExclusive value='{max_exc}'/>\n")
+            if (total_digits is not None and total_digits > 0):
+                parts.append(f"{pad12}<xs:totalDigits value='{total_digits}'/>\n")
+            parts.append(_FACETS_CLOSE)
 
-    def getXMLInstance(self, example=False):
+        units = self._units
+        parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='1' name='xdcount-units' type='s3m:mc-{units.mcuid}'/> \n")
+        parts.append(_ORDERED_MODEL_CLOSE)
+
+    def _fill_example(self):
         """
-        Return an example XML fragment for this model.
+        Set a random value within the facets, and example units if none are set.
         """
-        if example == True and not isinstance(self.value, int):
-            if not self.published:
-                raise PublicationError("Cannot create an example unless the model is published.")
-            if self.min_exclusive is not None:
-                min = self.min_exclusive + 1
-            elif self.min_inclusive is not None:
-                min = self.min_inclusive
-            else:
-                min = 1
-
-            if self.max_exclusive is not None:
-                max = self.max_exclusive - 1
-            elif self.max_inclusive is not None:
-                max = self.max_inclusive
-            else:
-                max = 1000000000
-
-            self.value = randint(min, max)
-
-            if self.total_digits is not None:
-                lenval = len(str(self.value))
-                if lenval > self.total_digits:
-                    self.value = int(str(self.value))[self.total_digits:]
-            if self.units.value is None:
-                if self.units.default is not None:
-                    self.units.value = self.units.default
-                elif len(self.units.enums) > 0:
-                    self.units.value = choice(self.units.enums)
-                else:
-                    self.units.value = "Example Units"
+        if not self._published:
+            raise PublicationError("Cannot create an example unless the model is published.")
+        self.value = _count_example(self._min_inclusive, self._max_inclusive, self._min_exclusive,
+                                    self._max_exclusive, self._total_digits)
+        _example_units(self._units)
 
+    def _instance_parts(self, parts, example):
+        """
+        Append the XML instance fragments to parts.
+        """
+        if example and not isinstance(self._value, int):
+            self._fill_example()
 
         indent = 4
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-        xmlstr += padding.rjust(indent) + f'<xdcount-value>{str(self.value).strip()}</xdcount-value>\n'
-        xmlstr += padding.rjust(indent) + '<xdcount-units>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<label>{self.units.label}</label>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<xdstring-value>{self.units.value}</xdstring-value>\n'
-        xmlstr += padding.rjust(indent) + '</xdcount-units>\n'
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
+        pad = _INDENTS[indent]
+        units = self._units
+        super()._instance_parts(parts, example)
+        parts.append(f'{pad}<xdcount-value>{self._value}</xdcount-value>\n')
+        _emit_units(parts, pad, 'xdcount-units', units)
+        parts.append(pad + self._close_tag)
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            parts.append(pad + self._adapter_close_tag)
 
-        return(xmlstr)
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        d['xdcount-value'] = _text(self.value)
+        units = self._units
+        d['xdcount-units'] = OrderedDict([('label', _text(units.label)), ('xdstring-value', _text(units.value))])
+
+        return(d)
 
 
 class XdQuantityType(XdQuantifiedType):
@@ -2666,6 +3193,8 @@ class XdQuantityType(XdQuantifiedType):
     Quantified type representing specific quantities, i.e. quantities expressed as a magnitude and units. Can also be used for time durations, where it is more convenient to treat these as simply a number of individual seconds, minutes, hours, days, months, years, etc. when no temporal calculation is to be performed.
     """
 
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdQuantifiedType._DEFAULT_CARDINALITY, 'value': _CARD_0_1, 'units': _CARD_1_1})
+
     def __init__(self, label):
         """
         The semantic label (name of the model) is required.
@@ -2675,15 +3204,14 @@ class XdQuantityType(XdQuantifiedType):
 
         self._value = None
         self._units = None
-        self.cardinality = ('value', [0, 1])
-        self.cardinality = ('units', [1, 1])
         self._min_inclusive = None
         self._max_inclusive = None
         self._min_exclusive = None
         self._max_exclusive = None
         self._total_digits = None
         self._fraction_digits = None
-        self._mag_constrained = not all([self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive, self._total_digits, self._fraction_digits])
+        self._mag_constrained = False
+        self._bounds = None
 
     @property
     def value(self):
@@ -2693,28 +3221,33 @@ class XdQuantityType(XdQuantifiedType):
         return self._value
 
     @value.setter
+    @_post_pub
     def value(self, v):
-        if self.published:
-            if v is not None and isinstance(v, (int, float)):
-                v = Decimal(str(v))
-            if isinstance(v, (Decimal, type(None))):
-                if self.min_inclusive is not None and v < self.min_inclusive:
-                    raise ValueError("The value cannot be less than " + str(self.min_inclusive))
-                if self.max_inclusive is not None and v > self.max_inclusive:
-                    raise ValueError("The value cannot exceed " + str(self.max_inclusive))
-                if self.min_exclusive is not None and v <= self.min_exclusive:
-                    raise ValueError("The value cannot be equal to or less than " + str(self.min_exclusive))
-                if self.max_exclusive is not None and v >= self.max_exclusive:
-                    raise ValueError("The value cannot be equal to or exceed " + str(self.max_exclusive))
-                if self.total_digits is not None and len(str(v)) > self.total_digits:
-                    raise ValueError("The value length cannot exceed " + str(self.total_digits) + " total digits. Value = " + str(self.value))
-                if self.fraction_digits is not None and len(str(v).split('.')[1]) > self.fraction_digits:
-                    raise ValueError("The length of the decimal places in the value cannot exceed " + str(self.fraction_digits) + " fraction digits. Value = " + str(self.value))
-                self._value = v
-            else:
-                raise ValueError("The value must be a decimal.")
-        else:
-            raise PublicationError("The model has not been published.")
+        if isinstance(v, int) and not isinstance(v, bool):
+            v = Decimal(v)
+        elif isinstance(v, float):
+            v = Decimal(repr(v))
+        if v is None:
+            self._value = v
+        elif isinstance(v, Decimal):
+            min_inc, max_inc, min_exc, max_exc, total_digits, fraction_digits = self._bounds
+            if min_inc is not None and v < min_inc:
+                raise ValueError("The value cannot be less than " + str(min_inc))
+            if max_inc is not None and v > max_inc:
+                raise ValueError("The value cannot exceed " + str(max_inc))
+            if min_exc is not None and v <= min_exc:
+                raise ValueError("The value cannot be equal to or less than " + str(min_exc))
+            if max_exc is not None and v >= max_exc:
+                raise ValueError("The value cannot be equal to or exceed " + str(max_exc))
+            if total_digits is not None or fraction_digits is not None:
+                _, digits, exponent = v.as_tuple()
+                if total_digits is not None and len(digits) > total_digits:
+                    raise ValueError("The value length cannot exceed " + str(total_digits) + " total digits. Value = " + str(v))
+                if fraction_digits is not None and isinstance(exponent, int) and -exponent > fraction_digits:
+                    raise ValueError("The length of the decimal places in the value cannot exceed " + str(fraction_digits) + " fraction digits. Value = " + str(v))
+            self._value = v
+        else:
+            raise ValueError("The value must be a decimal.")
 
     @property
     def units(self):
@@ -2725,14 +3258,12 @@ class XdQuantityType(XdQuantifiedType):
         return self._units
 
     @units.setter
+    @_pre_pub
     def units(self, v):
-        if not self.published:
-            if isinstance(v, XdStringType):
-                self._units = v
-            else:
-                raise ValueError("The units value must be a XdStringType identifying the things to be measured.")
+        if isinstance(v, XdStringType):
+            self._units = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The units value must be a XdStringType identifying the things to be measured.")
 
     @property
     def min_inclusive(self):
@@ -2742,16 +3273,14 @@ class XdQuantityType(XdQuantifiedType):
         return self._min_inclusive
 
     @min_inclusive.setter
+    @_pre_pub
     def min_inclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._min_inclusive = v
-            else:
-                raise ValueError("The min_inclusive value must be a Decimal.")
+        if v is not None and isinstance(v, int):
+            v = Decimal(v)
+        if v is None or isinstance(v, Decimal):
+            self._min_inclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The min_inclusive value must be a Decimal.")
 
     @property
     def max_inclusive(self):
@@ -2761,16 +3290,14 @@ class XdQuantityType(XdQuantifiedType):
         return self._max_inclusive
 
     @max_inclusive.setter
+    @_pre_pub
     def max_inclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._max_inclusive = v
-            else:
-                raise ValueError("The max_inclusive value must be a Decimal.")
+        if v is not None and isinstance(v, int):
+            v = Decimal(v)
+        if v is None or isinstance(v, Decimal):
+            self._max_inclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The max_inclusive value must be a Decimal.")
 
     @property
     def min_exclusive(self):
@@ -2780,16 +3307,14 @@ class XdQuantityType(XdQuantifiedType):
         return self._min_exclusive
 
     @min_exclusive.setter
+    @_pre_pub
     def min_exclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._min_exclusive = v
-            else:
-                raise ValueError("The min_exclusive value must be a Decimal.")
+        if v is not None and isinstance(v, int):
+            v = Decimal(v)
+        if v is None or isinstance(v, Decimal):
+            self._min_exclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The min_exclusive value must be a Decimal.")
 
     @property
     def max_exclusive(self):
@@ -2799,16 +3324,14 @@ class XdQuantityType(XdQuantifiedType):
         return self._max_exclusive
 
     @max_exclusive.setter
+    @_pre_pub
     def max_exclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._max_exclusive = v
-            else:
-                raise ValueError("The max_exclusive value must be a Decimal.")
+        if v is not None and isinstance(v, int):
+            v = Decimal(v)
+        if v is None or isinstance(v, Decimal):
+            self._max_exclusive = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The max_exclusive value must be a Decimal.")
 
     @property
     def total_digits(self):
@@ -2818,14 +3341,12 @@ class XdQuantityType(XdQuantifiedType):
         return self._total_digits
 
     @total_digits.setter
+    @_pre_pub
     def total_digits(self, v):
-        if not self.published:
-            if isinstance(v, (int, type(None))):
-                self._total_digits = v
-            else:
-                raise ValueError("The total_digits value must be a integer.")
+        if v is None or isinstance(v, int):
+            self._total_digits = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The total_digits value must be a integer.")
 
     @property
     def fraction_digits(self):
@@ -2835,14 +3356,20 @@ class XdQuantityType(XdQuantifiedType):
         return self._fraction_digits
 
     @fraction_digits.setter
+    @_pre_pub
     def fraction_digits(self, v):
-        if not self.published:
-            if isinstance(v, (int, type(None))):
-                self._fraction_digits = v
-            else:
-                raise ValueError("The fraction_digits value must be a integer.")
+        if v is None or isinstance(v, int):
+            self._fraction_digits = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The fraction_digits value must be a integer.")
+
+    def _freeze(self):
+        super()._freeze()
+        # restrict the value only when at least one facet has been set
+        facets = (self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive,
+                  self._total_digits, self._fraction_digits)
+        self._mag_constrained = any(f is not None for f in facets)
+        self._bounds = facets
 
     def validate(self):
         """
@@ -2855,98 +3382,82 @@ class XdQuantityType(XdQuantifiedType):
                 raise ValueError("Missing XdStringType for units.")
             return(True)
 
-    def getModel(self):
+    def _nested_models(self):
+        return((*self._referenceranges, self._units))
+
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 2
-        padding = ('').rjust(indent)
+        pad8 = _INDENTS[indent + 8]
+        pad12 = _INDENTS[indent + 12]
 
-        xdstr = super().getModel()
+        super()._model_parts(parts)
+        value_card = self._card_str['value']
         # XdQuantity
         if not self._mag_constrained:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}'  name='xdquantity-value' type='xs:decimal'/>\n")
-        else:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}'  name='xdquantity-value'>\n")
-            xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 10) + ("<xs:restriction base='xs:decimal'>\n")
-            if self.min_inclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:minInclusive value='{str(self.min_inclusive).strip()}'/>\n")
-            if self.max_inclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:maxInclusive value='{str(self.max_inclusive).strip()}'/>\n")
-            if self.min_exclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:minExclusive value='{str(self.min_exclusive).strip()}'/>\n")
-            if self.max_exclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:maxExclusive value='{str(self.max_exclusive).strip()}'/>\n")
-            if (self.total_digits is not None and self.total_digits > 0):
-                xdstr += padding.rjust(indent + 12) + (f"<xs:totalDigits value='{str(self.total_digits).strip()}'/>\n")
-            if (self.fraction_digits is not None and self.fraction_digits >= 0):
-                xdstr += padding.rjust(indent + 12) + (f"<xs:fractionDigits value='{str(self.fraction_digits).strip()}'/>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:restriction>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='1' name='xdquantity-units' type='s3m:mc-{str(self.units.mcuid)}'/> \n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-
-        if len(self.referenceranges) > 0:
-            for rr in self.referenceranges:
-                xdstr += rr.getModel()
-
-        xdstr += self.units.getModel()
-
-        return(xdstr)
-
-    def getXMLInstance(self, example=False):
-        """
-        Return an example XML fragment for this model.
-        """
-
-        if example == True and self.value == None:
-            if not self.published:
-                raise PublicationError("Cannot create an example unless the model is published.")
-            start = 1 if self.min_inclusive == None else self.min_inclusive
-            end = 100000 if self.max_inclusive == None else self.max_inclusive
-            val = str(uniform(float(start), float(end)))
-
-            if isinstance(self.fraction_digits, int):
-                ipart = val.split('.')[0]
-                fpart = val.split('.')[1][:self.fraction_digits]
-                val = ipart + '.' + fpart
-
-            if isinstance(self.total_digits, int):
-                if len(val) > self.total_digits:
-                    val = val[self.total_digits:]
-
-            self.value = Decimal(val)
-
-            if self.units.value is None:
-                if self.units.default is not None:
-                    self.units.value = self.units.default
-                elif len(self.units.enums) > 0:
-                    self.units.value = choice(self.units.enums)
-                else:
-                    self.units.value = "Example Units"
-
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{value_card}'  name='xdquantity-value' type='xs:decimal'/>\n")
+        else:
+            min_inc, max_inc, min_exc, max_exc = self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive
+            total_digits, fraction_digits = self._total_digits, self._fraction_digits
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{value_card}'  name='xdquantity-value'>\n")
+            parts.append(_FACETS_OPEN['decimal'])
+            if min_inc is not None:
+                parts.append(f"{pad12}<xs:minInclusive value='{min_inc}'/>\n")
+            if max_inc is not None:
+                parts.append(f"{pad12}<xs:maxInclusive value='{max_inc}'/>\n")
+            if min_exc is not None:
+                parts.append(f"{pad12}<xs:minExclusive value='{min_exc}'/>\n")
+            if max_exc is not None:
+                parts.append(f"{pad12}<xs:maxExclusive value='{max_exc}'/>\n")
+            if (total_digits is not None and total_digits > 0):
+                parts.append(f"{pad12}<xs:totalDigits value='{total_digits}'/>\n")
+            if (fraction_digits is not None and fraction_digits >= 0):
+                parts.append(f"{pad12}<xs:fractionDigits value='{fraction_digits}'/>\n")
+            parts.append(_FACETS_CLOSE)
+
+        units = self._units
+        parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='1' name='xdquantity-units' type='s3m:mc-{units.mcuid}'/> \n")
+        parts.append(_ORDERED_MODEL_CLOSE)
+
+    def _fill_example(self):
+        """
+        Set a random value within the facets, and example units if none are set.
+        """
+        if not self._published:
+            raise PublicationError("Cannot create an example unless the model is published.")
+        self.value = _quantity_example(self._min_inclusive, self._max_inclusive,
+                                       self._fraction_digits, self._total_digits)
+        _example_units(self._units)
+
+    def _instance_parts(self, parts, example):
+        """
+        Append the XML instance fragments to parts.
+        """
+        if example and self._value is None:
+            self._fill_example()
 
         indent = 4
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-        xmlstr += padding.rjust(indent) + f'<xdquantity-value>{str(self.value).strip()}</xdquantity-value>\n'
-        xmlstr += padding.rjust(indent) + '<xdquantity-units>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<label>{self.units.label}</label>\n'
-        xmlstr += padding.rjust(indent + 2) + f'<xdstring-value>{self.units.value}</xdstring-value>\n'
-        xmlstr += padding.rjust(indent) + '</xdquantity-units>\n'
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
+        pad = _INDENTS[indent]
+        units = self._units
+        super()._instance_parts(parts, example)
+        parts.append(f'{pad}<xdquantity-value>{self._value}</xdquantity-value>\n')
+        _emit_units(parts, pad, 'xdquantity-units', units)
+        parts.append(pad + self._close_tag)
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            parts.append(pad + self._adapter_close_tag)
 
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        d['xdquantity-value'] = _text(self.value)
+        units = self._units
+        d['xdquantity-units'] = OrderedDict([('label', _text(units.label)), ('xdstring-value', _text(units.value))])
 
-        return(xmlstr)
+        return(d)
 
 
 class XdFloatType(XdQuantifiedType):
@@ -2962,6 +3473,11 @@ class XdFloatType(XdQuantifiedType):
     - "not a number" (NaN) case-sensitive
     """
 
+    __slots__ = ('_value', '_units', '_min_inclusive', '_max_inclusive', '_min_exclusive', '_max_exclusive',
+                 '_mag_constrained')
+
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdQuantifiedType._DEFAULT_CARDINALITY, 'value': _CARD_0_1, 'units': _CARD_0_1})
+
     # TODO: Fully test the Python 3.x implementation vs. the XML Schema implementation
 
     def __init__(self, label):
@@ -2973,13 +3489,11 @@ class XdFloatType(XdQuantifiedType):
 
         self._value = None
         self._units = None
-        self.cardinality = ('value', [0, 1])
-        self.cardinality = ('units', [0, 1])
         self._min_inclusive = None
         self._max_inclusive = None
         self._min_exclusive = None
         self._max_exclusive = None
-        self._mag_constrained = not all([self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive])
+        self._mag_constrained = False
 
     @property
     def value(self):
@@ -2990,14 +3504,12 @@ class XdFloatType(XdQuantifiedType):
 
 # TODO: fix the decimal places to follow the fractions digits
     @value.setter
+    @_post_pub
     def value(self, v):
-        if self.published:
-            if isinstance(v, float):
-                self._value = v
-            else:
-                raise ValueError("The value must be a float.")
+        if isinstance(v, float):
+            self._value = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The value must be a float.")
 
     @property
     def units(self):
@@ -3007,14 +3519,12 @@ class XdFloatType(XdQuantifiedType):
         return self._units
 
     @units.setter
+    @_pre_pub
     def units(self, v):
-        if not self.published:
-            if isinstance(v, XdStringType):
-                self._units = v
-            else:
-                raise ValueError("The units value must be a XdStringType identifying the things to be measured.")
+        if isinstance(v, XdStringType):
+            self._units = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The units value must be a XdStringType identifying the things to be measured.")
 
     @property
     def min_inclusive(self):
@@ -3024,15 +3534,9 @@ class XdFloatType(XdQuantifiedType):
         return self._min_inclusive
 
     @min_inclusive.setter
+    @_pre_pub
     def min_inclusive(self, v):
-        if not self.published:
-            v = float(v)
-            if isinstance(v, float):
-                self._min_inclusive = v
-            else:
-                raise ValueError("The min_inclusive value must be a float.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._min_inclusive = float(v)
 
     @property
     def max_inclusive(self):
@@ -3042,15 +3546,9 @@ class XdFloatType(XdQuantifiedType):
         return self._max_inclusive
 
     @max_inclusive.setter
+    @_pre_pub
     def max_inclusive(self, v):
-        if not self.published:
-            v = float(v)
-            if isinstance(v, float):
-                self._max_inclusive = v
-            else:
-                raise ValueError("The max_inclusive value must be a float.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._max_inclusive = float(v)
 
     @property
     def min_exclusive(self):
@@ -3060,15 +3558,9 @@ class XdFloatType(XdQuantifiedType):
         return self._min_exclusive
 
     @min_exclusive.setter
+    @_pre_pub
     def min_exclusive(self, v):
-        if not self.published:
-            v = float(v)
-            if isinstance(v, float):
-                self._min_exclusive = v
-            else:
-                raise ValueError("The min_exclusive value must be a float.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._min_exclusive = float(v)
 
     @property
     def max_exclusive(self):
@@ -3078,17 +3570,17 @@ class XdFloatType(XdQuantifiedType):
         return self._max_exclusive
 
     @max_exclusive.setter
+    @_pre_pub
     def max_exclusive(self, v):
-        if not self.published:
-            v = float(v)
-            if isinstance(v, float):
-                self._max_exclusive = v
-            else:
-                raise ValueError("The max_exclusive value must be a float.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._max_exclusive = float(v)
 
 
+    def _freeze(self):
+        super()._freeze()
+        # restrict the value only when at least one facet has been set
+        facets = (self._min_inclusive, self._max_inclusive, self._min_exclusive, self._max_exclusive)
+        self._mag_constrained = any(f is not None for f in facets)
+
     def validate(self):
         """
         Every XdType must implement this method.
@@ -3100,85 +3592,72 @@ class XdFloatType(XdQuantifiedType):
                 raise TypeError("Incorrect units definition.")
             return(True)
 
-    def getModel(self):
+    def _nested_models(self):
+        return((self._units,) if self._units else ())
+
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 2
-        padding = ('').rjust(indent)
+        pad8 = _INDENTS[indent + 8]
 
-        xdstr = super().getModel()
+        super()._model_parts(parts)
+        card = self._card_str
         # XdFloat
         if not self._mag_constrained:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}'  name='xdfloat-value' type='xs:float'/>\n")
-        else:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['value'][0])}'  name='xdfloat-value'>\n")
-            xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 10) + ("<xs:restriction base='xs:float'>\n")
-            if self.min_inclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:minInclusive value='{str(self.min_inclusive).strip()}'/>\n")
-            if self.max_inclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:maxInclusive value='{str(self.max_inclusive).strip()}'/>\n")
-            if self.min_exclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:minExclusive value='{str(self.min_exclusive).strip()}'/>\n")
-            if self.max_exclusive is not None:
-                xdstr += padding.rjust(indent + 12) + (f"<xs:maxExclusive value='{str(self.max_exclusive).strip()}'/>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:restriction>\n")
-            xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-            xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-
-        if self.units:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['units'][0])}' name='xdfloat-units' type='s3m:mc-{str(self.units.mcuid)}'/> \n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-        if self.units:
-            xdstr += self.units.getModel()
-
-        return(xdstr)
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['value']}'  name='xdfloat-value' type='xs:float'/>\n")
+        else:
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['value']}'  name='xdfloat-value'>\n"
+                         f"{_FACETS_OPEN['float']}"
+                         f"{_facet('minInclusive', self._min_inclusive)}{_facet('maxInclusive', self._max_inclusive)}"
+                         f"{_facet('minExclusive', self._min_exclusive)}{_facet('maxExclusive', self._max_exclusive)}"
+                         f"{_FACETS_CLOSE}")
 
-    def getXMLInstance(self, example=False):
+        units = self._units
+        if units:
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['units']}' name='xdfloat-units' type='s3m:mc-{units.mcuid}'/> \n")
+        parts.append(_ORDERED_MODEL_CLOSE)
+
+    def _instance_parts(self, parts, example):
         """
-        Return an example XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
+        value, units = self._value, self._units
         # TODO: Improve sample generation using other facets
-        if example == True and self.value == None:
-            if not self.published:
+        if example and value is None:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
-            start = 1 if self.min_inclusive == None else self.min_inclusive
-            end = 1000 if self.max_inclusive == None else self.max_inclusive
-            val = uniform(float(start), float(end))
-            self.value = val
-
-            if self.units.value is None:
-                if self.units.default is not None:
-                    self.units.value = self.units.default
-                elif len(self.units.enums) > 0:
-                    self.units.value = choice(self.units.enums)
-                else:
-                    self.units.value = "Example Units"
-
+            value = _float_example(self._min_inclusive, self._max_inclusive, 1000)
+            self.value = value
+            _example_units(units)
 
-        if self.value == None:
-            self.value = float("NaN")
+        if value is None:
+            value = float("NaN")
+            self.value = value
 
         indent = 4
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-        xmlstr += padding.rjust(indent) + f'<xdfloat-value>{str(self.value).strip()}</xdfloat-value>\n'
-        if self.units:
-            xmlstr += padding.rjust(indent) + '<xdfloat-units>\n'
-            xmlstr += padding.rjust(indent + 2) + f'<label>{self.units.label}</label>\n'
-            xmlstr += padding.rjust(indent + 2) + f'<xdstring-value>{self.units.value}</xdstring-value>\n'
-            xmlstr += padding.rjust(indent) + '</xdfloat-units>\n'
-        xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.mcuid}>\n'
+        pad = _INDENTS[indent]
+        super()._instance_parts(parts, example)
+        parts.append(f'{pad}<xdfloat-value>{value}</xdfloat-value>\n')
+        if units:
+            _emit_units(parts, pad, 'xdfloat-units', units)
+        parts.append(pad + self._close_tag)
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            parts.append(pad + self._adapter_close_tag)
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        d['xdfloat-value'] = _text(float("NaN") if self.value is None else self.value)
+        units = self._units
+        if units:
+            d['xdfloat-units'] = OrderedDict([('label', _text(units.label)), ('xdstring-value', _text(units.value))])
 
+        return(d)
 
-        return(xmlstr)
 
 class XdRatioType(XdQuantifiedType):
     """
@@ -3187,6 +3666,14 @@ class XdRatioType(XdQuantifiedType):
     Should not be used for formulations. Used for modeling; ratios, rates or proportions.
     """
 
+    __slots__ = ('_ratio_type', '_numerator', '_num_min_inclusive', '_num_max_inclusive', '_num_min_exclusive',
+                 '_num_max_exclusive', '_denominator', '_den_min_inclusive', '_den_max_inclusive', '_den_min_exclusive',
+                 '_den_max_exclusive', '_ratio_value', '_numerator_units', '_denominator_units', '_ratio_units')
+
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdQuantifiedType._DEFAULT_CARDINALITY, 'numerator': _CARD_0_1,
+                                             'denominator': _CARD_0_1, 'value': _CARD_0_1, 'numerator_units': _CARD_0_1,
+                                             'denominator_units': _CARD_0_1, 'ratio_units': _CARD_0_1})
+
     def __init__(self, label):
         """
         The semantic label (name of the model) is required.
@@ -3214,12 +3701,6 @@ class XdRatioType(XdQuantifiedType):
         self._denominator_units = None
         self._ratio_units = None
 
-        self.cardinality = ('numerator', [0, 1])
-        self.cardinality = ('denominator', [0, 1])
-        self.cardinality = ('value', [0, 1])
-        self.cardinality = ('numerator_units', [0, 1])
-        self.cardinality = ('denominator_units', [0, 1])
-        self.cardinality = ('ratio_units', [0, 1])
 
     @property
     def ratio_type(self):
@@ -3229,14 +3710,12 @@ class XdRatioType(XdQuantifiedType):
         return self._ratio_type
 
     @ratio_type.setter
+    @_pre_pub
     def ratio_type(self, v):
-        if not self.published:
-            if isinstance(v, str) and v.lower() in ['ratio', 'rate', 'proportion']:
-                self._ratio_type = v.lower()
-            else:
-                raise ValueError("The ratio_type value must be a str and be one of; 'ratio','rate', or 'proportion'.")
+        if isinstance(v, str) and v.lower() in ['ratio', 'rate', 'proportion']:
+            self._ratio_type = v.lower()
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The ratio_type value must be a str and be one of; 'ratio','rate', or 'proportion'.")
 
     @property
     def ratio(self):
@@ -3246,14 +3725,12 @@ class XdRatioType(XdQuantifiedType):
         return self._ratio_value
 
     @ratio.setter
+    @_post_pub
     def ratio(self, v):
-        if self.published:
-            if isinstance(v, float):
-                self._ratio_value = v
-            else:
-                raise ValueError("The ratio value must be a float.")
+        if isinstance(v, float):
+            self._ratio_value = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The ratio value must be a float.")
 
     @property
     def numerator(self):
@@ -3263,14 +3740,12 @@ class XdRatioType(XdQuantifiedType):
         return self._numerator
 
     @numerator.setter
+    @_post_pub
     def numerator(self, v):
-        if self.published:
-            if isinstance(v, float):
-                self._numerator = v
-            else:
-                raise ValueError("The numerator value must be a float.")
+        if isinstance(v, float):
+            self._numerator = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The numerator value must be a float.")
 
     @property
     def num_min_inclusive(self):
@@ -3280,16 +3755,9 @@ class XdRatioType(XdQuantifiedType):
         return self._num_min_inclusive
 
     @num_min_inclusive.setter
+    @_pre_pub
     def num_min_inclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._num_min_inclusive = v
-            else:
-                raise ValueError("The min_inclusive value must be a Decimal.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._num_min_inclusive = _decimal_bound(v, 'min_inclusive')
 
     @property
     def num_max_inclusive(self):
@@ -3299,16 +3767,9 @@ class XdRatioType(XdQuantifiedType):
         return self._num_max_inclusive
 
     @num_max_inclusive.setter
+    @_pre_pub
     def num_max_inclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._num_max_inclusive = v
-            else:
-                raise ValueError("The max_inclusive value must be a Decimal.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._num_max_inclusive = _decimal_bound(v, 'max_inclusive')
 
     @property
     def num_min_exclusive(self):
@@ -3318,16 +3779,9 @@ class XdRatioType(XdQuantifiedType):
         return self._num_min_exclusive
 
     @num_min_exclusive.setter
+    @_pre_pub
     def num_min_exclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._num_min_exclusive = v
-            else:
-                raise ValueError("The min_exclusive value must be a Decimal.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._num_min_exclusive = _decimal_bound(v, 'min_exclusive')
 
     @property
     def num_max_exclusive(self):
@@ -3337,16 +3791,9 @@ class XdRatioType(XdQuantifiedType):
         return self._num_max_exclusive
 
     @num_max_exclusive.setter
+    @_pre_pub
     def num_max_exclusive(self, v):
-        if not self.published:
-            if v is not None and isinstance(v, int):
-                v = Decimal(v)
-            if isinstance(v, (Decimal, type(None))):
-                self._num_max_exclusive = v
-            else:
-                raise ValueError("The max_exclusive value must be a Decimal.")
-        else:
-            raise PublicationError("The model has been published and cannot be edited.")
+        self._num_max_exclusive = _decimal_bound(v, 'max_exclusive')
 
     @property
     def denominator(self):
@@ -3356,14 +3803,12 @@ class XdRatioType(XdQuantifiedType):
         return self._denominator
 
     @denominator.setter
+    @_post_pub
     def denominator(self, v):
-        if self.published:
-            if isinstance(v, float):
-                self._denominator = v
-            else:
-                raise ValueError("The denominator value must be a float.")
+        if isinstance(v, float):
+            self._denominator = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The denominator value must be a float.")
 
     @property
     def den_min_inclusive(self):
@@ -3373,13 +3818,9 @@ class XdRatioType(XdQuantifiedType):
         return self._den_min_inclusive
 
     @den_min_inclusive.setter
+    @_pre_pub
     def den_min_inclusive(self, v):
-        if v is not None and isinstance(v, int):
-            v = Decimal(v)
-        if isinstance(v, (Decimal, type(None))):
-            self._den_min_inclusive = v
-        else:
-            raise ValueError("The den_min_inclusive value must be a Decimal.")
+        self._den_min_inclusive = _decimal_bound(v, 'den_min_inclusive')
 
     @property
     def den_max_inclusive(self):
@@ -3389,13 +3830,9 @@ class XdRatioType(XdQuantifiedType):
         return self._den_max_inclusive
 
     @den_max_inclusive.setter
+    @_pre_pub
     def den_max_inclusive(self, v):
-        if v is not None and isinstance(v, int):
-            v = Decimal(v)
-        if isinstance(v, (Decimal, type(None))):
-            self._den_max_inclusive = v
-        else:
-            raise ValueError("The den_max_inclusive value must be a Decimal.")
+        self._den_max_inclusive = _decimal_bound(v, 'den_max_inclusive')
 
     @property
     def den_min_exclusive(self):
@@ -3405,13 +3842,9 @@ class XdRatioType(XdQuantifiedType):
         return self._den_min_exclusive
 
     @den_min_exclusive.setter
+    @_pre_pub
     def den_min_exclusive(self, v):
-        if v is not None and isinstance(v, int):
-            v = Decimal(v)
-        if isinstance(v, (Decimal, type(None))):
-            self._den_min_exclusive = v
-        else:
-            raise ValueError("The den_min_exclusive value must be a Decimal.")
+        self._den_min_exclusive = _decimal_bound(v, 'den_min_exclusive')
 
     @property
     def den_max_exclusive(self):
@@ -3421,13 +3854,9 @@ class XdRatioType(XdQuantifiedType):
         return self._den_max_exclusive
 
     @den_max_exclusive.setter
+    @_pre_pub
     def den_max_exclusive(self, v):
-        if v is not None and isinstance(v, int):
-            v = Decimal(v)
-        if isinstance(v, (Decimal, type(None))):
-            self._den_max_exclusive = v
-        else:
-            raise ValueError("The den_max_exclusive value must be a Decimal.")
+        self._den_max_exclusive = _decimal_bound(v, 'den_max_exclusive')
 
     @property
     def numerator_units(self):
@@ -3438,14 +3867,12 @@ class XdRatioType(XdQuantifiedType):
         return self._numerator_units
 
     @numerator_units.setter
+    @_pre_pub
     def numerator_units(self, v):
-        if not self.published:
-            if isinstance(v, XdStringType):
-                self._numerator_units = v
-            else:
-                raise ValueError("The numerator_units value must be a XdStringType.")
+        if isinstance(v, XdStringType):
+            self._numerator_units = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The numerator_units value must be a XdStringType.")
 
     @property
     def denominator_units(self):
@@ -3456,14 +3883,12 @@ class XdRatioType(XdQuantifiedType):
         return self._denominator_units
 
     @denominator_units.setter
+    @_pre_pub
     def denominator_units(self, v):
-        if not self.published:
-            if isinstance(v, XdStringType):
-                self._denominator_units = v
-            else:
-                raise ValueError("The denominator_units value must be a XdStringType.")
+        if isinstance(v, XdStringType):
+            self._denominator_units = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The denominator_units value must be a XdStringType.")
 
     @property
     def ratio_units(self):
@@ -3473,14 +3898,12 @@ class XdRatioType(XdQuantifiedType):
         return self._ratio_units
 
     @ratio_units.setter
+    @_pre_pub
     def ratio_units(self, v):
-        if not self.published:
-            if isinstance(v, XdStringType):
-                self._ratio_units = v
-            else:
-                raise ValueError("The ratio_units value must be a XdStringType.")
+        if isinstance(v, XdStringType):
+            self._ratio_units = v
         else:
-            raise PublicationError("The model has been published and cannot be edited.")
+            raise ValueError("The ratio_units value must be a XdStringType.")
 
     def validate(self):
         """
@@ -3488,135 +3911,99 @@ class XdRatioType(XdQuantifiedType):
         """
         if not super(XdRatioType, self).validate():
             return(False)
-        else:
-            return(True)
+        # tests for proper modelling
+        if ((self._num_min_inclusive is not None and self._num_min_exclusive is not None) or
+                (self._num_max_inclusive is not None and self._num_max_exclusive is not None)):
+            raise ValueError(self.__class__.__name__ + ' : ' + self.label + ": There is ambiguity in your numerator constraints for min/max. Please use EITHER minimum or maximum values, not both.")
+        if ((self._den_min_inclusive is not None and self._den_min_exclusive is not None) or
+                (self._den_max_inclusive is not None and self._den_max_exclusive is not None)):
+            raise ValueError(self.__class__.__name__ + ' : ' + self.label + ": There is ambiguity in your denominator constraints for min/max. Please use EITHER minimum or maximum values, not both.")
+        return(True)
 
-    def getModel(self):
+    def _nested_models(self):
+        num_units, den_units = self._numerator_units, self._denominator_units
+        # shared units are defined once; a second complexType of the same name is invalid
+        return(tuple(u for u in (num_units, den_units if den_units is not num_units else None) if u))
+
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
         indent = 2
-        padding = ('').rjust(indent)
+        pad8 = _INDENTS[indent + 8]
 
-        xdstr = super().getModel()
+        super()._model_parts(parts)
+        card = self._card_str
         # XdRatio
+        parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='1' name='ratio-type' type='s3m:TypeOfRatio'/>\n")
+        num_facets = (f"{_facet('minInclusive', self._num_min_inclusive)}{_facet('minExclusive', self._num_min_exclusive)}"
+                      f"{_facet('maxInclusive', self._num_max_inclusive)}{_facet('maxExclusive', self._num_max_exclusive)}")
+        den_facets = (f"{_facet('minInclusive', self._den_min_inclusive)}{_facet('minExclusive', self._den_min_exclusive)}"
+                      f"{_facet('maxInclusive', self._den_max_inclusive)}{_facet('maxExclusive', self._den_max_exclusive)}")
+        # restrict a term only when at least one of its facets has been set
+        for name, facets in (('numerator', num_facets), ('denominator', den_facets)):
+            if facets:
+                parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{card[name]}' name='{name}'>\n"
+                             f"{_FACETS_OPEN['float']}{facets}{_FACETS_CLOSE}")
+            else:
+                parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{card[name]}' name='{name}' type='xs:float'/>\n")
 
-        # tests for proper modelling
-        if (self.num_min_inclusive and self.num_min_exclusive) or (self.num_max_inclusive and self.num_max_exclusive):
-            raise ValueError(self.__str__() + ": There is ambiguity in your numerator constraints for min/max. Please use EITHER minimum or maximum values, not both.")
-
-        if (self.den_min_inclusive and self.den_min_exclusive) or (self.den_max_inclusive and self.den_max_exclusive):
-            raise ValueError(self.__str__() + ": There is ambiguity in your denominator constraints for min/max. Please use EITHER minimum or maximum values, not both.")
-
-
-        xdstr += padding.rjust(indent + 8) + ("<xs:element maxOccurs='1' minOccurs='1' name='ratio-type' type='s3m:TypeOfRatio'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['numerator'][0])}' name='numerator'>\n")
-        xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 10) + ("<xs:restriction base='xs:float'>\n")
-        if self.num_min_inclusive:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:minInclusive value='{str(self.num_min_inclusive).strip()}'/>\n")
-        if self.num_min_exclusive:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:minExclusive value='{str(self.num_min_exclusive).strip()}'/>\n")
-        if self.num_max_inclusive:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:maxInclusive value='{str(self.num_max_inclusive).strip()}'/>\n")
-        if self.num_max_exclusive:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:maxExclusive value='{str(self.num_max_exclusive).strip()}'/>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['denominator'][0])}' name='denominator'>\n")
-        xdstr += padding.rjust(indent + 10) + ("<xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 10) + ("<xs:restriction base='xs:float'>\n")
-        if self.den_min_inclusive is not None:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:minInclusive value='{str(self.den_min_inclusive).strip()}'/>\n")
-        if self.den_min_exclusive is not None:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:minExclusive value='{str(self.den_min_exclusive).strip()}'/>\n")
-        if self.den_max_inclusive is not None:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:maxInclusive value='{str(self.den_max_inclusive).strip()}'/>\n")
-        if self.den_max_exclusive is not None:
-            xdstr += padding.rjust(indent + 12) + (f"<xs:maxExclusive value='{str(self.den_max_exclusive).strip()}'/>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 10) + ("</xs:simpleType>\n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:element>\n")
-
-        if self.numerator_units:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['numerator_units'][0])}' name='numerator-units' type='s3m:mc-{self.numerator_units.mcuid}'/> \n")
-
-        if self.denominator_units:
-            xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='1' minOccurs='{str(self.cardinality['denominator_units'][0])}' name='denominator-units' type='s3m:mc-{self.denominator_units.mcuid}'/>\n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-
-        if self.numerator_units:
-            xdstr += self.numerator_units.getModel()
-        if self.denominator_units:
-            xdstr += self.denominator_units.getModel()
-
-        return(xdstr)
+        num_units, den_units = self._numerator_units, self._denominator_units
+        if num_units:
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['numerator_units']}' name='numerator-units' type='s3m:mc-{num_units.mcuid}'/> \n")
 
-    def getXMLInstance(self, example=False):
+        if den_units:
+            parts.append(f"{pad8}<xs:element maxOccurs='1' minOccurs='{card['denominator_units']}' name='denominator-units' type='s3m:mc-{den_units.mcuid}'/>\n")
+        parts.append(_ORDERED_MODEL_CLOSE)
+
+    def _instance_parts(self, parts, example):
         """
-        Return an XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
-        if example == True:
-            if not self.published:
+        if example:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
-            start = 1 if self.num_min_inclusive == None else self.num_min_inclusive
-            end = 100000 if self.num_max_inclusive == None else self.num_max_inclusive
-            self.numerator = uniform(float(start), float(end))
-            start = 1 if self.den_min_inclusive == None else self.den_min_inclusive
-            end = 100000 if self.den_max_inclusive == None else self.den_max_inclusive
-            self.denominator = uniform(float(start), float(end))
-            self.ratio = float(self.numerator / self.denominator)
-
-            if self.numerator_units.value is None:
-                if self.numerator_units.default is not None:
-                    self.numerator_units.value = self.numerator_units.default
-                elif len(self.numerator_units.enums) > 0:
-                    self.numerator_units.value = choice(self.numerator_units.enums)[0]
-                else:
-                    self.numerator_units.value = "Numerator Units"
-            if self.denominator_units.value is None:
-                if self.denominator_units.default is not None:
-                    self.denominator_units.value = self.denominator_units.default
-                elif len(self.denominator_units.enums) > 0:
-                    self.denominator_units.value = choice(self.denominator_units.enums)[0]
-                else:
-                    self.denominator_units.value = "Denominator Units"
+            numerator = _float_example(self._num_min_inclusive, self._num_max_inclusive, 100000)
+            denominator = _float_example(self._den_min_inclusive, self._den_max_inclusive, 100000)
+            self.numerator = numerator
+            self.denominator = denominator
+            self.ratio = numerator / denominator
+            _example_units(self._numerator_units, "Numerator Units")
+            _example_units(self._denominator_units, "Denominator Units")
 
         indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-
-        xmlstr += padding + f"<ratio-type>{self.ratio_type}</ratio-type>\n"
-        xmlstr += padding + f"<numerator>{str(self.numerator)}</numerator>\n"
-        xmlstr += padding + f"<denominator>{str(self.denominator)}</denominator>\n"
-        xmlstr += padding + f"<xdratio-value>{str(self.ratio)}</xdratio-value>\n"
-        if self.numerator_units is not None:
-            xmlstr += padding + "<numerator-units>\n"
-            xmlstr += padding + f"  <label>{escape(self.numerator_units.label)}</label>\n"
-            xmlstr += padding + f"  <xdstring-value>{self.numerator_units.value}</xdstring-value>\n"
-            xmlstr += padding + "</numerator-units>\n"
-        if self.denominator_units is not None:
-            xmlstr += padding + "<denominator-units>\n"
-            xmlstr += padding + f"  <label>{escape(self.denominator_units.label)}</label>\n"
-            xmlstr += padding + f"  <xdstring-value>{self.denominator_units.value}</xdstring-value>\n"
-            xmlstr += padding + "</denominator-units>\n"
-        if self.ratio_units is not None:
-            xmlstr += padding + "<xdratio-units>\n"
-            xmlstr += padding + f"  <label>{escape(self.ratio_units.label)}</label>\n"
-            xmlstr += padding + f"  <xdstring-value>{self.ratio_units.value}</xdstring-value>\n"
-            xmlstr += padding + "</xdratio-units>\n"
-
-        xmlstr += padding + f"</s3m:ms-{str(self.mcuid)}>\n"
+        pad = _INDENTS[indent]
+        super()._instance_parts(parts, example)
+
+        parts.append(f"{pad}<ratio-type>{self._ratio_type}</ratio-type>\n"
+                     f"{pad}<numerator>{self._numerator}</numerator>\n"
+                     f"{pad}<denominator>{self._denominator}</denominator>\n"
+                     f"{pad}<xdratio-value>{self._ratio_value}</xdratio-value>\n")
+        for units, tag in ((self._numerator_units, 'numerator-units'), (self._denominator_units, 'denominator-units'),
+                           (self._ratio_units, 'xdratio-units')):
+            if units is not None:
+                _emit_units(parts, pad, tag, units)
+
+        parts.append(pad + self._close_tag)
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            parts.append(pad + self._adapter_close_tag)
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        d['ratio-type'] = _text(self._ratio_type)
+        d['numerator'] = _text(self._numerator)
+        d['denominator'] = _text(self._denominator)
+        d['xdratio-value'] = _text(self._ratio_value)
+        for tag, units in (('numerator-units', self._numerator_units), ('denominator-units', self._denominator_units),
+                           ('xdratio-units', self._ratio_units)):
+            if units is not None:
+                d[tag] = OrderedDict([('label', _text(units.label)), ('xdstring-value', _text(units.value))])
+
+        return(d)
 
-        return(xmlstr)
 
 class XdTemporalType(XdOrderedType):
     """
@@ -3627,6 +4014,13 @@ class XdTemporalType(XdOrderedType):
     Setting cardinality of both max and min to zero causes the element to be prohibited.
     """
 
+    __slots__ = ('_date', '_time', '_datetime', '_day', '_month', '_year', '_year_month', '_month_day', '_duration',
+                 '_temporal_out')
+
+    _DEFAULT_CARDINALITY = MappingProxyType({**XdOrderedType._DEFAULT_CARDINALITY, 'date': _CARD_0_1, 'time': _CARD_0_1,
+                                             'datetime': _CARD_0_1, 'day': _CARD_0_1, 'month': _CARD_0_1, 'year': _CARD_0_1,
+                                             'year_month': _CARD_0_1, 'month_day': _CARD_0_1, 'duration': _CARD_0_1})
+
     def __init__(self, label):
         """
         The semantic label (name of the model) is required.
@@ -3643,15 +4037,7 @@ class XdTemporalType(XdOrderedType):
         self._year_month = None
         self._month_day = None
         self._duration = None
-        self.cardinality = ('date', [0, 1])
-        self.cardinality = ('time', [0, 1])
-        self.cardinality = ('datetime', [0, 1])
-        self.cardinality = ('day', [0, 1])
-        self.cardinality = ('month', [0, 1])
-        self.cardinality = ('year', [0, 1])
-        self.cardinality = ('year_month', [0, 1])
-        self.cardinality = ('month_day', [0, 1])
-        self.cardinality = ('duration', [0, 1])
+        self._temporal_out = None  # (attribute, element name, text function) for each allowed element, set on publication
 
         # self.allow_duration and (self.allow_date or self.allow_time or self.allow_datetime or self.allow_day or self.allow_month or self.allow_year or self.allow_year_month or self.allow_month_day):
 
@@ -3667,14 +4053,12 @@ class XdTemporalType(XdOrderedType):
         return self._date
 
     @date.setter
+    @_post_pub
     def date(self, v):
-        if self.published:
-            if isinstance(v, (date, type(None))):
-                self._date = v
-            else:
-                raise ValueError("The date value must be a date type.")
+        if v is None or isinstance(v, date):
+            self._date = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The date value must be a date type.")
 
     @property
     def time(self):
@@ -3685,14 +4069,12 @@ class XdTemporalType(XdOrderedType):
         return self._time
 
     @time.setter
+    @_post_pub
     def time(self, v):
-        if self.published:
-            if isinstance(v, (time, type(None))):
-                self._time = v
-            else:
-                raise ValueError("The time value must be a time type.")
+        if v is None or isinstance(v, time):
+            self._time = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The time value must be a time type.")
 
     @property
     def datetime(self):
@@ -3703,14 +4085,12 @@ class XdTemporalType(XdOrderedType):
         return self._datetime
 
     @datetime.setter
+    @_post_pub
     def datetime(self, v):
-        if self.published:
-            if isinstance(v, (datetime, type(None))):
-                self._datetime = v
-            else:
-                raise ValueError("The datetime value must be a datetime type.")
+        if v is None or isinstance(v, datetime):
+            self._datetime = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The datetime value must be a datetime type.")
 
     @property
     def day(self):
@@ -3723,14 +4103,9 @@ class XdTemporalType(XdOrderedType):
         return self._day
 
     @day.setter
+    @_post_pub
     def day(self, v):
-        if self.published:
-            if isinstance(v, type(None)) or isinstance(v, int) and 1 <= v <= 31:
-                self._day = v
-            else:
-                raise ValueError("The day value must be an integer type 1 - 31.")
-        else:
-            raise PublicationError("The model has not been published.")
+        self._day = _int_in_range(v, 1, 31, 'day')
 
     @property
     def month(self):
@@ -3742,14 +4117,9 @@ class XdTemporalType(XdOrderedType):
         return self._month
 
     @month.setter
+    @_post_pub
     def month(self, v):
-        if self.published:
-            if isinstance(v, type(None)) or isinstance(v, int) and 1 <= v <= 12:
-                self._month = v
-            else:
-                raise ValueError("The month value must be an integer type 1 - 12.")
-        else:
-            raise PublicationError("The model has not been published.")
+        self._month = _int_in_range(v, 1, 12, 'month')
 
     @property
     def year(self):
@@ -3759,14 +4129,9 @@ class XdTemporalType(XdOrderedType):
         return self._year
 
     @year.setter
+    @_post_pub
     def year(self, v):
-        if self.published:
-            if isinstance(v, type(None)) or isinstance(v, int) and 1 <= v <= 9999:
-                self._year = v
-            else:
-                raise ValueError("The year value must be an integer type 1 - 9999.")
-        else:
-            raise PublicationError("The model has not been published.")
+        self._year = _int_in_range(v, 1, 9999, 'year')
 
     @property
     def year_month(self):
@@ -3777,18 +4142,17 @@ class XdTemporalType(XdOrderedType):
         return self._year_month
 
     @year_month.setter
+    @_post_pub
     def year_month(self, v):
-        if self.published:
-            if isinstance(v, type(None)):
-                self._year_month = v
-            elif isinstance(v, tuple):
-                if not 1 <= v[0] <= 9999 or not 1 <= v[1] <= 12:
-                    raise ValueError("The year_month value must be a tuple of integers representing 1 <= yyyy <= 9999 and 1 <= dd <= 12.")
-                self._year_month = v
-            else:
-                raise ValueError("The year_month value must be a tuple of integers representing (yyyy,mm).")
+        if v is None:
+            self._year_month = v
+        elif isinstance(v, tuple) and len(v) == 2 and isinstance(v[0], int) and isinstance(v[1], int):
+            year, month = v
+            if not (1 <= year <= 9999 and 1 <= month <= 12):
+                raise ValueError("The year_month value must be a tuple of integers representing 1 <= yyyy <= 9999 and 1 <= dd <= 12.")
+            self._year_month = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The year_month value must be a tuple of integers representing (yyyy,mm).")
 
     @property
     def month_day(self):
@@ -3800,19 +4164,19 @@ class XdTemporalType(XdOrderedType):
         return self._month_day
 
     @month_day.setter
+    @_post_pub
     def month_day(self, v):
-        if self.published:
-            max_days = {1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
-            if isinstance(v, type(None)):
-                self._month_day = v
-            elif isinstance(v, tuple) and len(v) == 2 and isinstance(v[0], int) and isinstance(v[1], int):
-                if v[1] > max_days[v[0]]:
-                    raise ValueError("The day value must be must be less than or equal to the number of days allowed in the month.")
-                self._month_day = v
-            else:
-                raise ValueError("The month_day value must be a tuple of integers representing (mm,dd).")
+        if v is None:
+            self._month_day = v
+        elif isinstance(v, tuple) and len(v) == 2 and isinstance(v[0], int) and isinstance(v[1], int):
+            month, day = v
+            if not 1 <= month <= 12:
+                raise ValueError("The month value must be an integer type 1 - 12.")
+            if not 1 <= day <= _MAX_DAYS[month]:
+                raise ValueError("The day value must be must be less than or equal to the number of days allowed in the month.")
+            self._month_day = v
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The month_day value must be a tuple of integers representing (mm,dd).")
 
     @property
     def duration(self):
@@ -3832,19 +4196,28 @@ class XdTemporalType(XdOrderedType):
         return self._duration
 
     @duration.setter
+    @_post_pub
     def duration(self, v):
-        if self.published:
-            if isinstance(v, type(None)):
+        if v is None:
+            self._duration = v
+        elif isinstance(v, tuple) and len(v) == 6:
+            secs = v[5]
+            if all(isinstance(n, int) for n in v[:5]) and (isinstance(secs, (Decimal, int, float)) or checkers.is_decimal(secs)):
                 self._duration = v
-            elif isinstance(v, tuple) and len(v) == 6:
-                if all(isinstance(n, int) for n in v[0:4]) and checkers.is_decimal(v[5]):
-                    self._duration = v
-                else:
-                    raise ValueError("Some members of the duration tuple are not the correct type.")
             else:
-                raise ValueError("The duration value must be a 6 member tuple (yyyy,mm,dd,hh,MM,ss.ss) of integers except the seconds (last member) being a decimal.")
+                raise ValueError("Some members of the duration tuple are not the correct type.")
         else:
-            raise PublicationError("The model has not been published.")
+            raise ValueError("The duration value must be a 6 member tuple (yyyy,mm,dd,hh,MM,ss.ss) of integers except the seconds (last member) being a decimal.")
+
+    def _freeze(self):
+        """
+        Keep the elements the cardinality allows, so instances skip the rest
+        without looking them up.
+        """
+        super()._freeze()
+        card = self.cardinality
+        self._temporal_out = tuple((f"_{key}", name, _TEMPORAL_TEXT[key]) for key, name, _ in _TEMPORAL_FIELDS
+                                   if card[key][1] == 1)
 
     def validate(self):
         """
@@ -3855,81 +4228,60 @@ class XdTemporalType(XdOrderedType):
         else:
             return(True)
 
-    def getModel(self):
+    def _model_parts(self, parts):
         """
-        Return a XML Schema complexType definition.
+        Append the XML Schema complexType definition fragments to parts.
         """
-        self.validate()
-        indent = 2
-        padding = ('').rjust(indent)
-
-        xdstr = super().getModel()
+        card = self.cardinality
 
+        super()._model_parts(parts)
         # XdTemporal - every element must be included as either allowed or not allowed.
+        parts.append(_temporal_elements(tuple(tuple(card[key]) for key, _, _ in _TEMPORAL_FIELDS)))
+        parts.append(_ORDERED_MODEL_CLOSE)
 
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['date'][1])}' minOccurs='{str(self.cardinality['date'][0])}' name='xdtemporal-date' type='xs:date'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['time'][1])}' minOccurs='{str(self.cardinality['time'][0])}' name='xdtemporal-time' type='xs:time'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['datetime'][1])}' minOccurs='{str(self.cardinality['datetime'][0])}' name='xdtemporal-datetime' type='xs:dateTime'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['day'][1])}' minOccurs='{str(self.cardinality['day'][0])}' name='xdtemporal-day' type='xs:gDay'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['month'][1])}' minOccurs='{str(self.cardinality['month'][0])}' name='xdtemporal-month' type='xs:gMonth'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['year'][1])}' minOccurs='{str(self.cardinality['year'][0])}' name='xdtemporal-year' type='xs:gYear'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['year_month'][1])}' minOccurs='{str(self.cardinality['year_month'][0])}' name='xdtemporal-year-month' type='xs:gYearMonth'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['month_day'][1])}' minOccurs='{str(self.cardinality['month_day'][0])}' name='xdtemporal-month-day' type='xs:gMonthDay'/>\n")
-        xdstr += padding.rjust(indent + 8) + (f"<xs:element maxOccurs='{str(self.cardinality['duration'][1])}' minOccurs='{str(self.cardinality['duration'][0])}' name='xdtemporal-duration' type='xs:duration'/>\n")
-        xdstr += padding.rjust(indent + 8) + ("</xs:sequence>\n")
-        xdstr += padding.rjust(indent + 6) + ("</xs:restriction>\n")
-        xdstr += padding.rjust(indent + 4) + ("</xs:complexContent>\n")
-        xdstr += padding.rjust(indent + 2) + ("</xs:complexType>\n\n")
-
-        return(xdstr)
-
-    def getXMLInstance(self, example=False):
+    def _instance_parts(self, parts, example):
         """
-        Return an XML fragment for this model.
+        Append the XML instance fragments to parts.
         """
         if example:
-            if not self.published:
+            if not self._published:
                 raise PublicationError("Cannot create an example unless the model is published.")
             dt = datetime.now()
-            self.date = date.today()
-            self.time = datetime.time(dt)
+            self.date = dt.date()
+            self.time = dt.time()
             self.datetime = dt
-            self.day = self.date.day
-            self.month = self.date.month
-            self.year = self.date.year
-            self.year_month = (self.date.year,self.date.month)
-            self.month_day = (self.date.month,self.date.day)
-            # Build a duration
-            start = datetime.strptime('1/1/1970', '%m/%d/%Y')
-            end = datetime.strptime('12/31/2030', '%m/%d/%Y')
-            rdt = start + timedelta(seconds=randint(0, int((end - start).total_seconds())))
-            rdt2 = start + timedelta(seconds=randint(0, int((end - start).total_seconds())))
-            dur = abs((rdt - rdt2).days)
+            self.day = dt.day
+            self.month = dt.month
+            self.year = dt.year
+            self.year_month = (dt.year, dt.month)
+            self.month_day = (dt.month, dt.day)
+            # Build a duration, in days, between two random datetimes
+            if self.cardinality['duration'][1] == 1 and self._duration is None:
+                rdt = _EXAMPLE_DT_START + timedelta(seconds=randint(0, _EXAMPLE_DT_SECONDS))
+                rdt2 = _EXAMPLE_DT_START + timedelta(seconds=randint(0, _EXAMPLE_DT_SECONDS))
+                self.duration = (0, 0, abs((rdt - rdt2).days), 0, 0, Decimal(0))
 
         indent = 2
-        padding = ('').rjust(indent)
-        xmlstr = super().getXMLInstance(example)
-
-        if self.cardinality['date'][1] == 1 and self.date is not None:
-            xmlstr += padding + f"  <xdtemporal-date>{datetime.strftime(self.date, '%Y-%m-%d')}</xdtemporal-date>\n"
-        if self.cardinality['time'][1] == 1 and self.time is not None:
-            xmlstr += padding + f"  <xdtemporal-time>{datetime.strftime(self.time, '%H:%M:%S')}</xdtemporal-time>\n"
-        if self.cardinality['datetime'][1] == 1 and self.datetime is not None:
-            xmlstr += padding + f"  <xdtemporal-datetime>{datetime.strftime(self.datetime, '%Y-%m-%dT%H:%M:%S')}</xdtemporal-datetime>\n"
-        if self.cardinality['day'][1] == 1 and self.day is not None:
-            xmlstr += padding + f"  <xdtemporal-day>---{str(self.day)}</xdtemporal-day>\n"
-        if self.cardinality['month'][1] == 1 and self.month is not None:
-            xmlstr += padding + f"  <xdtemporal-month>--{str(self.month)}</xdtemporal-month>\n"
-        if self.cardinality['year'][1] == 1 and self.year is not None:
-            xmlstr += padding + f"  <xdtemporal-year>{str(self.year)}</xdtemporal-year>\n"
-        if self.cardinality['year_month'][1] == 1 and self.year_month is not None:
-            xmlstr += padding + f"  <xdtemporal-year-month>{str(self.year_month[0])}-{str(self.year_month[1])}</xdtemporal-year-month>\n"
-        if self.cardinality['month_day'][1] == 1 and self.month_day is not None:
-            xmlstr += padding + f"  <xdtemporal-month-day>--{str(self.month_day[0])}-{str(self.month_day[1])}</xdtemporal-month-day>\n"
-        if self.cardinality['duration'][1] == 1 and self.duration is not None:
-            xmlstr += padding + f"  <xdtemporal-duration>P{''.join(map(str, self.duration))}D</xdtemporal-duration>\n"
-        xmlstr += padding + f"</s3m:ms-{str(self.mcuid)}>\n"
+        pad4 = _INDENTS[indent + 2]
+        super()._instance_parts(parts, example)
+
+        for attr, name, text in self._temporal_out:
+            v = getattr(self, attr)
+            if v is not None:
+                parts.append(f"{pad4}<{name}>{text(v)}</{name}>\n")
+        parts.append(_INDENTS[indent] + self._close_tag)
         if self.adapter:
-            xmlstr += padding.rjust(indent) + f'</s3m:ms-{self.acuid}>\n'
+            parts.append(_INDENTS[indent] + self._adapter_close_tag)
+
+    def _asdict(self):
+        """
+        Return the instance data as an OrderedDict.
+        """
+        d = super()._asdict()
+        for attr, name, text in self._temporal_out:
+            v = getattr(self, attr)
+            if v is not None:
+                d[name] = text(v)
+
+        return(d)
 
-        return(xmlstr)